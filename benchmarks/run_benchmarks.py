@@ -0,0 +1,382 @@
+"""
+Benchmark the payload checks end to end, offline.
+
+Replays a recorded Aave payload from the test resources through SourceCode parsing,
+DiffCheck, PriceFeedCheck and the full perform_checks pipeline, at growing payload counts.
+The source of truth is the cloned Aave modules of the test resources, and the price feed and
+token providers are served from their recorded responses through their disk caches, so no
+API key, network access or repository clone is needed.
+
+Stages:
+    parse: Parsing with an empty AST cache for every payload (cold).
+    parse_cached: Parsing with the ASTs of the payload already cached (warm).
+    diff: DiffCheck against the cloned modules.
+    price_feed: PriceFeedCheck of every payload file.
+    perform_checks: The full pipeline. Most payload files are found in the cloned modules,
+        so the checks after DiffCheck only see the missing ones.
+    perform_checks_unmatched: The full pipeline for a customer without a source of truth,
+        so every payload file goes through every check.
+
+Each stage and scale runs in a fresh process, so that its peak RSS is measured on its own.
+The results (throughput, p50/p95 latency per payload, peak RSS and the number of files that
+went through each check) are written as a JSON artifact, meant to be compared across versions.
+Without an installed solc the parsing stages are skipped, and the perform_checks stages are
+marked as degraded, since GlobalVariableCheck and NewListingCheck then have no AST to check.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scales 1 10 100] [--stages ...] [--output FILE]
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+import solcx
+
+import quorum
+import quorum.checks as Checks
+import quorum.utils.pretty_printer as pp
+from quorum.apis.block_explorers.ast_cache import ASTCache
+from quorum.apis.block_explorers.source_code import SourceCode, parse_source_codes
+from quorum.apis.multisig.safe_api import SafeAPI
+from quorum.apis.price_feeds import ChainLinkAPI, CoinGeckoAPI
+from quorum.checks.proposal_check import perform_checks
+from quorum.entry_points.implementations.serve import QuorumServer
+from quorum.utils.chain_enum import Chain
+from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.solidity_lexer import iter_address_literals
+
+ROOT_DIR = Path(__file__).parents[1]
+TESTS_DIR = ROOT_DIR / "src" / "quorum" / "tests"
+PAYLOAD_DIR = (
+    TESTS_DIR
+    / "resources"
+    / "source_codes"
+    / "ETH"
+    / "0xAD6c03BF78A3Ee799b86De5aCE32Bb116eD24637"
+)
+MODULES_DIR = TESTS_DIR / "resources" / "clones" / "Aave" / "modules"
+RECORDED_RESPONSES_DIR = TESTS_DIR / "expected" / "test_price_feed_providers"
+
+CUSTOMER = "aave"
+# Has no cloned modules, so every payload file is missing from its source of truth
+UNMATCHED_CUSTOMER = "aave_unmatched"
+CHAIN = Chain.ETH
+STAGES = (
+    "parse",
+    "parse_cached",
+    "diff",
+    "price_feed",
+    "perform_checks",
+    "perform_checks_unmatched",
+)
+PARSE_STAGES = ("parse", "parse_cached")
+PIPELINE_STAGES = ("perform_checks", "perform_checks_unmatched")
+DEFAULT_SCALES = (1, 10, 100)
+
+CUSTOMER_CONFIG = {
+    "dev_repos": [],
+    "price_feed_providers": ["chainlink"],
+    "token_validation_providers": ["coingecko"],
+}
+GROUND_TRUTH = {CUSTOMER: CUSTOMER_CONFIG, UNMATCHED_CUSTOMER: CUSTOMER_CONFIG}
+
+
+def load_payload() -> list[SourceCode]:
+    return [
+        SourceCode(str(path.relative_to(PAYLOAD_DIR)), path.read_text().splitlines())
+        for path in sorted(PAYLOAD_DIR.rglob("*.sol"))
+    ]
+
+
+def prepare_workspace(workspace: Path) -> None:
+    """
+    Lay out a Quorum main path serving the recorded payload dependencies from disk.
+
+    The recorded provider responses are copied into the provider caches, and every other
+    address of the payload is remembered as unknown to the providers and to the Safe API.
+    """
+    (workspace / "ground_truth.json").write_text(json.dumps(GROUND_TRUTH))
+    shutil.copytree(MODULES_DIR, workspace / CUSTOMER / "modules")
+    (workspace / UNMATCHED_CUSTOMER).mkdir()
+
+    recorded: dict[str, set[str]] = {}
+    for provider_dir in RECORDED_RESPONSES_DIR.iterdir():
+        cache_dir = workspace / "cache" / provider_dir.name / CHAIN.value
+        cache_dir.mkdir(parents=True)
+        # The providers cache addresses in lower case
+        for response in (provider_dir / "ETH").glob("*.json"):
+            shutil.copyfile(response, cache_dir / response.name.lower())
+        recorded[provider_dir.name] = {p.stem for p in cache_dir.glob("*.json")}
+
+    addresses = {
+        address
+        for source_code in load_payload()
+        for address, _ in iter_address_literals(source_code.file_content)
+    }
+    for address in addresses:
+        for name in (*recorded, "Safe"):
+            if address.lower() not in recorded.get(name, ()):
+                not_found = (
+                    workspace
+                    / "cache"
+                    / name
+                    / CHAIN.value
+                    / "not_found"
+                    / address.lower()
+                )
+                not_found.parent.mkdir(parents=True, exist_ok=True)
+                not_found.write_text("{}")
+
+
+def configure(workspace: Path) -> None:
+    """
+    Point the Quorum configuration and the caches of the current process to the workspace.
+    """
+    config = QuorumConfiguration()
+    config.main_path = workspace
+    config.offline = True
+    ChainLinkAPI().cache_dir = workspace / "cache" / "Chainlink"
+    CoinGeckoAPI().cache_dir = workspace / "cache" / "Coingecko"
+    SafeAPI().cache_dir = workspace / "cache" / "Safe"
+    reset_ast_cache(workspace)
+
+
+def reset_ast_cache(workspace: Path) -> None:
+    # An empty AST cache, so that a payload is not parsed from the ASTs of the previous one
+    ASTCache().cache_dir = Path(tempfile.mkdtemp(dir=workspace, prefix="ast_cache_"))
+
+
+def reset_memory_caches() -> None:
+    # Each payload starts from the state of a served job, and reads the recorded responses
+    # from disk rather than from the previous payload
+    QuorumServer.clear_caches()
+
+
+def make_stage(stage: str) -> Callable[[str, list[SourceCode]], object]:
+    if stage in PARSE_STAGES:
+        return lambda _, source_codes: parse_source_codes(source_codes)
+    if stage == "diff":
+        return lambda payload, source_codes: Checks.DiffCheck(
+            CUSTOMER, CHAIN, payload, source_codes
+        ).find_diffs()
+    if stage == "price_feed":
+        return lambda payload, source_codes: Checks.PriceFeedCheck(
+            CUSTOMER, CHAIN, payload, source_codes, [ChainLinkAPI()], [CoinGeckoAPI()]
+        ).verify_price_feed()
+    customer = UNMATCHED_CUSTOMER if stage == "perform_checks_unmatched" else CUSTOMER
+    return lambda payload, source_codes: perform_checks(
+        customer, CHAIN, payload, source_codes, [ChainLinkAPI()], [CoinGeckoAPI()]
+    )
+
+
+def count_files(stage: str, result: object, num_files: int) -> dict[str, int]:
+    """
+    Count the payload files that went through each check of a stage.
+
+    Returns:
+        dict[str, int]: The number of files checked, by check name.
+    """
+    if stage in PARSE_STAGES:
+        return {"parse_source_codes": num_files}
+    if stage == "diff":
+        return {"DiffCheck": result.total_files}
+    if stage == "price_feed":
+        return {"PriceFeedCheck": num_files}
+    # The checks after DiffCheck only see the files missing from the source of truth
+    num_missing = len(result.diff.missing_sources)
+    return {
+        "DiffCheck": result.diff.total_files,
+        "ReviewDiffCheck": num_missing,
+        "GlobalVariableCheck": num_missing,
+        "PriceFeedCheck": num_missing,
+        "NewListingCheck": num_missing,
+    }
+
+
+def count_addresses(stage: str, result: object) -> int | None:
+    if stage == "price_feed":
+        addresses = result
+    elif stage in PIPELINE_STAGES:
+        addresses = result.explicit_addresses
+    else:
+        return None
+    return sum(
+        len(group)
+        for group in (
+            addresses.price_feeds,
+            addresses.tokens,
+            addresses.multisigs,
+            addresses.unverified,
+        )
+    )
+
+
+def run_case(stage: str, scale: int, workspace: Path) -> dict:
+    """
+    Run a stage on `scale` copies of the payload, in a fresh process.
+
+    Returns:
+        dict: The measurements of the case.
+    """
+    os.environ["QUORUM_PATH"] = str(workspace)
+    run_stage = make_stage(stage)
+    payload = load_payload()
+
+    durations = []
+    # The reports of the checks are not part of the benchmark output
+    with pp.capture_output([]):
+        configure(workspace)
+        if stage == "parse_cached":
+            parse_source_codes(load_payload())
+        for i in range(scale):
+            source_codes = [
+                SourceCode(s.file_name, list(s.file_content)) for s in payload
+            ]
+            reset_memory_caches()
+            if stage != "parse_cached":
+                reset_ast_cache(workspace)
+            start = time.perf_counter()
+            result = run_stage(f"{stage}_{scale}_{i}", source_codes)
+            durations.append(time.perf_counter() - start)
+
+    # Kilobytes on Linux, bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / 1e6 if sys.platform == "darwin" else peak_rss / 1e3
+    total = sum(durations)
+    return {
+        "stage": stage,
+        "scale": scale,
+        "payloads": scale,
+        "files_per_payload": len(payload),
+        "files_checked": count_files(stage, result, len(payload)),
+        "addresses_classified": count_addresses(stage, result),
+        "total_seconds": round(total, 4),
+        "throughput_per_second": round(scale / total, 2) if total else None,
+        "p50_ms": round(statistics.median(durations) * 1000, 2),
+        "p95_ms": round(percentile(durations, 0.95) * 1000, 2),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    }
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    # Nearest rank, the samples of the lower scales are too small to interpolate
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_summary(results: list[dict]) -> None:
+    print(
+        f"{'Stage':<26} {'Payloads':>8} {'Total (s)':>10} {'Payloads/s':>11} "
+        f"{'p50 (ms)':>9} {'p95 (ms)':>9} {'Peak RSS (MB)':>14}"
+    )
+    for result in results:
+        if "skipped" in result:
+            print(
+                f"{result['stage']:<26} {result['scale']:>8} skipped: {result['skipped']}"
+            )
+            continue
+        print(
+            f"{result['stage']:<26} {result['payloads']:>8} {result['total_seconds']:>10.2f} "
+            f"{result['throughput_per_second']:>11.1f} {result['p50_ms']:>9.1f} "
+            f"{result['p95_ms']:>9.1f} {result['peak_rss_mb']:>14.1f}"
+            + (" (degraded)" if "degraded" in result else "")
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SCALES),
+        help="Numbers of payloads to check per stage.",
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=list(STAGES),
+        help="Stages to benchmark.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark_results.json"),
+        help="Path of the JSON artifact.",
+    )
+    args = parser.parse_args()
+
+    solc_versions = [
+        str(v) for v in solcx.get_installed_solc_versions(os.getenv("QUORUM_SOLC_PATH"))
+    ]
+    results = []
+    with tempfile.TemporaryDirectory(prefix="quorum_bench_") as tmp_dir:
+        workspace = Path(tmp_dir)
+        prepare_workspace(workspace)
+        for stage in args.stages:
+            for scale in args.scales:
+                if stage in PARSE_STAGES and not solc_versions:
+                    results.append(
+                        {"stage": stage, "scale": scale, "skipped": "no solc installed"}
+                    )
+                    continue
+                with ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    result = executor.submit(run_case, stage, scale, workspace).result()
+                if stage in PIPELINE_STAGES and not solc_versions:
+                    result["degraded"] = (
+                        "no solc installed, GlobalVariableCheck and NewListingCheck "
+                        "had no AST to check"
+                    )
+                results.append(result)
+
+    artifact = {
+        "quorum_version": quorum.__version__,
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "solc_versions": solc_versions,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "payload": f"{CHAIN.name}/{PAYLOAD_DIR.name}",
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(artifact, indent=4) + "\n")
+
+    print_summary(results)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
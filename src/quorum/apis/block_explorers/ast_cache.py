@@ -0,0 +1,169 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from packaging.version import Version
+
+import quorum.utils.pretty_printer as pp
+from quorum.utils.singleton import singleton
+from quorum.utils.tracing import Tracer
+
+AST_CACHE_DIR = Path(__file__).parent / "cache" / "ast"
+DEFAULT_MAX_SIZE_MB = 256
+
+
+@singleton
+class ASTCache:
+    """
+    ASTCache is a persistent, content-addressed cache of solc ASTs.
+
+    Entries are gzip compressed JSON files keyed by the sha256 of the source content and the
+    solc version that parsed it, so byte-identical imports shared by many payloads are parsed
+    only once. The cache is bounded by QUORUM_AST_CACHE_MAX_MB (0 disables it); the least
+    recently used entries are evicted first.
+    """
+
+    def __init__(self):
+        self.cache_dir = AST_CACHE_DIR
+        self.max_size_bytes = self.__read_max_size_mb() * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        # Total size of the entries on disk, computed on the first write
+        self.__size: int | None = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __read_max_size_mb() -> int:
+        value = os.getenv("QUORUM_AST_CACHE_MAX_MB")
+        if value is None:
+            return DEFAULT_MAX_SIZE_MB
+        try:
+            return int(value)
+        except ValueError:
+            pp.pprint(
+                f"Warning: QUORUM_AST_CACHE_MAX_MB={value!r} is not a whole number of "
+                f"megabytes, using the default of {DEFAULT_MAX_SIZE_MB} MB.",
+                pp.Colors.WARNING,
+            )
+            return DEFAULT_MAX_SIZE_MB
+
+    def __entry_path(self, content: str, version: Version) -> Path:
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        return self.cache_dir / f"{content_hash}-{version}.json.gz"
+
+    def get(self, content: str, version: Version) -> dict | None:
+        """
+        Get the cached AST of a source.
+
+        Args:
+            content (str): The source content.
+            version (Version): The solc version used to parse the source.
+
+        Returns:
+            dict | None: The AST, or None on a cache miss.
+        """
+        if self.max_size_bytes <= 0:
+            return None
+
+        path = self.__entry_path(content, version)
+        start = time.perf_counter()
+        try:
+            with gzip.open(path, "rt") as file:
+                entry = json.load(file)
+            # Refresh the entry's position in the LRU order
+            os.utime(path)
+        except (OSError, ValueError):
+            with self.__lock:
+                self.misses += 1
+            Tracer().count_cache("solc", hit=False)
+            return None
+
+        load_seconds = time.perf_counter() - start
+        with self.__lock:
+            self.hits += 1
+            self.saved_seconds += max(entry["parse_seconds"] - load_seconds, 0.0)
+        Tracer().count_cache("solc", hit=True)
+        return entry["ast"]
+
+    def put(
+        self, content: str, version: Version, ast: dict, parse_seconds: float
+    ) -> None:
+        """
+        Store the AST of a source, evicting the least recently used entries if the cache
+        grows beyond its size limit.
+
+        Args:
+            content (str): The source content.
+            version (Version): The solc version used to parse the source.
+            ast (dict): The AST to cache.
+            parse_seconds (float): How long parsing the source took, reported as time saved on hits.
+        """
+        if self.max_size_bytes <= 0:
+            return
+
+        path = self.__entry_path(content, version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt") as file:
+                json.dump({"ast": ast, "parse_seconds": parse_seconds}, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        with self.__lock:
+            if self.__size is None:
+                self.__evict()
+            else:
+                self.__size += path.stat().st_size
+                if self.__size > self.max_size_bytes:
+                    self.__evict()
+
+    def __evict(self) -> None:
+        """
+        Delete the least recently used entries until the cache fits its size limit.
+        """
+        entries = []
+        for path in self.cache_dir.glob("*.json.gz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+        self.__size = total_size
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hit and miss counters, e.g. between the jobs of a long-lived process.
+        """
+        with self.__lock:
+            self.hits = 0
+            self.misses = 0
+            self.saved_seconds = 0.0
+
+    def report(self) -> None:
+        """
+        Print the cache hit rate and the parsing time saved during this run.
+        """
+        lookups = self.hits + self.misses
+        if not lookups:
+            return
+        pp.pprint(
+            f"AST cache: {self.hits}/{lookups} hits ({self.hits / lookups:.0%}), "
+            f"saved ~{self.saved_seconds:.1f}s of parsing.",
+            pp.Colors.INFO,
+        )
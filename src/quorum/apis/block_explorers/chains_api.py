@@ -1,13 +1,21 @@
 import os
-import time
 from json.decoder import JSONDecodeError
 
 import json5 as json
-import requests
 
 from quorum.apis.block_explorers.bytecode import BytecodeAnalysisResult
-from quorum.apis.block_explorers.source_code import SourceCode
+from quorum.apis.block_explorers.source_cache import SourceCache
+from quorum.apis.block_explorers.source_code import SourceCode, parse_source_codes
 from quorum.utils.chain_enum import Chain
+from quorum.utils.concurrency import HostLimiter
+from quorum.utils.http_transport import HTTPTransport
+from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.rate_limiter import (
+    RateLimiter,
+    RateLimitExceeded,
+    is_rate_limit_response,
+)
+from quorum.utils.tracing import Tracer, traced
 
 
 class ChainAPI:
@@ -37,6 +45,8 @@ class ChainAPI:
     }
 
     BASE_URL = "https://api.etherscan.io/v2/api?chainid={chain_id}&apikey={api_key}"
+    MET_CHAIN_ID = 1088
+    MAX_RATE_LIMIT_RETRIES = 5
 
     def __init__(self, chain: Chain) -> None:
         """
@@ -52,24 +62,32 @@ class ChainAPI:
             raise ValueError(
                 f"Unsupported chain: {chain}. Available chains: {', '.join([c.name for c in self.CHAIN_ID_MAP.keys()])}"
             )
+        self.chain = chain
+        self.api_key = ""
         # MET is not supported via ETHScan API
         if chain == Chain.MET:
+            self.chain_id = self.MET_CHAIN_ID
             self.base_url = (
-                "https://api.routescan.io/v2/network/mainnet/evm/1088/etherscan/api"
+                "https://api.routescan.io/v2/network/mainnet/evm/"
+                f"{self.MET_CHAIN_ID}/etherscan/api"
             )
         else:
-            chain_id = self.CHAIN_ID_MAP[chain]
-            api_key = os.getenv("ETHSCAN_API_KEY")
-            if not api_key:
+            self.chain_id = self.CHAIN_ID_MAP[chain]
+            self.api_key = os.getenv("ETHSCAN_API_KEY")
+            if not self.api_key:
                 raise ValueError("ETHSCAN_API_KEY environment variable is not set.")
 
-            self.base_url = self.BASE_URL.format(chain_id=chain_id, api_key=api_key)
+            self.base_url = self.BASE_URL.format(
+                chain_id=self.chain_id, api_key=self.api_key
+            )
 
-        self.session = requests.Session()
+        self.transport = HTTPTransport()
 
     def get_source_code(self, proposal_address: str) -> list[SourceCode]:
         """
         Fetches the source code of a smart contract from the blockchain explorer API.
+        Verified source code never changes, so it is served from the source cache once fetched,
+        unless a refresh is requested.
 
         Args:
             proposal_address (str): The address of the smart contract to retrieve the source code.
@@ -77,13 +95,42 @@ class ChainAPI:
         Returns:
             list[SourceCode]: A list of SourceCode objects containing the file names and source code contents.
 
+        Raises:
+            ValueError: If the API request fails or the source code could not be retrieved.
+        """
+        with Tracer().span(
+            "explorer", "ChainAPI.get_source_code", chain=self.chain.name
+        ):
+            sources = None
+            if not QuorumConfiguration().refresh:
+                sources = SourceCache().get(self.chain_id, proposal_address)
+            Tracer().count_cache("explorer", hit=sources is not None)
+            if sources is None:
+                sources = self.__fetch_sources(proposal_address)
+                SourceCache().put(self.chain_id, proposal_address, sources)
+
+        source_codes = [
+            SourceCode(file_name=source_name, file_content=content.splitlines())
+            for source_name, content in sources.items()
+        ]
+        parse_source_codes(source_codes)
+        return source_codes
+
+    def __fetch_sources(self, proposal_address: str) -> dict[str, str]:
+        """
+        Fetches the verified sources of a smart contract from the blockchain explorer API.
+
+        Args:
+            proposal_address (str): The address of the smart contract.
+
+        Returns:
+            dict[str, str]: Maps the file names to their content.
+
         Raises:
             ValueError: If the API request fails or the source code could not be retrieved.
         """
         url = f"{self.base_url}&module=contract&action=getsourcecode&address={proposal_address}"
-        response = self.session.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = self.__get_json(url)
 
         if data["status"] != "1":
             raise ValueError(
@@ -98,14 +145,12 @@ class ChainAPI:
             json_data = json.loads(result.removeprefix("{").removesuffix("}"))
 
         sources = json_data.get("sources", {proposal_address: {"content": result}})
-        source_codes = [
-            SourceCode(
-                file_name=source_name, file_content=source_code["content"].splitlines()
-            )
+        return {
+            source_name: source_code["content"]
             for source_name, source_code in sources.items()
-        ]
-        return source_codes
+        }
 
+    @traced("explorer")
     def get_bytecodes_analysis(self, contract_address: str) -> BytecodeAnalysisResult:
         """
         Performs a complete analysis of a contract including runtime bytecode,
@@ -130,9 +175,6 @@ class ChainAPI:
         # Get runtime bytecode (this should always work for valid contracts)
         result.runtime_bytecode = self.__get_runtime_bytecode(contract_address)
 
-        # Add delay to avoid rate limit errors
-        time.sleep(0.25)  # 0.25s = 4 requests/sec, under the 5/sec limit
-
         try:
             # Get creation bytecode (may fail for some contracts)
             result.creation_bytecode = self.__get_creation_bytecode(contract_address)
@@ -147,6 +189,44 @@ class ChainAPI:
 
         return result
 
+    @traced("explorer")
+    def __get_json(self, url: str) -> dict:
+        """
+        Sends a GET request to the explorer API, respecting the shared per-host concurrency cap
+        and the rate limit shared by all requests using the same API key on the same host.
+        Rate limited requests slow the shared rate down and are retried.
+
+        Args:
+            url: The full request URL.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            requests.HTTPError: If the API responds with an HTTP error status.
+            RateLimitExceeded: If the API is still rate limiting after all retries.
+        """
+        bucket = RateLimiter().bucket(self.api_key, url)
+        for _ in range(self.MAX_RATE_LIMIT_RETRIES):
+            bucket.acquire()
+            with HostLimiter().limit(url):
+                response = self.transport.get(url)
+            if response.status_code == 429:
+                bucket.on_rate_limited()
+                continue
+            response.raise_for_status()
+            data = response.json()
+            if is_rate_limit_response(data):
+                bucket.on_rate_limited()
+                continue
+            bucket.on_success()
+            return data
+
+        raise RateLimitExceeded(
+            f"{self.chain.name} explorer is still rate limiting after "
+            f"{self.MAX_RATE_LIMIT_RETRIES} attempts."
+        )
+
     def __handle_api_error(self, data: dict, context: str) -> None:
         """
         Handles common API error responses.
@@ -177,9 +257,7 @@ class ChainAPI:
             ValueError: If the API request fails or the bytecode could not be retrieved.
         """
         url = f"{self.base_url}&module=proxy&action=eth_getCode&address={contract_address}&tag=latest"
-        response = self.session.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = self.__get_json(url)
 
         self.__handle_api_error(data, "fetching runtime bytecode")
 
@@ -206,9 +284,7 @@ class ChainAPI:
             ValueError: If the API request fails or the creation transaction could not be found.
         """
         url = f"{self.base_url}&module=contract&action=getcontractcreation&contractaddresses={contract_address}"
-        response = self.session.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = self.__get_json(url)
 
         self.__handle_api_error(data, "finding creation transaction")
 
@@ -0,0 +1,106 @@
+import re
+import threading
+from pathlib import Path
+
+import solcx
+from packaging.version import Version
+from solcx.install import get_executable, select_pragma_version
+
+from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.singleton import singleton
+
+PRAGMA_PATTERN = re.compile(r"pragma\s+solidity\s+([^;]+);")
+
+
+def select_version(pragmas: list[str], versions: list[Version]) -> Version | None:
+    """
+    Select the newest version satisfying all of the given pragmas.
+
+    Args:
+        pragmas (list[str]): Version constraints of `pragma solidity` statements (e.g. "^0.8.0").
+        versions (list[Version]): The candidate versions.
+
+    Returns:
+        Version | None: The newest matching version, or None if no version matches.
+    """
+    matching = [
+        v for v in versions if all(select_pragma_version(p, [v]) for p in pragmas)
+    ]
+    return max(matching, default=None)
+
+
+class SolcNotAvailableError(Exception):
+    """
+    Raised when no solc compiler satisfying a source's pragma can be provisioned.
+    """
+
+
+@singleton
+class SolcManager:
+    """
+    SolcManager resolves and provisions solc compilers on first use.
+
+    The compiler version is picked from the source's `pragma solidity` statements, preferring
+    compilers that are already installed in the local compiler cache directory. Missing
+    compilers are downloaded only when Quorum is not running in offline mode.
+    """
+
+    def __init__(self):
+        self.__installable_versions: list[Version] | None = None
+        self.__lock = threading.Lock()
+
+    @property
+    def install_dir(self) -> Path | None:
+        """
+        The directory holding the installed compilers, or None for solcx's default directory.
+        """
+        return QuorumConfiguration().solc_path
+
+    def resolve_version(self, source_code: str) -> Version:
+        """
+        Find the newest compiler satisfying all pragmas of the source, installing it if needed.
+
+        Args:
+            source_code (str): The Solidity source code.
+
+        Returns:
+            Version: The selected compiler version.
+
+        Raises:
+            SolcNotAvailableError: If no compatible compiler is installed and none can be downloaded.
+        """
+        pragmas = PRAGMA_PATTERN.findall(source_code)
+
+        installed_versions = solcx.get_installed_solc_versions(self.install_dir)
+        if version := select_version(pragmas, installed_versions):
+            return version
+
+        if QuorumConfiguration().offline:
+            raise SolcNotAvailableError(
+                f"No installed solc version satisfies {pragmas} and Quorum is running offline. "
+                f"Install a compatible compiler into {solcx.get_solcx_install_folder(self.install_dir)}."
+            )
+
+        with self.__lock:
+            if self.__installable_versions is None:
+                self.__installable_versions = solcx.get_installable_solc_versions()
+            version = select_version(pragmas, self.__installable_versions)
+            if not version:
+                raise SolcNotAvailableError(
+                    f"No solc version satisfies the pragmas {pragmas}."
+                )
+            if version not in solcx.get_installed_solc_versions(self.install_dir):
+                solcx.install_solc(version, solcx_binary_path=self.install_dir)
+        return version
+
+    def get_executable(self, version: Version) -> Path:
+        """
+        Get the path of an installed compiler.
+
+        Args:
+            version (Version): The compiler version.
+
+        Returns:
+            Path: The path of the solc binary.
+        """
+        return get_executable(version, solcx_binary_path=self.install_dir)
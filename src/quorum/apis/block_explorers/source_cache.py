@@ -0,0 +1,86 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from quorum.utils.json_cache import dump_json, load_json
+from quorum.utils.singleton import singleton
+
+SOURCE_CACHE_DIR = Path(__file__).parent / "cache"
+
+
+@singleton
+class SourceCache:
+    """
+    SourceCache is a persistent cache of the verified source code of deployed contracts.
+
+    Verified source code of an address never changes, so entries never expire. Each address
+    maps its file names to content hashes, and file contents are stored once as blobs named by
+    their hash, so library files shared by many payloads are kept a single time.
+    """
+
+    def __init__(self):
+        self.cache_dir = SOURCE_CACHE_DIR
+
+    def __index_path(self, chain_id: int, address: str) -> Path:
+        return self.cache_dir / "sources" / str(chain_id) / f"{address.lower()}.json"
+
+    def __blob_path(self, content_hash: str) -> Path:
+        return self.cache_dir / "blobs" / content_hash[:2] / content_hash
+
+    def get(self, chain_id: int, address: str) -> dict[str, str] | None:
+        """
+        Get the cached sources of a contract.
+
+        Args:
+            chain_id (int): The chain id of the contract.
+            address (str): The contract address.
+
+        Returns:
+            dict[str, str] | None: Maps file names to their content, or None if not cached.
+        """
+        index = load_json(self.__index_path(chain_id, address))
+        if index is None:
+            return None
+        try:
+            return {
+                file_name: self.__read_blob(content_hash)
+                for file_name, content_hash in index.items()
+            }
+        except OSError:
+            # A missing blob invalidates the whole entry
+            return None
+
+    def put(self, chain_id: int, address: str, sources: dict[str, str]) -> None:
+        """
+        Cache the sources of a contract.
+
+        Args:
+            chain_id (int): The chain id of the contract.
+            address (str): The contract address.
+            sources (dict[str, str]): Maps file names to their content.
+        """
+        index = {}
+        for file_name, content in sources.items():
+            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            self.__write_blob(content_hash, content)
+            index[file_name] = content_hash
+        dump_json(self.__index_path(chain_id, address), index)
+
+    def __read_blob(self, content_hash: str) -> str:
+        with open(self.__blob_path(content_hash), encoding="utf-8", newline="") as file:
+            return file.read()
+
+    def __write_blob(self, content_hash: str, content: str) -> None:
+        path = self.__blob_path(content_hash)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
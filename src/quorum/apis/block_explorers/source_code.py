@@ -1,15 +1,20 @@
+import re
+import time
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import StrEnum
-from pathlib import Path
 
 import solcx
+from packaging.version import Version
 
 import quorum.utils.pretty_printer as pp
+from quorum.apis.block_explorers.ast_cache import ASTCache
+from quorum.apis.block_explorers.solc_manager import SolcManager
+from quorum.utils.tracing import traced
 
-# Install the latest version of Solidity compiler.
-solc_version = solcx.get_compilable_solc_versions()[0]
-solcx.install_solc(solc_version)
-solcx.set_solc_version(solc_version)
+# A source location "start:length:source_index"
+SOURCE_LOCATION_PATTERN = re.compile(r"^(\d+:\d+:)\d+$")
 
 
 class ASTOption(StrEnum):
@@ -17,10 +22,98 @@ class ASTOption(StrEnum):
     STATE_VARIABLES = "VariableDeclaration"
 
 
+@traced("solc", "solc.parse")
+def _compile_asts(version: Version, sources: dict[str, str]) -> dict[str, dict]:
+    """
+    Parse Solidity sources with a single standard-JSON solc invocation.
+
+    Args:
+        version (Version): The solc version to use.
+        sources (dict[str, str]): Maps source unit names to their content.
+
+    Returns:
+        dict[str, dict]: Maps source unit names to their AST.
+
+    Raises:
+        solcx.exceptions.SolcError: If any of the sources cannot be parsed.
+    """
+    output = solcx.compile_standard(
+        {
+            "language": "Solidity",
+            "sources": {
+                name: {"content": content} for name, content in sources.items()
+            },
+            "settings": {
+                "stopAfter": "parsing",
+                "outputSelection": {"*": {"": ["ast"]}},
+            },
+        },
+        solc_binary=SolcManager().get_executable(version),
+        allow_empty=True,
+    )
+    return {name: output["sources"][name]["ast"] for name in sources}
+
+
+def _normalize_batch_ast(ast: dict) -> dict:
+    """
+    Renumber the AST of a source parsed in a batch as if the source had been parsed alone.
+
+    solc numbers the nodes of all the sources of an invocation in a single sequence and
+    locates nodes by the index of their source, so the node ids and source indexes of a batch
+    AST are only valid within the batch. The sources are parsed one after another, so the ids
+    of a source are contiguous: they are shifted to start at 1 and its source index is set to
+    0, as in a single-file parse. References between nodes are only resolved after parsing.
+
+    Args:
+        ast (dict): The AST of a source, from a batch invocation.
+
+    Returns:
+        dict: The AST a single-file invocation would have produced.
+    """
+    return _renumber(ast, min(_iter_node_ids(ast)) - 1)
+
+
+def _renumber(value, offset: int):
+    if isinstance(value, list):
+        return [_renumber(item, offset) for item in value]
+    if not isinstance(value, dict):
+        return value
+    renumbered = {}
+    for key, item in value.items():
+        if key == "id" and isinstance(item, int):
+            renumbered[key] = item - offset
+        elif key == "src" or key.endswith(("Location", "Locations")):
+            renumbered[key] = _relocate(item)
+        else:
+            renumbered[key] = _renumber(item, offset)
+    return renumbered
+
+
+def _relocate(location):
+    # src, nameLocation... are a source location, nameLocations a list of them
+    if isinstance(location, list):
+        return [_relocate(item) for item in location]
+    if isinstance(location, str):
+        return SOURCE_LOCATION_PATTERN.sub(r"\g<1>0", location)
+    return location
+
+
+def _iter_node_ids(value) -> Iterator[int]:
+    if isinstance(value, dict):
+        if isinstance(node_id := value.get("id"), int):
+            yield node_id
+        for item in value.values():
+            yield from _iter_node_ids(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_node_ids(item)
+
+
 @dataclass
 class SourceCode:
     """
     Data class representing source code information.
+    The source is parsed on first use, unless parse_source_codes already parsed it in a batch.
     """
 
     file_name: str
@@ -28,26 +121,41 @@ class SourceCode:
 
     def __post_init__(self):
         self._parsed_contract = None
+        self._is_parsed = False
         self._functions = None
         self._state_variables = None
-        self._parse_source_code()
 
+    def _get_parsed_contract(self) -> dict | None:
+        """
+        Returns the contract's AST object, parsing the source code if needed.
+        """
+        if not self._is_parsed:
+            self._parse_source_code()
+        return self._parsed_contract
+
+    def _set_parsed_contract(self, ast: dict) -> None:
+        self._parsed_contract = ast
+        self._is_parsed = True
+
+    @traced("solc")
     def _parse_source_code(self) -> None:
         """
         Parses the Solidity source code and stores the contract's AST object.
         """
         source_code_str = "\n".join(self.file_content)
-        tmp_path = Path("tmp.sol")
-
-        with open(tmp_path, "w") as file:
-            file.write(source_code_str)
-
+        self._is_parsed = True
         try:
-            contract_ast = solcx.compile_files(
-                tmp_path, output_values=["ast"], stop_after="parsing", allow_empty=True
-            )
-            contract_name = next(iter(contract_ast.keys()))
-            self._parsed_contract = contract_ast[contract_name]["ast"]
+            # The compiler is resolved from the file's pragma and provisioned on first use.
+            solc_version = SolcManager().resolve_version(source_code_str)
+            ast = ASTCache().get(source_code_str, solc_version)
+            if ast is None:
+                start = time.perf_counter()
+                asts = _compile_asts(solc_version, {self.file_name: source_code_str})
+                ast = asts[self.file_name]
+                ASTCache().put(
+                    source_code_str, solc_version, ast, time.perf_counter() - start
+                )
+            self._parsed_contract = ast
 
         except Exception as e:
             pp.pprint(
@@ -55,8 +163,6 @@ class SourceCode:
                 f"Some of the checks will not apply to this contract!!!",
                 pp.Colors.FAILURE,
             )
-        finally:
-            tmp_path.unlink()
 
     def __extract_nodes(self, ast: dict, node_type: ASTOption) -> dict:
         nodes = {}
@@ -80,9 +186,9 @@ class SourceCode:
             (dict): Dictionary of functions or None if not found.
         """
         if not self._functions:
-            if self._parsed_contract:
+            if parsed_contract := self._get_parsed_contract():
                 self._functions = self.__extract_nodes(
-                    self._parsed_contract, ASTOption.FUNCTIONS
+                    parsed_contract, ASTOption.FUNCTIONS
                 )
         return self._functions
 
@@ -94,8 +200,74 @@ class SourceCode:
             (dict): Dictionary of state variables or None if not found.
         """
         if not self._state_variables:
-            if self._parsed_contract:
+            if parsed_contract := self._get_parsed_contract():
                 self._state_variables = self.__extract_nodes(
-                    self._parsed_contract, ASTOption.STATE_VARIABLES
+                    parsed_contract, ASTOption.STATE_VARIABLES
                 )
         return self._state_variables
+
+
+@traced("solc")
+def parse_source_codes(source_codes: list[SourceCode]) -> None:
+    """
+    Parse all the sources of a payload with a single solc invocation and hand each
+    SourceCode its AST.
+
+    One compiler satisfying the pragmas of all sources is used when possible. Otherwise the
+    sources are grouped by their own compiler version, with one invocation per group.
+    ASTs already in the AST cache are served from it, only the other sources are sent to solc.
+    Sources that cannot be parsed in a batch (e.g. syntax errors or no available compiler)
+    are left to be parsed, and reported, one by one on first use.
+
+    Args:
+        source_codes (list[SourceCode]): The sources of a payload.
+    """
+    pending: dict[str, SourceCode] = {}
+    for source_code in source_codes:
+        if not source_code._is_parsed:
+            pending.setdefault(source_code.file_name, source_code)
+    if not pending:
+        return
+
+    contents = {name: "\n".join(s.file_content) for name, s in pending.items()}
+    groups: dict[Version, dict[str, str]] = defaultdict(dict)
+    try:
+        version = SolcManager().resolve_version("\n".join(contents.values()))
+        groups[version] = contents
+    except Exception:
+        for name, content in contents.items():
+            try:
+                groups[SolcManager().resolve_version(content)][name] = content
+            except Exception:
+                continue
+
+    for version, group in groups.items():
+        misses = {}
+        for name, content in group.items():
+            ast = ASTCache().get(content, version)
+            if ast is None:
+                misses[name] = content
+            else:
+                pending[name]._set_parsed_contract(ast)
+        if not misses:
+            continue
+
+        start = time.perf_counter()
+        try:
+            asts = _compile_asts(version, misses)
+        except Exception:
+            # A single invalid source fails the whole batch, its sources are parsed one by one
+            continue
+        # The batch parse time is attributed to each source in proportion to its size
+        parse_seconds = time.perf_counter() - start
+        total_size = sum(len(content) for content in misses.values()) or 1
+        for name, batch_ast in asts.items():
+            # Cached ASTs are shared with single-file parses and other batches
+            ast = _normalize_batch_ast(batch_ast)
+            ASTCache().put(
+                misses[name],
+                version,
+                ast,
+                parse_seconds * len(misses[name]) / total_size,
+            )
+            pending[name]._set_parsed_contract(ast)
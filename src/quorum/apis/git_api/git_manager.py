@@ -1,9 +1,192 @@
+import time
 from pathlib import Path
 
-from git import Repo
+from git import GitCommandError, Repo
+from pydantic import BaseModel
 
 import quorum.utils.pretty_printer as pp
+from quorum.apis.git_api.repo_index import RepoIndexRegistry
+from quorum.utils.json_cache import dump_json, load_json
 from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.tracing import traced
+
+# Written in each clone's .git directory after it was cloned or updated
+FRESHNESS_STAMP = "quorum_freshness.json"
+
+
+class RepoConfig(BaseModel):
+    """
+    How a repository of the ground truth is cloned and updated.
+
+    Attributes:
+        url (str): The URL of the repository.
+        branch (str | None): The branch to check out, defaults to the remote's default branch.
+        depth (int | None): Only fetch this many commits of history (a shallow clone).
+        filter (str | None): A partial clone filter, e.g. "blob:none" to download file contents
+            only when they are checked out.
+        sparse_checkout (list[str] | None): Only check out the files matching these patterns,
+            e.g. ["src/**/*.sol"].
+    """
+
+    url: str
+    branch: str | None = None
+    depth: int | None = None
+    filter: str | None = None
+    sparse_checkout: list[str] | None = None
+
+    @property
+    def name(self) -> str:
+        return Path(self.url).stem
+
+    @classmethod
+    def from_entry(cls, entry: str | dict) -> "RepoConfig":
+        """
+        Parse a repository entry of ground_truth.json, either a URL (with an optional
+        "#branch" suffix) or an object with the url and the clone options.
+
+        Args:
+            entry (str | dict): The repository entry.
+
+        Returns:
+            RepoConfig: The repository configuration.
+        """
+        if isinstance(entry, dict):
+            return cls(**entry)
+        url, _, branch = entry.partition("#")
+        return cls(url=url, branch=branch or None)
+
+
+@traced("git")
+def clone_or_update_repo(repo_config: RepoConfig, to_path: Path) -> None:
+    """
+    Clone a repository, or update an existing clone.
+
+    An existing clone is not updated again for QuorumConfiguration().repo_ttl after it was
+    cloned or updated, and is only pulled if its remote branch moved since. In offline mode,
+    existing clones are used as they are and missing ones are not cloned.
+
+    Args:
+        repo_config (RepoConfig): The repository configuration.
+        to_path (Path): The directory to clone the repository into.
+    """
+    config = QuorumConfiguration()
+    repo_path = to_path / repo_config.name
+    stamp_path = repo_path / ".git" / FRESHNESS_STAMP
+    if not repo_path.exists():
+        if config.offline:
+            pp.pprint(
+                f"Repository {repo_config.name} is not cloned and Quorum runs offline.",
+                pp.Colors.WARNING,
+            )
+            return
+        pp.pprint(
+            f"Cloning {repo_config.name} from URL: {repo_config.url} to {repo_path}...",
+            pp.Colors.INFO,
+        )
+        repo = _clone(repo_config, repo_path)
+        remote_head = repo.head.commit.hexsha
+    elif config.offline:
+        pp.pprint(
+            f"Repository {repo_config.name} is used as is, Quorum runs offline.",
+            pp.Colors.INFO,
+        )
+        return
+    elif not config.refresh and load_json(stamp_path, config.repo_ttl):
+        pp.pprint(
+            f"Repository {repo_config.name} was updated less than "
+            f"{config.repo_ttl.total_seconds() / 60:g} minutes ago. Skipping update.",
+            pp.Colors.INFO,
+        )
+        return
+    else:
+        remote_head = _update(repo_config, Repo(repo_path))
+
+    dump_json(stamp_path, {"fetched_at": time.time(), "remote_head": remote_head})
+
+
+def _clone(repo_config: RepoConfig, repo_path: Path) -> Repo:
+    clone_options = {
+        "branch": repo_config.branch,
+        "depth": repo_config.depth,
+        "filter": repo_config.filter,
+        # Sparse repos are checked out once the patterns are set
+        "no_checkout": bool(repo_config.sparse_checkout),
+    }
+    repo = Repo.clone_from(
+        repo_config.url,
+        repo_path,
+        **{k: v for k, v in clone_options.items() if v},
+    )
+    if repo_config.sparse_checkout:
+        repo.git.sparse_checkout("set", "--no-cone", *repo_config.sparse_checkout)
+        repo.git.checkout(repo_config.branch or repo.active_branch.name)
+    return repo
+
+
+def _update(repo_config: RepoConfig, repo: Repo) -> str | None:
+    """
+    Update an existing clone, unless its remote branch did not move.
+
+    Returns:
+        str | None: The commit of the remote branch, None if it could not be listed.
+    """
+    if repo_config.sparse_checkout:
+        # Re-applied on every update, so changes to the patterns take effect
+        repo.git.sparse_checkout("set", "--no-cone", *repo_config.sparse_checkout)
+    if repo_config.branch:
+        repo.git.checkout(repo_config.branch)
+
+    # Listing the remote branch is much cheaper than fetching it
+    remote_head = _remote_head(repo)
+    if remote_head is not None and remote_head == repo.head.commit.hexsha:
+        pp.pprint(f"Repository {repo_config.name} is up to date.", pp.Colors.INFO)
+        return remote_head
+
+    pp.pprint(f"Updating repository {repo_config.name}...", pp.Colors.INFO)
+    if repo_config.depth:
+        # Resetting to the remote branch would discard local work, which pulling refuses to
+        if local_changes := _local_changes(repo):
+            pp.pprint(
+                f"Repository {repo_config.name} has {local_changes}, skipping its update. "
+                "Commit them elsewhere or discard them to update it.",
+                pp.Colors.WARNING,
+            )
+            return None
+        # Pulling would deepen the history, fetch the new tip only and move to it
+        repo.git.fetch("origin", depth=repo_config.depth)
+        repo.git.reset("--hard", "@{upstream}")
+    else:
+        repo.git.pull()
+    return remote_head
+
+
+def _local_changes(repo: Repo) -> str | None:
+    """
+    Describe the changes of a clone that are not on its remote branch.
+
+    Returns:
+        str | None: The local changes, None if there are none.
+    """
+    if repo.is_dirty():
+        return "uncommitted changes"
+    if repo.active_branch.tracking_branch() is None:
+        return None
+    # Compared with the last fetched tip, a shallow fetch cuts the history of the new one
+    ahead = int(repo.git.rev_list("--count", "@{upstream}..HEAD"))
+    return f"{ahead} local commit(s)" if ahead else None
+
+
+def _remote_head(repo: Repo) -> str | None:
+    tracking_branch = repo.active_branch.tracking_branch()
+    if tracking_branch is None:
+        return None
+    try:
+        output = repo.git.ls_remote(
+            tracking_branch.remote_name, f"refs/heads/{tracking_branch.remote_head}"
+        )
+    except GitCommandError:
+        return None
+    return output.split()[0] if output else None
 
 
 class GitManager:
@@ -12,12 +195,13 @@ class GitManager:
 
     Attributes:
         customer (str): The name or identifier of the customer.
-        repos (dict): A dictionary mapping repository names to their URLs.
+        repos (list[RepoConfig]): The repositories to diff against.
+        review_repo (RepoConfig | None): The verification repository, if any.
     """
 
     def __init__(self, customer: str, gt_config: dict[str, any]) -> None:
         """
-        Initialize the GitManager with the given customer name and load the repository URLs.
+        Initialize the GitManager with the given customer name and load the repository configurations.
 
         Args:
             customer (str): The name or identifier of the customer.
@@ -38,68 +222,42 @@ class GitManager:
 
     def _load_repos_from_file(
         self, gt_config: dict[str, any]
-    ) -> tuple[dict[str, str], dict[str, str]]:
+    ) -> tuple[list[RepoConfig], RepoConfig | None]:
         """
-        Load repository URLs from the JSON file for the given customer.
+        Load repository configurations from the JSON file for the given customer.
 
         Args:
             gt_config (dict[str, any]): The ground truth configuration data for the customer.
 
         Returns:
-            tuple[dict[str, str], dict[str, str]]: 2 dictionaries mapping repository names to their URLs.
-                The first dictionary contains the repos to diff against. The second dictionary is the verification repo.
+            tuple[list[RepoConfig], RepoConfig | None]: The repos to diff against, and the
+                verification repo if any.
         """
-        repos = {Path(r).stem: r for r in gt_config["dev_repos"]}
+        repos = [RepoConfig.from_entry(r) for r in gt_config["dev_repos"]]
 
         verify_repo = (
-            {Path(gt_config["review_repo"]).stem: gt_config["review_repo"]}
+            RepoConfig.from_entry(gt_config["review_repo"])
             if "review_repo" in gt_config
-            else {}
+            else None
         )
         return repos, verify_repo
 
-    @staticmethod
-    def __clone_or_update_for_repo(repo_name: str, repo_url: str, to_path: Path):
-        repo_path = to_path / repo_name
-        branch = None
-        if "#" in repo_url:
-            repo_url, branch = repo_url.split("#")
-        if repo_path.exists():
-            pp.pprint(
-                f"Repository {repo_name} already exists at {repo_path}. Updating repo.",
-                pp.Colors.INFO,
-            )
-            repo = Repo(repo_path)
-            if branch:
-                repo.git.checkout(branch)
-            repo.git.pull()
-        else:
-            pp.pprint(
-                f"Cloning {repo_name} from URL: {repo_url} to {repo_path}...",
-                pp.Colors.INFO,
-            )
-            if branch:
-                Repo.clone_from(repo_url, repo_path, branch=branch)
-            else:
-                Repo.clone_from(repo_url, repo_path)
-
     def clone_or_update(self) -> None:
         """
         Clone the repositories for the customer.
 
-        If the repository already exists locally, it will update the repository and its submodules.
-        Otherwise, it will clone the repository and initialize submodules.
+        If the repository already exists locally, it will update the repository when needed
+        (see clone_or_update_repo). Otherwise, it will clone the repository.
+        The file indexes used by the diff checks are rebuilt once the repositories are up to date.
         """
         pp.pprint(
             "Cloning and updating preliminaries", pp.Colors.INFO, pp.Heading.HEADING_2
         )
-        for repo_name, repo_url in self.repos.items():
-            GitManager.__clone_or_update_for_repo(
-                repo_name, repo_url, self.modules_path
-            )
+        for repo_config in self.repos:
+            clone_or_update_repo(repo_config, self.modules_path)
 
         if self.review_repo:
-            repo_name, repo_url = next(iter(self.review_repo.items()))
-            GitManager.__clone_or_update_for_repo(
-                repo_name, repo_url, self.review_module_path
-            )
+            clone_or_update_repo(self.review_repo, self.review_module_path)
+
+        RepoIndexRegistry().build(self.modules_path)
+        RepoIndexRegistry().build(self.review_module_path)
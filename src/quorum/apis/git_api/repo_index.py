@@ -0,0 +1,157 @@
+import difflib
+import hashlib
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from quorum.utils.singleton import singleton
+from quorum.utils.tracing import traced
+
+
+def content_hash(lines: list[str], normalize_whitespace: bool = False) -> str:
+    """
+    Hash the content of a file given as lines, which makes the hash independent of line endings.
+
+    Args:
+        lines (list[str]): The lines of the file.
+        normalize_whitespace (bool): Ignore indentation, runs of spaces and blank lines.
+
+    Returns:
+        str: The sha256 hex digest of the content.
+    """
+    if normalize_whitespace:
+        lines = [" ".join(line.split()) for line in lines]
+        lines = [line for line in lines if line]
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+class RepoIndex:
+    """
+    A one-time index of the files of a local repository, used to resolve proposal file paths.
+
+    Files are indexed by name, so resolving a path only looks at the files sharing its name
+    instead of walking the whole tree. File hashes are memoised for the lifetime of the index,
+    i.e. until the repository is updated and indexed again.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Walk the repository once and index its files by name.
+
+        Args:
+            root (Path): The repository (or directory of repositories) to index.
+        """
+        self.root = root
+        self.__hashes: dict[tuple[Path, bool], str] = {}
+        self.__hashes_lock = threading.Lock()
+        self.__files_by_name: dict[str, list[tuple[str, ...]]] = defaultdict(list)
+        for dir_path, dir_names, file_names in os.walk(root):
+            # Git internals never hold source files
+            if ".git" in dir_names:
+                dir_names.remove(".git")
+            rel_parts = Path(dir_path).relative_to(root).parts
+            for file_name in file_names:
+                self.__files_by_name[file_name].append((*rel_parts, file_name))
+
+        # Keep candidates in a stable order, so ties are broken the same way on every run
+        for candidates in self.__files_by_name.values():
+            candidates.sort()
+
+    def find_most_common_path(self, source_path: Path) -> Path | None:
+        """
+        Find the local file matching the longest suffix of a proposal file path.
+
+        When several local files share that suffix, the one whose path is the most similar
+        to the suffix is returned.
+
+        Args:
+            source_path (Path): The file path from the proposal.
+
+        Returns:
+            Path | None: The most common file path if found, otherwise None.
+        """
+        parts = source_path.parts
+        if not parts:
+            return None
+
+        candidates = self.__files_by_name.get(parts[-1], [])
+        for i in range(len(parts)):
+            # Compare against the path suffix starting from the i-th part
+            suffix = parts[i:]
+            local_files = [
+                self.root.joinpath(*c)
+                for c in candidates
+                if c[-len(suffix) :] == suffix
+            ]
+            if local_files:
+                source_str = Path(*suffix).as_posix()
+                return max(
+                    local_files,
+                    key=lambda f: difflib.SequenceMatcher(
+                        None, source_str, f.as_posix()
+                    ).ratio(),
+                )
+
+        return None
+
+    def file_hash(self, path: Path, normalize_whitespace: bool = False) -> str:
+        """
+        Get the content hash of a local file, reading and hashing it only once.
+
+        Args:
+            path (Path): The local file.
+            normalize_whitespace (bool): Ignore indentation, runs of spaces and blank lines.
+
+        Returns:
+            str: The content hash of the file, as computed by content_hash.
+        """
+        key = (path, normalize_whitespace)
+        with self.__hashes_lock:
+            if key in self.__hashes:
+                return self.__hashes[key]
+        file_hash = content_hash(path.read_text().splitlines(), normalize_whitespace)
+        with self.__hashes_lock:
+            self.__hashes[key] = file_hash
+        return file_hash
+
+
+@singleton
+class RepoIndexRegistry:
+    """
+    Run-wide registry of repository indexes, shared by all the checks resolving local files.
+    """
+
+    def __init__(self):
+        self.__indexes: dict[Path, RepoIndex] = {}
+        self.__lock = threading.Lock()
+
+    @traced("git")
+    def build(self, root: Path) -> RepoIndex:
+        """
+        (Re)build the index of a repository, e.g. after it was cloned or updated.
+
+        Args:
+            root (Path): The repository to index.
+
+        Returns:
+            RepoIndex: The new index.
+        """
+        index = RepoIndex(root)
+        with self.__lock:
+            self.__indexes[root] = index
+        return index
+
+    def get(self, root: Path) -> RepoIndex:
+        """
+        Get the index of a repository, building it on first use.
+
+        Args:
+            root (Path): The repository to index.
+
+        Returns:
+            RepoIndex: The repository's index.
+        """
+        with self.__lock:
+            index = self.__indexes.get(root)
+        return index or self.build(root)
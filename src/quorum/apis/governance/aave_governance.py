@@ -1,15 +1,27 @@
+from datetime import timedelta
+from pathlib import Path
+
 import requests
 
 from quorum.apis.governance.data_models import BGDProposalData, PayloadAddresses
+from quorum.apis.governance.governance_mirror import GovernanceCacheMirror
 from quorum.utils.chain_enum import Chain
+from quorum.utils.concurrency import map_concurrently
+from quorum.utils.http_transport import HTTPTransport
+from quorum.utils.json_cache import dump_json, load_json
+from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.tracing import Tracer, traced
 
 BASE_BGD_CACHE_REPO = "https://raw.githubusercontent.com/bgd-labs/v3-governance-cache/refs/heads/main/cache"
-PROPOSALS_URL = (
-    f"{BASE_BGD_CACHE_REPO}/1/0x9AEE0B04504CeF83A65AC3f0e838D0593BCb2BC7/proposals"
-)
+PROPOSALS_PATH = "1/0x9AEE0B04504CeF83A65AC3f0e838D0593BCb2BC7/proposals"
+PROPOSALS_URL = f"{BASE_BGD_CACHE_REPO}/{PROPOSALS_PATH}"
 
 NOT_FOUND_STATUS_CODE = 404
 
+# Governance V3 proposal states after which a proposal never changes again:
+# executed, failed, cancelled and expired
+FINAL_PROPOSAL_STATES = {4, 5, 6, 7}
+
 CHAIN_ID_TO_CHAIN = {
     "1": Chain.ETH,
     "42161": Chain.ARB,
@@ -28,34 +40,52 @@ CHAIN_ID_TO_CHAIN = {
 }
 
 
+def _describe_location(response: requests.Response | None, path: Path | None) -> str:
+    if response is not None:
+        return f"at url {response.url} (error code {response.status_code})"
+    return f"in the local mirror at {path}"
+
+
 class ProposalNotFoundException(Exception):
     def __init__(
-        self, proposal_id: int, project_name: str, response: requests.Response
+        self,
+        proposal_id: int,
+        project_name: str,
+        response: requests.Response | None = None,
+        path: Path | None = None,
     ):
         super().__init__()
         self.proposal_id = proposal_id
         self.project_name = project_name
         self.response = response
+        self.path = path
 
     def __str__(self):
         return (
             f"Proposal id {self.proposal_id} for {self.project_name} could not be found "
-            f"at url {self.response.url} (error code {self.response.status_code}). "
+            f"{_describe_location(self.response, self.path)}. "
             "Most likely Aave's cache repo is not updated."
         )
 
 
 class ChainNotFoundException(Exception):
-    def __init__(self, chain_id: int, project_name: str, response: requests.Response):
+    def __init__(
+        self,
+        chain_id: int,
+        project_name: str,
+        response: requests.Response | None = None,
+        path: Path | None = None,
+    ):
         super().__init__()
         self.chain_id = chain_id
         self.project_name = project_name
         self.response = response
+        self.path = path
 
     def __str__(self):
         return (
             f"Chain {CHAIN_ID_TO_CHAIN[str(self.chain_id)]} (id {self.chain_id}) info for {self.project_name} could not be found "
-            f"at url {self.response.url} (error code {self.response.status_code}) "
+            f"{_describe_location(self.response, self.path)} "
             "Most likely Aave's cache repo is not updated."
         )
 
@@ -64,10 +94,19 @@ class AaveGovernanceAPI:
     """
     A utility class to interact with the BGD governance cache and retrieve
     relevant information about Aave proposals and payload addresses.
+
+    Responses are cached on disk. Proposals in a final state and payloads never change, so they
+    are cached forever, while the other proposals are fetched again after ACTIVE_PROPOSAL_TTL.
+    In mirror mode (QuorumConfiguration().governance_mirror), files are read from a local
+    clone of the governance cache repository instead.
     """
 
+    ACTIVE_PROPOSAL_TTL = timedelta(minutes=5)
+    MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(self) -> None:
-        self.session = requests.Session()
+        self.transport = HTTPTransport()
+        self.cache_dir = Path(__file__).parent / "cache"
 
     def get_proposal_data(self, proposal_id: int) -> BGDProposalData:
         """
@@ -79,19 +118,75 @@ class AaveGovernanceAPI:
         Returns:
             A BGDProposalData object.
         """
-        proposal_data_link = f"{PROPOSALS_URL}/{proposal_id}.json"
-        resp = self.session.get(proposal_data_link)
-        try:
-            resp.raise_for_status()
-        except requests.HTTPError as e:
-            if resp.status_code == NOT_FOUND_STATUS_CODE:
-                raise ProposalNotFoundException(proposal_id, "Aave", e.response) from e
-            raise
-
-        raw_json = resp.json()
         # Parse into our data model
-        return BGDProposalData(**raw_json)
+        return BGDProposalData(**self.get_raw_proposal_data(proposal_id))
+
+    @traced("governance")
+    def get_raw_proposal_data(self, proposal_id: int) -> dict:
+        """
+        Fetches and returns the JSON of a given proposal, as stored in the governance cache.
+
+        Args:
+            proposal_id: The ID of the proposal to fetch.
+
+        Returns:
+            The decoded JSON of the proposal.
+        """
+        relative_path = f"{PROPOSALS_PATH}/{proposal_id}.json"
+        if QuorumConfiguration().governance_mirror:
+            mirror = GovernanceCacheMirror()
+            if (raw_json := mirror.read_json(relative_path)) is None:
+                raise ProposalNotFoundException(
+                    proposal_id, "Aave", path=mirror.cache_path / relative_path
+                )
+            return raw_json
 
+        cache_file = self.cache_dir / "proposals" / f"{proposal_id}.json"
+        raw_json = self.__load_cache(cache_file)
+        if raw_json is not None and not self.__is_final(raw_json):
+            raw_json = load_json(cache_file, self.ACTIVE_PROPOSAL_TTL)
+
+        if raw_json is None:
+            resp = self.transport.get(f"{BASE_BGD_CACHE_REPO}/{relative_path}")
+            try:
+                resp.raise_for_status()
+            except requests.HTTPError as e:
+                if resp.status_code == NOT_FOUND_STATUS_CODE:
+                    raise ProposalNotFoundException(
+                        proposal_id, "Aave", e.response
+                    ) from e
+                raise
+            raw_json = resp.json()
+            dump_json(cache_file, raw_json)
+        return raw_json
+
+    def get_latest_proposal_id(self, known_id: int = -1) -> int:
+        """
+        Finds the highest proposal ID available in the governance cache.
+
+        Proposal IDs are consecutive, so the search probes IDs with growing steps after the
+        known one, then bisects the last step: new proposals cost a few requests, not one each.
+
+        Args:
+            known_id: An ID known to exist, -1 if none is known.
+
+        Returns:
+            The highest existing proposal ID, known_id if there is no newer proposal.
+        """
+        low, step = known_id, 1
+        while self.__proposal_exists(low + step):
+            low, step = low + step, step * 2
+        high = low + step
+        # low exists and high does not
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.__proposal_exists(middle):
+                low = middle
+            else:
+                high = middle
+        return low
+
+    @traced("governance")
     def get_payload_addresses(
         self, chain_id: str, controller: str, payload_id: int
     ) -> list[str]:
@@ -106,24 +201,38 @@ class AaveGovernanceAPI:
         Returns:
             A list of addresses that are part of the payload.
         """
-        url = (
-            f"{BASE_BGD_CACHE_REPO}/{chain_id}/{controller}/payloads/{payload_id}.json"
+        relative_path = f"{chain_id}/{controller}/payloads/{payload_id}.json"
+        if QuorumConfiguration().governance_mirror:
+            mirror = GovernanceCacheMirror()
+            payload_data = mirror.read_json(relative_path)
+            if payload_data is None:
+                raise ChainNotFoundException(
+                    chain_id, "Aave", path=mirror.cache_path / relative_path
+                )
+            return [a["target"] for a in payload_data["payload"]["actions"]]
+
+        # The actions of a payload are fixed when it is created
+        cache_file = (
+            self.cache_dir / "payloads" / chain_id / controller / f"{payload_id}.json"
         )
-        resp = self.session.get(url)
-        try:
-            resp.raise_for_status()
-        except requests.HTTPError as e:
-            if resp.status_code == NOT_FOUND_STATUS_CODE:
-                raise ChainNotFoundException(chain_id, "Aave", e.response) from e
-            raise
+        payload_data = self.__load_cache(cache_file)
+        if payload_data is None:
+            resp = self.transport.get(f"{BASE_BGD_CACHE_REPO}/{relative_path}")
+            try:
+                resp.raise_for_status()
+            except requests.HTTPError as e:
+                if resp.status_code == NOT_FOUND_STATUS_CODE:
+                    raise ChainNotFoundException(chain_id, "Aave", e.response) from e
+                raise
+            payload_data = resp.json()
+            dump_json(cache_file, payload_data)
 
-        payload_data = resp.json()
         # We only need the 'target' field from each action
         return [a["target"] for a in payload_data["payload"]["actions"]]
 
     def get_all_payloads_addresses(self, proposal_id: int) -> list[PayloadAddresses]:
         """
-        Retrieves all payload addresses for a given proposal.
+        Retrieves all payload addresses for a given proposal, fetching the payloads concurrently.
 
         Args:
             proposal_id: The ID of the proposal to fetch.
@@ -132,12 +241,35 @@ class AaveGovernanceAPI:
             A list of PayloadAddresses objects, each containing a chain ID and a list of addresses.
         """
         data = self.get_proposal_data(proposal_id)
-        results = []
-        for p in data.proposal.payloads:
-            addresses = self.get_payload_addresses(
+        payloads = data.proposal.payloads
+        payloads_addresses = map_concurrently(
+            lambda p: self.get_payload_addresses(
                 p.chain, p.payloads_controller, p.payload_id
-            )
-            results.append(
-                PayloadAddresses(chain=CHAIN_ID_TO_CHAIN[p.chain], addresses=addresses)
-            )
-        return results
+            ),
+            payloads,
+            max_workers=self.MAX_CONCURRENT_REQUESTS,
+        )
+        return [
+            PayloadAddresses(chain=CHAIN_ID_TO_CHAIN[p.chain], addresses=addresses)
+            for p, addresses in zip(payloads, payloads_addresses, strict=True)
+        ]
+
+    def __proposal_exists(self, proposal_id: int) -> bool:
+        try:
+            self.get_raw_proposal_data(proposal_id)
+        except ProposalNotFoundException:
+            return False
+        return True
+
+    @staticmethod
+    def __load_cache(cache_file: Path) -> dict | None:
+        if QuorumConfiguration().refresh:
+            return None
+        data = load_json(cache_file)
+        Tracer().count_cache("governance", hit=data is not None)
+        return data
+
+    @staticmethod
+    def __is_final(raw_json: dict) -> bool:
+        proposal = raw_json.get("proposal") or {}
+        return proposal.get("state") in FINAL_PROPOSAL_STATES
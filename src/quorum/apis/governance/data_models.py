@@ -22,6 +22,7 @@ class ProposalData(BaseModel):
     voting_portal: str | None = Field(alias="votingPortal")
     ipfs_hash: str | None = Field(alias="ipfsHash")
     access_level: str | int | None = Field(alias="accessLevel")
+    state: int | None = None
 
     class Config:
         allow_population_by_alias = True
@@ -0,0 +1,66 @@
+import threading
+import time
+from pathlib import Path
+
+from quorum.apis.git_api.git_manager import RepoConfig, clone_or_update_repo
+from quorum.utils.json_cache import load_json
+from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.singleton import singleton
+
+# Only the proposals and payloads of every governance contract are checked out
+GOVERNANCE_CACHE_REPO = RepoConfig(
+    url="https://github.com/bgd-labs/v3-governance-cache",
+    branch="main",
+    depth=1,
+    filter="blob:none",
+    sparse_checkout=["/cache/*/*/proposals/", "/cache/*/*/payloads/"],
+)
+
+
+@singleton
+class GovernanceCacheMirror:
+    """
+    GovernanceCacheMirror reads the BGD governance cache from a local clone of its repository,
+    instead of downloading its files one by one.
+
+    The clone is brought up to date on first read, then again at most once per
+    QuorumConfiguration().repo_ttl, so long-running commands (watch, serve) see new proposals.
+    It follows the same freshness rules as the customers' repositories (see
+    clone_or_update_repo).
+
+    Attributes:
+        path (Path): The directory holding the clone.
+        repo_config (RepoConfig): The governance cache repository.
+    """
+
+    def __init__(self):
+        self.path = QuorumConfiguration().main_path / "governance_cache"
+        self.repo_config = GOVERNANCE_CACHE_REPO
+        self.__checked_at: float | None = None
+        self.__lock = threading.Lock()
+
+    @property
+    def cache_path(self) -> Path:
+        """
+        Returns the cache directory of the clone, mirroring BASE_BGD_CACHE_REPO.
+        """
+        return self.path / self.repo_config.name / "cache"
+
+    def read_json(self, relative_path: str) -> dict | None:
+        """
+        Read a file of the governance cache.
+
+        Args:
+            relative_path (str): The path of the file in the cache directory,
+                e.g. "1/<governance address>/proposals/1.json".
+
+        Returns:
+            dict | None: The content of the file, or None if it does not exist.
+        """
+        ttl_seconds = QuorumConfiguration().repo_ttl.total_seconds()
+        with self.__lock:
+            now = time.monotonic()
+            if self.__checked_at is None or now - self.__checked_at >= ttl_seconds:
+                clone_or_update_repo(self.repo_config, self.path)
+                self.__checked_at = now
+        return load_json(self.cache_path / relative_path)
@@ -1,7 +1,16 @@
-import requests
+import threading
+from datetime import timedelta
+from pathlib import Path
+
 from pydantic import BaseModel
 
+from quorum.utils.chain_enum import Chain
+from quorum.utils.http_transport import HTTPTransport
+from quorum.utils.json_cache import dump_json, load_json
 from quorum.utils.singleton import singleton
+from quorum.utils.tracing import Tracer
+
+NOT_FOUND_STATUS_CODE = 404
 
 
 class MultisigData(BaseModel):
@@ -25,25 +34,108 @@ class SafeAPI:
     """
     SafeAPI is a class designed to interact with the Safe Multisig API.
     It fetches and stores data for various Safe Multisig contracts.
+
+    Each chain is served by its own Safe transaction service. Lookups are cached on disk per
+    (chain, address): Safes for POSITIVE_CACHE_TTL, and addresses that are not Safes for
+    NEGATIVE_CACHE_TTL, after which they are looked up again in case a Safe was deployed there.
     """
 
-    SAFE_API_URL = "https://safe-transaction-mainnet.safe.global/api/v1/safes"
+    SAFE_API_URL = "https://safe-transaction-{network}.safe.global/api/v1/safes"
+    SAFE_NETWORKS: dict[Chain, str] = {
+        Chain.ETH: "mainnet",
+        Chain.ARB: "arbitrum",
+        Chain.AVAX: "avalanche",
+        Chain.BASE: "base",
+        Chain.BSC: "bsc",
+        Chain.GNO: "gnosis-chain",
+        Chain.OPT: "optimism",
+        Chain.POLY: "polygon",
+        Chain.SCROLL: "scroll",
+        Chain.ZK: "zksync",
+        Chain.LINEA: "linea",
+        Chain.CELO: "celo",
+        Chain.SONIC: "sonic",
+    }
+    POSITIVE_CACHE_TTL = timedelta(days=7)
+    NEGATIVE_CACHE_TTL = timedelta(days=1)
 
     def __init__(self):
-        self.session = requests.Session()
+        self.transport = HTTPTransport()
+        self.cache_dir = Path(__file__).parent / "cache"
+        self.memory: dict[tuple[Chain, str], MultisigData | None] = {}
+        self.__lock = threading.Lock()
 
-    def get_multisig_info(self, address: str) -> MultisigData | None:
+    def get_multisig_info(
+        self, address: str, chain: Chain = Chain.ETH
+    ) -> MultisigData | None:
         """
         Get Safe Multisig data for a given address.
 
         Args:
             address (str): The contract address of the Safe Multisig.
+            chain (Chain): The blockchain network of the address.
 
         Returns:
             MultisigData: The Safe Multisig data for the specified address, or None if not found.
         """
-        response = self.session.get(f"{self.SAFE_API_URL}/{address}")
+        key = (chain, address.lower())
+        with self.__lock:
+            if key in self.memory:
+                Tracer().count_cache("provider", hit=True)
+                return self.memory[key]
+
+        multisig, cacheable = self.__lookup(address, chain)
+        if cacheable:
+            with self.__lock:
+                self.memory[key] = multisig
+        return multisig
+
+    def clear_memory(self) -> None:
+        """
+        Forget the results kept in memory, so that the next lookups go through the disk cache
+        and its TTLs again.
+        """
+        with self.__lock:
+            self.memory.clear()
+
+    def __lookup(self, address: str, chain: Chain) -> tuple[MultisigData | None, bool]:
+        """
+        Look an address up in the disk cache, then in the chain's Safe transaction service.
+
+        Args:
+            address (str): The address to look up.
+            chain (Chain): The blockchain network of the address.
+
+        Returns:
+            tuple[MultisigData | None, bool]: The Safe Multisig data (None if not found), and
+                whether the result is definitive and may be cached.
+        """
+        network = self.SAFE_NETWORKS.get(chain)
+        if network is None:
+            # No Safe transaction service on this chain, the answer is always "not found"
+            return None, True
+
+        positive_file = self.cache_dir / chain.value / f"{address.lower()}.json"
+        negative_file = self.cache_dir / chain.value / "not_found" / address.lower()
+        cached = load_json(positive_file, self.POSITIVE_CACHE_TTL)
+        is_not_found = cached is None and (
+            load_json(negative_file, self.NEGATIVE_CACHE_TTL) is not None
+        )
+        Tracer().count_cache("provider", hit=cached is not None or is_not_found)
+        if cached is not None:
+            return MultisigData(**cached), True
+        if is_not_found:
+            return None, True
+
+        url = f"{self.SAFE_API_URL.format(network=network)}/{address}"
+        response = self.transport.get(url)
+        if response.status_code == NOT_FOUND_STATUS_CODE:
+            dump_json(negative_file, {})
+            return None, True
         if not response.ok:
-            return None
-        data = response.json()
-        return MultisigData(**data)
+            # Transient errors (rate limits, outages) are not cached
+            return None, False
+
+        multisig = MultisigData(**response.json())
+        dump_json(positive_file, multisig.model_dump())
+        return multisig, True
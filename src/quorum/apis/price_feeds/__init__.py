@@ -2,13 +2,19 @@ from .chainlink_api import ChainLinkAPI
 from .chronicle_api import ChronicleAPI
 from .coingecko_api import CoinGeckoAPI
 from .coinmcc_api import CoinMarketCapAPI
-from .price_feed_utils import PriceFeedData, PriceFeedProvider, PriceFeedProviderBase
+from .price_feed_utils import (
+    PriceFeedData,
+    PriceFeedLookupError,
+    PriceFeedProvider,
+    PriceFeedProviderBase,
+)
 
 all = [
     ChainLinkAPI,
     ChronicleAPI,
     CoinGeckoAPI,
     PriceFeedData,
+    PriceFeedLookupError,
     PriceFeedProvider,
     PriceFeedProviderBase,
     CoinMarketCapAPI,
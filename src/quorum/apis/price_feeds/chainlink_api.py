@@ -1,4 +1,8 @@
+import threading
+from datetime import timedelta
+
 from quorum.utils.chain_enum import Chain
+from quorum.utils.json_cache import dump_json, load_json
 from quorum.utils.singleton import singleton
 
 from .price_feed_utils import PriceFeedData, PriceFeedProvider, PriceFeedProviderBase
@@ -9,8 +13,15 @@ class ChainLinkAPI(PriceFeedProviderBase):
     """
     ChainLinkAPI is a class designed to interact with the Chainlink data feed API.
     It fetches and stores price feed data for various blockchain networks supported by Chainlink.
+
+    The feed directory of a chain is downloaded at most once per run and kept on disk for
+    DIRECTORY_TTL. It is indexed by both proxy and contract address, so lookups are O(1).
     """
 
+    DIRECTORY_TTL = timedelta(hours=12)
+    # A miss is only worth re-checking once the directory is refreshed
+    NEGATIVE_CACHE_TTL = DIRECTORY_TTL
+
     chain_mapping: dict[Chain, str] = {
         Chain.ARB: "https://reference-data-directory.vercel.app/feeds-ethereum-mainnet-arbitrum-1.json",
         Chain.AVAX: "https://reference-data-directory.vercel.app/feeds-avalanche-mainnet.json",
@@ -28,6 +39,11 @@ class ChainLinkAPI(PriceFeedProviderBase):
         Chain.SONIC: "https://reference-data-directory.vercel.app/feeds-sonic-mainnet.json",
     }
 
+    def __init__(self):
+        super().__init__()
+        self.__directories: dict[Chain, dict[str, PriceFeedData]] = {}
+        self.__directory_locks: dict[Chain, threading.Lock] = {}
+
     def _get_price_feed_info(self, chain: Chain, address: str) -> PriceFeedData | None:
         """
         Get price feed data for a given address on a blockchain network.
@@ -39,23 +55,66 @@ class ChainLinkAPI(PriceFeedProviderBase):
         Returns:
             PriceFeedData: The price feed data for the specified address.
         """
+        return self.__get_directory(chain).get(address.lower())
+
+    def clear_memory(self) -> None:
+        super().clear_memory()
+        # Reloaded from the disk cache, or downloaded again once it is older than DIRECTORY_TTL
+        self.__directories.clear()
+
+    def __get_directory(self, chain: Chain) -> dict[str, PriceFeedData]:
+        """
+        Get the address index of a chain's feed directory, loading it on first use.
+
+        Args:
+            chain (Chain): The blockchain network.
+
+        Returns:
+            dict[str, PriceFeedData]: Maps lower-cased proxy and contract addresses to their feed.
+        """
+        if chain in self.__directories:
+            return self.__directories[chain]
+
+        with self.__directory_locks.setdefault(chain, threading.Lock()):
+            if chain not in self.__directories:
+                self.__directories[chain] = self.__load_directory(chain)
+        return self.__directories[chain]
+
+    def __load_directory(self, chain: Chain) -> dict[str, PriceFeedData]:
+        """
+        Load a chain's feed directory from the disk cache, or download it if the cache is stale.
+
+        Args:
+            chain (Chain): The blockchain network.
+
+        Returns:
+            dict[str, PriceFeedData]: Maps lower-cased proxy and contract addresses to their feed.
+
+        Raises:
+            KeyError: If the chain is not supported by Chainlink.
+        """
         url = self.chain_mapping.get(chain)
         if not url:
             raise KeyError(f"Chain {chain.name} is not supported.")
 
-        response = self.session.get(url)
-        response.raise_for_status()
-        data = response.json()
-        price_feeds = [PriceFeedData(**feed) for feed in data]
-        address_feed = next(
-            (
-                feed
-                for feed in price_feeds
-                if address in [feed.proxy_address, feed.address]
-            ),
-            None,
-        )
-        return address_feed
+        directory_file = self.cache_dir / "directories" / f"{chain.value}.json"
+        feeds = load_json(directory_file, self.DIRECTORY_TTL)
+        if feeds is None:
+            response = self.transport.get(url)
+            response.raise_for_status()
+            feeds = [
+                PriceFeedData(**feed).model_dump(mode="json")
+                for feed in response.json()
+            ]
+            dump_json(directory_file, feeds)
+
+        index: dict[str, PriceFeedData] = {}
+        for feed_data in feeds:
+            feed = PriceFeedData(**feed_data)
+            for feed_address in (feed.proxy_address, feed.address):
+                if feed_address:
+                    index.setdefault(feed_address.lower(), feed)
+        return index
 
     def get_name(self) -> PriceFeedProvider:
         return PriceFeedProvider.CHAINLINK
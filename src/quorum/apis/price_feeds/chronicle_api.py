@@ -1,8 +1,10 @@
+import threading
 from collections import defaultdict
-
-import requests
+from datetime import timedelta
 
 from quorum.utils.chain_enum import Chain
+from quorum.utils.concurrency import map_concurrently
+from quorum.utils.json_cache import dump_json, load_json
 from quorum.utils.singleton import singleton
 
 from .price_feed_utils import PriceFeedData, PriceFeedProvider, PriceFeedProviderBase
@@ -13,14 +15,48 @@ class ChronicleAPI(PriceFeedProviderBase):
     """
     ChronicleAPI is a class designed to interact with the Chronicle data feed API.
     It fetches and stores price feed data for various blockchain networks supported by Chronicle.
+
+    The catalog of a chain (the info of all of its pairs) is fetched concurrently the first time
+    the chain is queried, indexed by address and kept on disk for CATALOG_TTL.
     """
 
+    PAIRS_URL = "https://chroniclelabs.org/api/pairs?testnet=false"
+    PAIR_INFO_URL = (
+        "https://chroniclelabs.org/api/median/info/{pair}/{chain}/?testnet=false"
+    )
+    CATALOG_TTL = timedelta(hours=12)
+    # A miss is only worth re-checking once the catalog is refreshed
+    NEGATIVE_CACHE_TTL = CATALOG_TTL
+    MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(self):
         super().__init__()
-        self.__pairs = self.__process_pairs()
+        self.__pairs: dict[str, list[str]] | None = None
+        self.__pairs_lock = threading.Lock()
+        self.__catalogs: dict[Chain, dict[str, PriceFeedData]] = {}
+        self.__catalog_locks: dict[Chain, threading.Lock] = {}
+
+    def clear_memory(self) -> None:
+        super().clear_memory()
+        # Reloaded from the disk cache, or fetched again once it is older than CATALOG_TTL
+        self.__catalogs.clear()
+        with self.__pairs_lock:
+            self.__pairs = None
+
+    def __get_pairs(self) -> dict[str, list[str]]:
+        """
+        Get the pairs supported by Chronicle, grouped by chain. Fetched at most once per run.
+
+        Returns:
+            dict[str, list[str]]: Maps chain names to their pairs.
+        """
+        with self.__pairs_lock:
+            if self.__pairs is None:
+                self.__pairs = self.__process_pairs()
+        return self.__pairs
 
     def __process_pairs(self) -> dict[str, list[str]]:
-        response = requests.get("https://chroniclelabs.org/api/pairs?testnet=false")
+        response = self.transport.get(self.PAIRS_URL)
         response.raise_for_status()
         pairs = response.json()
         pairs = [p for p in pairs if p["blockchain"] in Chain.__members__.values()]
@@ -29,36 +65,76 @@ class ChronicleAPI(PriceFeedProviderBase):
             result[p["blockchain"]].append(p["pair"])
         return result
 
-    def _get_price_feed_info(self, chain: Chain, address: str) -> PriceFeedData | None:
+    def __fetch_pair_info(self, chain: Chain, pair: str) -> list[dict]:
+        response = self.transport.get(
+            self.PAIR_INFO_URL.format(pair=pair, chain=chain.value)
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def __get_catalog(self, chain: Chain) -> dict[str, PriceFeedData]:
         """
-        Get price feed data for a given address on a blockchain network.
+        Get the address index of a chain's catalog, loading it on first use.
 
         Args:
-            chain (Chain): The blockchain network to fetch price feeds for.
-            address (str): The contract address of the price feed.
+            chain (Chain): The blockchain network.
 
         Returns:
-            PriceFeedData: The price feed data for the specified address.
+            dict[str, PriceFeedData]: Maps lower-cased feed addresses to their feed.
         """
+        if chain in self.__catalogs:
+            return self.__catalogs[chain]
 
-        pairs = self.__pairs.get(chain)
-        if not pairs:
-            return {}
+        with self.__catalog_locks.setdefault(chain, threading.Lock()):
+            if chain not in self.__catalogs:
+                self.__catalogs[chain] = self.__load_catalog(chain)
+        return self.__catalogs[chain]
 
-        chronicle_price_feeds: list[PriceFeedData] = []
-        for pair in pairs:
-            response = self.session.get(
-                f"https://chroniclelabs.org/api/median/info/{pair}/{chain.value}/?testnet=false"
+    def __load_catalog(self, chain: Chain) -> dict[str, PriceFeedData]:
+        """
+        Load a chain's catalog from the disk cache, or fetch the info of all of the chain's
+        pairs concurrently if the cache is stale.
+
+        Args:
+            chain (Chain): The blockchain network.
+
+        Returns:
+            dict[str, PriceFeedData]: Maps lower-cased feed addresses to their feed.
+        """
+        catalog_file = self.cache_dir / "catalogs" / f"{chain.value}.json"
+        feeds = load_json(catalog_file, self.CATALOG_TTL)
+        if feeds is None:
+            pairs = self.__get_pairs().get(chain, [])
+            pairs_info = map_concurrently(
+                lambda pair: self.__fetch_pair_info(chain, pair),
+                pairs,
+                max_workers=self.MAX_CONCURRENT_REQUESTS,
             )
-            response.raise_for_status()
-            data = response.json()
+            feeds = [
+                PriceFeedData(**pair_info).model_dump(mode="json")
+                for pair_infos in pairs_info
+                for pair_info in pair_infos
+            ]
+            dump_json(catalog_file, feeds)
 
-            for pair_info in data:
-                chronicle_price_feeds.append(PriceFeedData(**pair_info))
+        index: dict[str, PriceFeedData] = {}
+        for feed_data in feeds:
+            feed = PriceFeedData(**feed_data)
+            index.setdefault(feed.address.lower(), feed)
+        return index
 
-        return next(
-            (feed for feed in chronicle_price_feeds if address == feed.address), None
-        )
+    def _get_price_feed_info(self, chain: Chain, address: str) -> PriceFeedData | None:
+        """
+        Get price feed data for a given address on a blockchain network.
+
+        Args:
+            chain (Chain): The blockchain network to fetch price feeds for.
+            address (str): The contract address of the price feed.
+
+        Returns:
+            PriceFeedData: The price feed data for the specified address.
+        """
+        return self.__get_catalog(chain).get(address.lower())
 
     def get_name(self) -> PriceFeedProvider:
         return PriceFeedProvider.CHRONICLE
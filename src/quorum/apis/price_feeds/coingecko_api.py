@@ -1,7 +1,12 @@
 from quorum.utils.chain_enum import Chain
 from quorum.utils.singleton import singleton
 
-from .price_feed_utils import PriceFeedData, PriceFeedProvider, PriceFeedProviderBase
+from .price_feed_utils import (
+    PriceFeedData,
+    PriceFeedLookupError,
+    PriceFeedProvider,
+    PriceFeedProviderBase,
+)
 
 
 @singleton
@@ -43,15 +48,22 @@ class CoinGeckoAPI(PriceFeedProviderBase):
 
         Returns:
             PriceFeedData: The price feed data for the specified address.
+
+        Raises:
+            PriceFeedLookupError: If CoinGecko could not answer (e.g. rate limited).
         """
         platform = self.CHAIN_TO_COINGECKO_PLATFORM_MAP.get(chain)
         if not platform:
             return None
 
         url = self.COINGECKO_API_URL.format(platform=platform, address=address)
-        response = self.session.get(url)
-        if response.status_code != 200:
+        response = self.transport.get(url)
+        if response.status_code == 404:
             return None
+        if response.status_code != 200:
+            raise PriceFeedLookupError(
+                f"CoinGecko lookup failed with status {response.status_code}"
+            )
         data: dict = response.json()
         if not data:
             return None
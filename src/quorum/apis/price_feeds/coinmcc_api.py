@@ -3,7 +3,12 @@ import os
 from quorum.utils.chain_enum import Chain
 from quorum.utils.singleton import singleton
 
-from .price_feed_utils import PriceFeedData, PriceFeedProvider, PriceFeedProviderBase
+from .price_feed_utils import (
+    PriceFeedData,
+    PriceFeedLookupError,
+    PriceFeedProvider,
+    PriceFeedProviderBase,
+)
 
 
 @singleton
@@ -35,16 +40,25 @@ class CoinMarketCapAPI(PriceFeedProviderBase):
 
         Returns:
             PriceFeedData: The price feed data for the specified address, or None if not found.
+
+        Raises:
+            ValueError: If the API key is invalid or expired.
+            PriceFeedLookupError: If CoinMarketCap could not answer (e.g. rate limited).
         """
         parameters = {
             "CMC_PRO_API_KEY": self.api_key,
             "address": address,
         }
-        response = self.session.get(self.COINMARKETCAP_API_URL, params=parameters)
+        response = self.transport.get(self.COINMARKETCAP_API_URL, params=parameters)
         if response.status_code in (401, 403):
             raise ValueError("Invalid or expired CoinMarketCap API key")
-        if not response.ok:
+        # Unknown addresses are rejected as invalid values
+        if response.status_code in (400, 404):
             return None
+        if not response.ok:
+            raise PriceFeedLookupError(
+                f"CoinMarketCap lookup failed with status {response.status_code}"
+            )
 
         raw_data: dict = response.json()
         # Extract the first value from the "data" mapping
@@ -1,12 +1,18 @@
+import time
+import weakref
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from enum import StrEnum
 from pathlib import Path
+from typing import ClassVar
 
 import json5 as json
-import requests
 from pydantic import BaseModel, Field
 
 from quorum.utils.chain_enum import Chain
+from quorum.utils.http_transport import HTTPTransport
+from quorum.utils.json_cache import dump_json, load_json
+from quorum.utils.tracing import Tracer
 
 
 class PriceFeedProvider(StrEnum):
@@ -53,6 +59,13 @@ class PriceFeedData(BaseModel):
         return s
 
 
+class PriceFeedLookupError(Exception):
+    """
+    Raised by providers when a lookup failed for a transient reason (e.g. rate limits),
+    so that the address is not remembered as unknown.
+    """
+
+
 class PriceFeedProviderBase(ABC):
     """
     PriceFeedProviderBase is an abstract base class for price feed providers.
@@ -60,19 +73,32 @@ class PriceFeedProviderBase(ABC):
 
     Attributes:
         cache_dir (Path): The directory path to store the fetched price feed data.
+        negative_cache_ttl (timedelta): How long an address that is not known by the provider
+            is remembered as such, defaults to the provider's NEGATIVE_CACHE_TTL.
     """
 
+    NEGATIVE_CACHE_TTL = timedelta(days=1)
+    # The providers created in this process, to clear their memory
+    __instances: ClassVar[weakref.WeakSet["PriceFeedProviderBase"]] = weakref.WeakSet()
+
     def __init__(self):
         super().__init__()
+        PriceFeedProviderBase.__instances.add(self)
         self.cache_dir = Path(__file__).parent / "cache" / self.get_name().value
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
-        self.memory: dict[str, PriceFeedData] = {}
+        self.negative_cache_ttl = self.NEGATIVE_CACHE_TTL
+        self.transport = HTTPTransport()
+        self.memory: dict[tuple[Chain, str], PriceFeedData | None] = {}
+        # When the misses kept in memory were recorded, they expire after negative_cache_ttl
+        self.__missed_at: dict[tuple[Chain, str], float] = {}
 
     def get_price_feed(self, chain: Chain, address: str) -> PriceFeedData | None:
         """
         Get price feed data for a given address on a blockchain network.
 
+        Results are looked up in memory first, then in the disk cache. Addresses unknown to
+        the provider are remembered as such, in memory and on disk, for negative_cache_ttl.
+
         Args:
             chain (Chain): The blockchain network to fetch price feed data for.
             address (str): The contract address of the price feed.
@@ -80,22 +106,66 @@ class PriceFeedProviderBase(ABC):
         Returns:
             PriceFeedData: The price feed data for the specified address or None if not found.
         """
+        # The same address is cached once, whatever its case
+        address = address.lower()
+        key = (chain, address)
+        missed_at = self.__missed_at.get(key)
+        if key in self.memory and (
+            missed_at is None
+            or time.time() - missed_at <= self.negative_cache_ttl.total_seconds()
+        ):
+            Tracer().count_cache("provider", hit=True)
+            return self.memory[key]
+
         cache_file = self.cache_dir / f"{chain.value}" / f"{address}.json"
+        negative_cache_file = self.cache_dir / f"{chain.value}" / "not_found" / address
+        missed_at = None
         if cache_file.exists():
+            Tracer().count_cache("provider", hit=True)
             with open(cache_file) as file:
                 data: dict = json.load(file)
-            self.memory[address] = PriceFeedData(**data)
+            price_feed = PriceFeedData(**data)
+        elif load_json(negative_cache_file, self.negative_cache_ttl) is not None:
+            Tracer().count_cache("provider", hit=True)
+            price_feed = None
+            missed_at = negative_cache_file.stat().st_mtime
         else:
-            if address not in self.memory:
-                self.memory[address] = self._get_price_feed_info(chain, address)
-                if not self.memory[address]:
-                    return None
+            Tracer().count_cache("provider", hit=False)
+            try:
+                price_feed = self._get_price_feed_info(chain, address)
+            except PriceFeedLookupError:
+                # Transient failures are neither cached nor remembered
+                return None
+            if price_feed:
                 cache_file.parent.mkdir(parents=True, exist_ok=True)
                 with open(cache_file, "w") as file:
-                    json.dump(
-                        self.memory[address].model_dump(mode="json"), file, indent=4
-                    )
-        return self.memory[address]
+                    json.dump(price_feed.model_dump(mode="json"), file, indent=4)
+            else:
+                dump_json(negative_cache_file, {})
+                missed_at = time.time()
+
+        self.memory[key] = price_feed
+        if missed_at is None:
+            self.__missed_at.pop(key, None)
+        else:
+            self.__missed_at[key] = missed_at
+        return price_feed
+
+    def clear_memory(self) -> None:
+        """
+        Forget the results kept in memory, so that the next lookups go through the disk cache
+        and its TTLs again.
+        """
+        self.memory.clear()
+        self.__missed_at.clear()
+
+    @classmethod
+    def clear_all_memory(cls) -> None:
+        """
+        Forget the results kept in memory by all the providers created in this process.
+        """
+        for provider in list(PriceFeedProviderBase.__instances):
+            provider.clear_memory()
 
     @abstractmethod
     def _get_price_feed_info(self, chain: Chain, address: str) -> PriceFeedData:
@@ -0,0 +1,261 @@
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from enum import StrEnum
+
+import quorum.utils.pretty_printer as pp
+from quorum.apis.multisig.safe_api import MultisigData, SafeAPI
+from quorum.apis.price_feeds import PriceFeedData, PriceFeedProviderBase
+from quorum.utils.chain_enum import Chain
+from quorum.utils.tracing import Tracer
+
+MAX_CONCURRENT_LOOKUPS = 8
+
+
+class AddressKind(StrEnum):
+    """
+    What an address was identified as.
+    """
+
+    PRICE_FEED = "price_feed"
+    TOKEN = "token"
+    MULTISIG = "multisig"
+
+
+@dataclass(frozen=True)
+class AddressClassification:
+    """
+    The first lookup that identified an address.
+
+    Attributes:
+        address (str): The classified address.
+        kind (AddressKind): What the address was identified as.
+        found_on (str): The name of the provider that identified it.
+        data (PriceFeedData | MultisigData): The data returned by the provider.
+    """
+
+    address: str
+    kind: AddressKind
+    found_on: str
+    data: PriceFeedData | MultisigData
+
+
+@dataclass(frozen=True)
+class _Lookup:
+    kind: AddressKind
+    name: str
+    fetch: Callable[[str], PriceFeedData | MultisigData | None]
+
+
+class AddressTable:
+    """
+    A run-scoped table of address classifications, shared by all the classifiers of a run so
+    that an address found in several payloads is only classified once.
+
+    Entries are keyed by chain, address and the lookups used to classify it, since customers
+    may configure different providers. An address being classified by one payload is awaited
+    by the others instead of being classified twice.
+
+    Attributes:
+        resolved (int): The number of addresses classified during the run.
+        saved (int): The number of classifications served from the table instead.
+    """
+
+    def __init__(self):
+        self.resolved = 0
+        self.saved = 0
+        self.__entries: dict[tuple, Future] = {}
+        self.__lock = threading.Lock()
+
+    def claim(self, key: tuple) -> tuple[Future, bool]:
+        """
+        Get the entry of a key, creating it if it does not exist yet.
+
+        Args:
+            key (tuple): The entry key.
+
+        Returns:
+            tuple[Future, bool]: The future classification of the key, and whether the caller
+                created it and must resolve it.
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.saved += 1
+                return self.__entries[key], False
+            future = Future()
+            self.__entries[key] = future
+            self.resolved += 1
+            return future, True
+
+    def discard(self, key: tuple) -> None:
+        """
+        Remove an entry whose classification failed, so that a later payload tries again.
+
+        Args:
+            key (tuple): The entry key.
+        """
+        with self.__lock:
+            if self.__entries.pop(key, None) is not None:
+                self.resolved -= 1
+
+    def report(self) -> None:
+        """
+        Print the number of address lookups saved during this run.
+        """
+        if not self.resolved:
+            return
+        pp.pprint(
+            f"Address classification: {self.resolved} unique addresses classified, "
+            f"{self.saved} lookups saved by reusing earlier results.",
+            pp.Colors.INFO,
+        )
+
+
+class AddressClassifier:
+    """
+    AddressClassifier identifies addresses as price feeds, tokens or Safe multisigs.
+
+    Lookups are tried in priority order: the price feed providers in configuration order, then
+    the token providers, then the Safe API. An address is classified by the first lookup that
+    finds it, exactly as if they were tried one after another, but all the (address, lookup)
+    pairs are sent at once with bounded concurrency. Once a lookup hits, the lower-priority
+    lookups of the same address that did not start yet are cancelled.
+    """
+
+    def __init__(
+        self,
+        chain: Chain,
+        price_feed_providers: list[PriceFeedProviderBase],
+        token_providers: list[PriceFeedProviderBase],
+        max_workers: int = MAX_CONCURRENT_LOOKUPS,
+        table: AddressTable | None = None,
+    ) -> None:
+        """
+        Args:
+            chain (Chain): The blockchain network of the addresses.
+            price_feed_providers (list[PriceFeedProviderBase]): Price feed providers, by priority.
+            token_providers (list[PriceFeedProviderBase]): Token providers, by priority.
+            max_workers (int): The maximum number of concurrent lookups.
+            table (AddressTable | None): The run's table of classifications, if any.
+        """
+        self.chain = chain
+        self.max_workers = max_workers
+        self.table = table
+        multisig_api = SafeAPI()
+        self.lookups = [
+            *(
+                _Lookup(AddressKind.PRICE_FEED, p.get_name(), self.__provider_fetch(p))
+                for p in price_feed_providers
+            ),
+            *(
+                _Lookup(AddressKind.TOKEN, p.get_name(), self.__provider_fetch(p))
+                for p in token_providers
+            ),
+            _Lookup(
+                AddressKind.MULTISIG,
+                "Safe",
+                lambda address: multisig_api.get_multisig_info(address, chain),
+            ),
+        ]
+
+    def __provider_fetch(
+        self, provider: PriceFeedProviderBase
+    ) -> Callable[[str], PriceFeedData | None]:
+        return lambda address: provider.get_price_feed(self.chain, address)
+
+    def classify(
+        self, addresses: Iterable[str]
+    ) -> dict[str, AddressClassification | None]:
+        """
+        Classify addresses concurrently, keeping the priority of the lookups.
+
+        Args:
+            addresses (Iterable[str]): The addresses to classify.
+
+        Returns:
+            dict[str, AddressClassification | None]: Maps each address to its classification,
+                or None if no lookup identified it.
+
+        Raises:
+            Exception: Any error raised by a lookup whose result was needed to classify an address.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        if self.table is None:
+            return self.__classify(addresses)
+
+        lookup_names = tuple((lookup.kind, lookup.name) for lookup in self.lookups)
+        keys = {a: (self.chain, a.lower(), lookup_names) for a in addresses}
+        entries = {a: self.table.claim(keys[a]) for a in addresses}
+        owned = [a for a, (_, is_owner) in entries.items() if is_owner]
+        try:
+            results = self.__classify(owned)
+        except BaseException as e:
+            for address in owned:
+                self.table.discard(keys[address])
+                entries[address][0].set_exception(e)
+            raise
+        for address in owned:
+            entries[address][0].set_result(results[address])
+
+        classifications = {}
+        for address, (future, _) in entries.items():
+            # Results found for another spelling of the address keep their own address
+            classification = future.result()
+            if classification is not None and classification.address != address:
+                classification = replace(classification, address=address)
+            classifications[address] = classification
+        return classifications
+
+    def __classify(
+        self, addresses: list[str]
+    ) -> dict[str, AddressClassification | None]:
+        futures: dict[str, list[Future]] = {address: [] for address in addresses}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Submit by priority level, so the workers start with the lookups most likely to
+            # decide, and lower-priority ones are still queued (cancellable) when they do
+            for lookup in self.lookups:
+                for address in addresses:
+                    futures[address].append(
+                        executor.submit(self.__fetch, lookup, address)
+                    )
+            # Callbacks are added once all futures exist, a lookup done by now runs its own
+            # callback immediately
+            for address_futures in futures.values():
+                for priority, future in enumerate(address_futures):
+                    future.add_done_callback(
+                        self.__cancel_lower_priority(address_futures, priority)
+                    )
+
+            return {
+                address: self.__first_hit(address, futures[address])
+                for address in addresses
+            }
+
+    @staticmethod
+    def __fetch(lookup: _Lookup, address: str) -> PriceFeedData | MultisigData | None:
+        with Tracer().span("provider", f"{lookup.kind}:{lookup.name}", address=address):
+            return lookup.fetch(address)
+
+    @staticmethod
+    def __cancel_lower_priority(
+        address_futures: list[Future], priority: int
+    ) -> Callable[[Future], None]:
+        def on_done(future: Future) -> None:
+            if future.cancelled() or future.exception() or future.result() is None:
+                return
+            # Futures of this address submitted after this one have a lower priority
+            for lower in address_futures[priority + 1 :]:
+                lower.cancel()
+
+        return on_done
+
+    def __first_hit(
+        self, address: str, address_futures: list[Future]
+    ) -> AddressClassification | None:
+        # Lower-priority futures are only cancelled after a hit, which is returned first
+        for lookup, future in zip(self.lookups, address_futures, strict=True):
+            if data := future.result():
+                return AddressClassification(address, lookup.kind, lookup.name, data)
+        return None
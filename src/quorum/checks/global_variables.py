@@ -3,6 +3,7 @@ from pathlib import Path
 import quorum.utils.pretty_printer as pp
 from quorum.apis.block_explorers.source_code import SourceCode
 from quorum.checks.check import Check
+from quorum.checks.results import GlobalVariablesResult
 
 
 class GlobalVariableCheck(Check):
@@ -12,12 +13,15 @@ class GlobalVariableCheck(Check):
     This class checks if global variables in source codes files are either constant or immutable.
     """
 
-    def check_global_variables(self) -> None:
+    def check_global_variables(self) -> GlobalVariablesResult:
         """
         Checks global variables in the source code to ensure they are either constant or immutable.
 
         This method parses the Solidity source code and checks for variables that do not meet the constant
         or immutable criteria.
+
+        Returns:
+            GlobalVariablesResult: The storage variables found, per file.
         """
         source_code_to_violated_variables = {}
         for source_code in self.source_codes:
@@ -31,7 +35,7 @@ class GlobalVariableCheck(Check):
                     violated_variables
                 )
 
-        self.__process_results(source_code_to_violated_variables)
+        return self.__process_results(source_code_to_violated_variables)
 
     def __check_const(self, source_code: SourceCode) -> list[dict]:
         """
@@ -67,7 +71,7 @@ class GlobalVariableCheck(Check):
 
     def __process_results(
         self, source_code_to_violated_variables: dict[str, list[dict]]
-    ):
+    ) -> GlobalVariablesResult:
         """
         Processes the results of the global variable checks and prints them to the console.
 
@@ -76,23 +80,33 @@ class GlobalVariableCheck(Check):
         Args:
             source_code_to_violated_variables (dict[str, list[dict]]): A dictionary mapping file names
                                                                        to lists of violated variables.
+
+        Returns:
+            GlobalVariablesResult: The names of the violated variables, per file.
         """
-        if not source_code_to_violated_variables:
+        result = GlobalVariablesResult(
+            violations={
+                file_name: [var["name"] for var in violated_variables]
+                for file_name, violated_variables in source_code_to_violated_variables.items()
+            }
+        )
+        if result.passed:
             pp.pprint(
                 "All global variables are constant or immutable.", pp.Colors.SUCCESS
             )
-            return
+            return result
 
-        msg = (
+        lines = [
             "Some global variables aren't constant or immutable. A storage collision may occur!\n"
-            "The following variables found to be storage variables: "
-        )
+            "The following variables found to be storage variables:"
+        ]
         i = 1
         for file_name, violated_variables in source_code_to_violated_variables.items():
-            for var in violated_variables:
-                msg += f"\t{i}. File {file_name}: {var['name']}"
+            for var_name in result.violations[file_name]:
+                lines.append(f"\t{i}. File {file_name}: {var_name}")
                 i += 1
             self._write_to_file(
                 Path(file_name).stem.removesuffix(".sol"), violated_variables
             )
-        pp.pprint(msg, pp.Colors.FAILURE)
+        pp.pprint("\n".join(lines), pp.Colors.FAILURE)
+        return result
@@ -1,15 +1,18 @@
 import quorum.utils.pretty_printer as pp
 from quorum.checks.check import Check
-from quorum.llm.chains.first_deposit_chain import FirstDepositChain, ListingArray
+from quorum.checks.results import NewListingResult
 
 
 class NewListingCheck(Check):
-    def new_listing_check(self) -> None:
+    def new_listing_check(self) -> NewListingResult:
         """
         Checks if the proposal address is a new listing on the blockchain.
         This method retrieves functions from the source codes and checks if there are any new listings.
         If new listings are detected, it handles them accordingly. Otherwise, it prints a message indicating
         no new listings were found.
+
+        Returns:
+            NewListingResult: Whether new listings were detected, and their details.
         """
         functions = self._get_functions_from_source_codes()
         if functions.get("newListings", functions.get("newListingsCustom")):
@@ -18,6 +21,12 @@ class NewListingCheck(Check):
                 pp.Colors.WARNING,
             )
 
+            # Imported here, the LLM stack is slow to load and only needed for new listings
+            from quorum.llm.chains.first_deposit_chain import (
+                FirstDepositChain,
+                ListingArray,
+            )
+
             proposal_code = self.source_codes[0].file_content
             proposal_code_str = "\n".join(proposal_code)
             try:
@@ -30,14 +39,16 @@ class NewListingCheck(Check):
                     "If you have a LLM API key, you can add it to your environment variables to enable this check",
                     pp.Colors.WARNING,
                 )
-                return
+                return NewListingResult(detected=True, skipped_reason="LLM unavailable")
 
             if listings is None:
                 pp.pprint(
                     "New listings were detected in payload but LLM failed to retrieve them.",
                     pp.Colors.FAILURE,
                 )
-                return
+                return NewListingResult(
+                    detected=True, skipped_reason="LLM failed to retrieve the listings"
+                )
 
             pp.pprint(
                 f"{len(listings.listings)} new asset listings were detected:",
@@ -58,12 +69,15 @@ class NewListingCheck(Check):
                 )
 
             self._write_to_file("new_listings.json", listings.model_dump())
-
-        else:
-            pp.pprint(
-                f"No new listings detected for {self.proposal_address}", pp.Colors.INFO
+            return NewListingResult(
+                detected=True, listings=listings.model_dump()["listings"]
             )
 
+        pp.pprint(
+            f"No new listings detected for {self.proposal_address}", pp.Colors.INFO
+        )
+        return NewListingResult()
+
     def _get_functions_from_source_codes(self) -> dict:
         """
         Retrieves functions from the source codes.
@@ -71,5 +85,5 @@ class NewListingCheck(Check):
         """
         functions = {}
         for source_code in self.source_codes:
-            functions.update(source_code.get_functions())
+            functions.update(source_code.get_functions() or {})
         return functions
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from pydantic import BaseModel
 
 import quorum.checks as Checks
@@ -6,8 +8,13 @@ from quorum.apis.block_explorers.chains_api import ChainAPI, SourceCode
 from quorum.apis.git_api.git_manager import GitManager
 from quorum.apis.governance.data_models import PayloadAddresses
 from quorum.apis.price_feeds.price_feed_utils import PriceFeedProviderBase
+from quorum.checks.address_classifier import AddressTable
+from quorum.checks.results import PayloadResult, PayloadStatus, ResultStream
 from quorum.utils.chain_enum import Chain
+from quorum.utils.concurrency import DEFAULT_MAX_PER_HOST, HostLimiter
 from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.rate_limiter import RateLimitExceeded
+from quorum.utils.tracing import Tracer
 
 
 class CustomerConfig(BaseModel):
@@ -79,7 +86,7 @@ def run_customer_local_validation(
     pp.pprint(str(customer), pp.Colors.INFO)
     pp.pprint(pp.SEPARATOR_LINE, pp.Colors.INFO)
     # Perform checks
-    perform_checks(
+    result = perform_checks(
         customer=customer,
         chain=chain,
         proposal_id=payload_contract.removesuffix(".sol"),
@@ -87,9 +94,14 @@ def run_customer_local_validation(
         price_feed_providers=price_feed_providers,
         token_providers=token_providers,
     )
+    ResultStream().emit(result)
 
 
-def run_customer_proposal_validation(prop_config: ProposalConfig) -> None:
+def run_customer_proposal_validation(
+    prop_config: ProposalConfig,
+    max_workers: int = 1,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+) -> None:
     """
     Execute proposal checks in batch for multiple customers and their configurations.
 
@@ -99,6 +111,9 @@ def run_customer_proposal_validation(prop_config: ProposalConfig) -> None:
     Args:
         prop_config (ProposalConfig): Configuration object containing customer configs,
             payload addresses, and chain information for proposal validation.
+        max_workers (int): Maximum number of payloads fetched and checked concurrently.
+        max_per_host (int): Maximum number of concurrent requests sent to a single block
+            explorer host.
 
     Returns:
         None
@@ -107,6 +122,10 @@ def run_customer_proposal_validation(prop_config: ProposalConfig) -> None:
         >>> prop_config = ProposalConfig(...)
         >>> run_batch(prop_config)
     """
+    HostLimiter().set_max_per_host(max_per_host)
+    # Addresses shared by the payloads of the run are only classified once
+    address_table = AddressTable()
+
     for config in prop_config.customers_config:
         pp.pprint("Run Preparation", pp.Colors.INFO, pp.Heading.HEADING_1)
         price_feed_providers, token_providers = load_customer_config(
@@ -118,14 +137,16 @@ def run_customer_proposal_validation(prop_config: ProposalConfig) -> None:
         pp.pprint(str(config), pp.Colors.INFO)
         pp.pprint(pp.SEPARATOR_LINE, pp.Colors.INFO)
 
-        for pa in config.payload_addresses:
-            proposals_check(
-                customer=config.customer,
-                chain=pa.chain,
-                proposal_addresses=pa.addresses,
-                price_feed_providers=price_feed_providers,
-                token_providers=token_providers,
-            )
+        check_payloads(
+            customer=config.customer,
+            payload_addresses=config.payload_addresses,
+            price_feed_providers=price_feed_providers,
+            token_providers=token_providers,
+            max_workers=max_workers,
+            address_table=address_table,
+        )
+
+    address_table.report()
 
 
 def proposals_check(
@@ -134,6 +155,7 @@ def proposals_check(
     proposal_addresses: list[str],
     price_feed_providers: list[PriceFeedProviderBase],
     token_providers: list[PriceFeedProviderBase] | None = None,
+    max_workers: int = 1,
 ) -> None:
     """
     Check and compare source code files for given proposals.
@@ -145,38 +167,165 @@ def proposals_check(
         chain_name (str): The blockchain chain name.
         proposal_addresses (list[str]): List of proposal addresses.
         providers (list[PriceFeedProviderInterface]): List of price feed providers.
+        max_workers (int): Maximum number of payloads fetched and checked concurrently.
     """
-    api = ChainAPI(chain)
+    check_payloads(
+        customer=customer,
+        payload_addresses=[PayloadAddresses(chain=chain, addresses=proposal_addresses)],
+        price_feed_providers=price_feed_providers,
+        token_providers=token_providers,
+        max_workers=max_workers,
+    )
 
-    for proposal_address in proposal_addresses:
-        pp.pprint(
-            f"Analyzing payload {proposal_address} on {chain}",
-            pp.Colors.INFO,
-            pp.Heading.HEADING_1,
-        )
 
-        try:
-            source_codes = api.get_source_code(proposal_address)
-        except ValueError:
-            error_message = (
-                f"Payload address {proposal_address} is not verified on {chain.name} explorer.\n"
-                "We do not recommend to approve this proposal until the code is approved!\n"
-                "Try contacting the proposer and ask them to verify the contract.\n"
-                "No further checks are being performed on this payload."
-            )
-            pp.pprint(error_message, pp.Colors.FAILURE)
-            # Skip further checks for this proposal
-            continue
-
-        perform_checks(
+def check_payloads(
+    customer: str,
+    payload_addresses: list[PayloadAddresses],
+    price_feed_providers: list[PriceFeedProviderBase],
+    token_providers: list[PriceFeedProviderBase] | None = None,
+    max_workers: int = 1,
+    address_table: AddressTable | None = None,
+) -> list[PayloadResult]:
+    """
+    Fetch and check every payload of a customer, across all of its chains.
+
+    Up to max_workers payloads are fetched and checked at the same time. The output of each
+    payload is buffered and printed in the original payload order as soon as it is complete,
+    so the report reads the same regardless of the level of concurrency. Structured results
+    are emitted to the ResultStream as each payload finishes.
+
+    Args:
+        customer (str): The customer name or identifier.
+        payload_addresses (list[PayloadAddresses]): The payload addresses to check, per chain.
+        price_feed_providers (list[PriceFeedProviderBase]): List of price feed providers.
+        token_providers (list[PriceFeedProviderBase] | None): List of token validation providers.
+        max_workers (int): Maximum number of payloads fetched and checked concurrently.
+        address_table (AddressTable | None): The run's table of address classifications.
+
+    Returns:
+        list[PayloadResult]: The results of the payloads, in the original payload order.
+    """
+    apis = {pa.chain: ChainAPI(pa.chain) for pa in payload_addresses if pa.addresses}
+    jobs = [(pa.chain, address) for pa in payload_addresses for address in pa.addresses]
+
+    def check_job(job: tuple[Chain, str]) -> PayloadResult:
+        chain, proposal_address = job
+        return check_payload(
             customer=customer,
-            chain=chain,
-            proposal_id=proposal_address,
-            source_codes=source_codes,
+            api=apis[chain],
+            proposal_address=proposal_address,
             price_feed_providers=price_feed_providers,
             token_providers=token_providers,
+            address_table=address_table,
         )
 
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [check_job(job) for job in jobs]
+
+    def check_job_captured(job: tuple[Chain, str], buffer: list[str]) -> PayloadResult:
+        with pp.capture_output(buffer):
+            return check_job(job)
+
+    buffers: list[list[str]] = [[] for _ in jobs]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = [
+            executor.submit(check_job_captured, job, buffer)
+            for job, buffer in zip(jobs, buffers, strict=True)
+        ]
+        results = []
+        for i, (future, buffer) in enumerate(zip(futures, buffers, strict=True)):
+            try:
+                results.append(future.result())
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                # The payloads that finished meanwhile are still reported, in order
+                for later_future, later_buffer in zip(
+                    futures[i:], buffers[i:], strict=True
+                ):
+                    if later_future.done():
+                        pp.flush_output(later_buffer)
+                raise
+            finally:
+                pp.flush_output(buffer)
+    return results
+
+
+def check_payload(
+    customer: str,
+    api: ChainAPI,
+    proposal_address: str,
+    price_feed_providers: list[PriceFeedProviderBase],
+    token_providers: list[PriceFeedProviderBase] | None = None,
+    address_table: AddressTable | None = None,
+) -> PayloadResult:
+    """
+    Fetch the source code of a single payload, run all checks on it and emit the results.
+
+    Args:
+        customer (str): The customer name or identifier.
+        api (ChainAPI): The block explorer API of the payload's chain.
+        proposal_address (str): The payload address.
+        price_feed_providers (list[PriceFeedProviderBase]): List of price feed providers.
+        token_providers (list[PriceFeedProviderBase] | None): List of token validation providers.
+        address_table (AddressTable | None): The run's table of address classifications.
+
+    Returns:
+        PayloadResult: The results of the checks.
+    """
+    chain = api.chain
+    pp.pprint(
+        f"Analyzing payload {proposal_address} on {chain}",
+        pp.Colors.INFO,
+        pp.Heading.HEADING_1,
+    )
+
+    try:
+        source_codes = api.get_source_code(proposal_address)
+    except RateLimitExceeded as e:
+        pp.pprint(
+            f"Could not fetch payload {proposal_address} on {chain.name}: {e}\n"
+            "The payload was not checked, please run Quorum again later.",
+            pp.Colors.FAILURE,
+        )
+        result = PayloadResult(
+            customer=customer,
+            chain=chain,
+            payload=proposal_address,
+            status=PayloadStatus.FETCH_FAILED,
+            error=str(e),
+        )
+        ResultStream().emit(result)
+        return result
+    except ValueError:
+        error_message = (
+            f"Payload address {proposal_address} is not verified on {chain.name} explorer.\n"
+            "We do not recommend to approve this proposal until the code is approved!\n"
+            "Try contacting the proposer and ask them to verify the contract.\n"
+            "No further checks are being performed on this payload."
+        )
+        pp.pprint(error_message, pp.Colors.FAILURE)
+        # Skip further checks for this proposal
+        result = PayloadResult(
+            customer=customer,
+            chain=chain,
+            payload=proposal_address,
+            status=PayloadStatus.NOT_VERIFIED,
+        )
+        ResultStream().emit(result)
+        return result
+
+    result = perform_checks(
+        customer=customer,
+        chain=chain,
+        proposal_id=proposal_address,
+        source_codes=source_codes,
+        price_feed_providers=price_feed_providers,
+        token_providers=token_providers,
+        address_table=address_table,
+    )
+    ResultStream().emit(result)
+    return result
+
 
 def perform_checks(
     customer: str,
@@ -185,7 +334,8 @@ def perform_checks(
     source_codes: list[SourceCode],
     price_feed_providers: list[PriceFeedProviderBase],
     token_providers: list[PriceFeedProviderBase] | None = None,
-):
+    address_table: AddressTable | None = None,
+) -> PayloadResult:
     """
     Perform a series of checks on the proposal address.
     This function orchestrates the execution of various checks on the proposal address,
@@ -199,7 +349,15 @@ def perform_checks(
         source_codes (list[SourceCode]): List of source code files.
         price_feed_providers (list[PriceFeedProviderBase]): List of price feed providers.
         token_providers (list[PriceFeedProviderBase] | None): List of token validation providers.
+        address_table (AddressTable | None): The run's table of address classifications.
+
+    Returns:
+        PayloadResult: The results of the checks.
     """
+    result = PayloadResult(customer=customer, chain=chain, payload=proposal_id)
+    tracer = Tracer()
+    ground_truth_config = QuorumConfiguration().load_customer_config(customer)
+    normalize_whitespace = ground_truth_config.get("diff_normalize_whitespace", False)
 
     # Diff check
     pp.pprint(
@@ -207,9 +365,11 @@ def perform_checks(
         pp.Colors.INFO,
         pp.Heading.HEADING_2,
     )
-    missing_files = Checks.DiffCheck(
-        customer, chain, proposal_id, source_codes
-    ).find_diffs()
+    with tracer.span("check", "DiffCheck", payload=proposal_id):
+        result.diff = Checks.DiffCheck(
+            customer, chain, proposal_id, source_codes, normalize_whitespace
+        ).find_diffs()
+    missing_files = result.diff.missing_sources
     pp.pprint(pp.SEPARATOR_LINE, pp.Colors.INFO)
 
     # Review diff check
@@ -218,14 +378,18 @@ def perform_checks(
         pp.Colors.INFO,
         pp.Heading.HEADING_2,
     )
-    Checks.ReviewDiffCheck(customer, chain, proposal_id, missing_files).find_diffs()
+    with tracer.span("check", "ReviewDiffCheck", payload=proposal_id):
+        result.review_diff = Checks.ReviewDiffCheck(
+            customer, chain, proposal_id, missing_files, normalize_whitespace
+        ).find_diffs()
     pp.pprint(pp.SEPARATOR_LINE, pp.Colors.INFO)
 
     # Global variables check
     pp.pprint("Check 3 - Global variables", pp.Colors.INFO, pp.Heading.HEADING_2)
-    Checks.GlobalVariableCheck(
-        customer, chain, proposal_id, missing_files
-    ).check_global_variables()
+    with tracer.span("check", "GlobalVariableCheck", payload=proposal_id):
+        result.global_variables = Checks.GlobalVariableCheck(
+            customer, chain, proposal_id, missing_files
+        ).check_global_variables()
     pp.pprint(pp.SEPARATOR_LINE, pp.Colors.INFO)
 
     # Feed price check
@@ -234,14 +398,16 @@ def perform_checks(
         pp.Colors.INFO,
         pp.Heading.HEADING_2,
     )
-    Checks.PriceFeedCheck(
-        customer,
-        chain,
-        proposal_id,
-        missing_files,
-        price_feed_providers,
-        token_providers,
-    ).verify_price_feed()
+    with tracer.span("check", "PriceFeedCheck", payload=proposal_id):
+        result.explicit_addresses = Checks.PriceFeedCheck(
+            customer,
+            chain,
+            proposal_id,
+            missing_files,
+            price_feed_providers,
+            token_providers,
+            address_table,
+        ).verify_price_feed()
     pp.pprint(pp.SEPARATOR_LINE, pp.Colors.INFO)
 
     # New listing check
@@ -250,7 +416,9 @@ def perform_checks(
         pp.Colors.INFO,
         pp.Heading.HEADING_2,
     )
-    Checks.NewListingCheck(
-        customer, chain, proposal_id, missing_files
-    ).new_listing_check()
+    with tracer.span("check", "NewListingCheck", payload=proposal_id):
+        result.new_listing = Checks.NewListingCheck(
+            customer, chain, proposal_id, missing_files
+        ).new_listing_check()
     pp.pprint(pp.SEPARATOR_LINE, pp.Colors.INFO)
+    return result
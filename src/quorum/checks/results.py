@@ -0,0 +1,196 @@
+import sys
+import threading
+from enum import StrEnum
+from typing import TextIO
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+from quorum.apis.block_explorers.source_code import SourceCode
+from quorum.apis.multisig.safe_api import MultisigData
+from quorum.utils.chain_enum import Chain
+from quorum.utils.singleton import singleton
+
+
+class FileDiff(BaseModel):
+    """
+    A proposal file deviating from its source of truth counterpart.
+
+    Attributes:
+        proposal_file (str): The name of the file from the proposal.
+        local_file (str): The path to the local file.
+        diff (str): The path to the file containing the diff result.
+    """
+
+    proposal_file: str
+    local_file: str
+    diff: str
+
+
+class DiffResult(BaseModel):
+    """
+    The result of comparing the proposal files with a source of truth repository.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    total_files: int
+    files_with_diffs: list[FileDiff] = Field(default_factory=list)
+    # Checked against the next source of truth, not part of the serialized result
+    missing_sources: list[SourceCode] = Field(default_factory=list, exclude=True)
+
+    @computed_field
+    @property
+    def missing_files(self) -> list[str]:
+        return [source_code.file_name for source_code in self.missing_sources]
+
+    @computed_field
+    @property
+    def identical_files(self) -> int:
+        return self.total_files - len(self.files_with_diffs) - len(self.missing_sources)
+
+    @computed_field
+    @property
+    def passed(self) -> bool:
+        return not self.files_with_diffs and not self.missing_sources
+
+
+class GlobalVariablesResult(BaseModel):
+    """
+    The result of the global variables check.
+
+    Attributes:
+        violations (dict[str, list[str]]): The storage variables of each file, i.e. the global
+            variables neither constant nor immutable.
+    """
+
+    violations: dict[str, list[str]] = Field(default_factory=dict)
+
+    @computed_field
+    @property
+    def passed(self) -> bool:
+        return not self.violations
+
+
+class VerifiedAddress(BaseModel):
+    """
+    An explicit address identified as a price feed or a token by a provider.
+    """
+
+    address: str
+    found_on: str
+    name: str | None = None
+    symbol: str | list | None = None
+    decimals: int | None = None
+
+
+class ExplicitAddressesResult(BaseModel):
+    """
+    The result of the explicit addresses validation.
+    """
+
+    price_feeds: list[VerifiedAddress] = Field(default_factory=list)
+    tokens: list[VerifiedAddress] = Field(default_factory=list)
+    multisigs: list[MultisigData] = Field(default_factory=list)
+    unverified: list[str] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def total_addresses(self) -> int:
+        return (
+            len(self.price_feeds)
+            + len(self.tokens)
+            + len(self.multisigs)
+            + len(self.unverified)
+        )
+
+    @computed_field
+    @property
+    def passed(self) -> bool:
+        return not self.unverified
+
+
+class NewListingResult(BaseModel):
+    """
+    The result of the new listing check.
+
+    Attributes:
+        detected (bool): Whether the payload lists new assets.
+        listings (list[dict]): The new listings retrieved by the LLM.
+        skipped_reason (str | None): Why the listings could not be checked, if they were not.
+    """
+
+    detected: bool = False
+    listings: list[dict] = Field(default_factory=list)
+    skipped_reason: str | None = None
+
+    @computed_field
+    @property
+    def passed(self) -> bool:
+        # Listings whose first deposit could not be checked are not a success
+        if self.skipped_reason:
+            return False
+        return all(
+            listing["approve_indicator"] and listing["supply_indicator"]
+            for listing in self.listings
+        )
+
+
+class PayloadStatus(StrEnum):
+    CHECKED = "checked"
+    NOT_VERIFIED = "not_verified"
+    FETCH_FAILED = "fetch_failed"
+
+
+class PayloadResult(BaseModel):
+    """
+    The results of all checks run on a payload. The checks are None if they did not run.
+    """
+
+    customer: str
+    chain: Chain
+    payload: str
+    status: PayloadStatus = PayloadStatus.CHECKED
+    error: str | None = None
+    diff: DiffResult | None = None
+    review_diff: DiffResult | None = None
+    global_variables: GlobalVariablesResult | None = None
+    explicit_addresses: ExplicitAddressesResult | None = None
+    new_listing: NewListingResult | None = None
+
+
+@singleton
+class ResultStream:
+    """
+    ResultStream writes the results of the payloads as newline-delimited JSON, one line per
+    payload as soon as it is checked, so consumers can process them as they come.
+
+    The stream is disabled until enabled, e.g. by the --format ndjson command line flag.
+    """
+
+    def __init__(self) -> None:
+        self.stream: TextIO | None = None
+        self.__lock = threading.Lock()
+
+    def enable(self, stream: TextIO = sys.stdout) -> None:
+        """
+        Start writing results to the given stream.
+
+        Args:
+            stream (TextIO): The stream to write the results to.
+        """
+        self.stream = stream
+
+    def emit(self, result: PayloadResult) -> None:
+        """
+        Write a result to the stream, if enabled.
+
+        Args:
+            result (PayloadResult): The result of a payload.
+        """
+        if self.stream is None:
+            return
+        line = result.model_dump_json() + "\n"
+        # Payloads checked concurrently must not interleave their lines
+        with self.__lock:
+            self.stream.write(line)
+            self.stream.flush()
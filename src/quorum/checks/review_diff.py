@@ -1,6 +1,7 @@
 import quorum.utils.pretty_printer as pp
 from quorum.apis.block_explorers.source_code import SourceCode
 from quorum.checks.diff import DiffCheck
+from quorum.checks.results import DiffResult
 from quorum.utils.chain_enum import Chain
 
 
@@ -11,10 +12,13 @@ class ReviewDiffCheck(DiffCheck):
         chain: Chain,
         proposal_address: str,
         source_codes: list[SourceCode],
+        normalize_whitespace: bool = False,
     ):
-        super().__init__(customer, chain, proposal_address, source_codes)
+        super().__init__(
+            customer, chain, proposal_address, source_codes, normalize_whitespace
+        )
         self.target_repo = self.customer_folder / "review_module"
 
-    def find_diffs(self) -> list[SourceCode]:
+    def find_diffs(self) -> DiffResult:
         pp.pprint(f"Review repo cloned under: {self.target_repo}", pp.Colors.INFO)
         return super().find_diffs()
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 import quorum.utils.arg_validations as arg_valid
 from quorum.utils.chain_enum import Chain
+from quorum.utils.concurrency import DEFAULT_MAX_PER_HOST, DEFAULT_MAX_WORKERS
 
 
 def to_lower_str(value: str) -> str:
@@ -21,6 +22,7 @@ class Argument(BaseModel):
     help: str
     default: Any | None = None
     nargs: str | None = None
+    action: str | None = None
 
 
 PROTOCOL_NAME_ARGUMENT = Argument(
@@ -121,3 +123,66 @@ CONTRACT_NAME_ARGUMENT = Argument(
     required=True,
     help="The name of the contract to be validated (for example, MyContract.sol).",
 )
+
+
+MAX_WORKERS_ARGUMENT = Argument(
+    name="--max-workers",
+    type=arg_valid.validate_positive_int,
+    required=False,
+    help="Maximum number of payloads fetched and checked concurrently.",
+    default=DEFAULT_MAX_WORKERS,
+)
+
+
+MAX_PER_HOST_ARGUMENT = Argument(
+    name="--max-per-host",
+    type=arg_valid.validate_positive_int,
+    required=False,
+    help="Maximum number of concurrent requests sent to a single block explorer host.",
+    default=DEFAULT_MAX_PER_HOST,
+)
+
+
+HOST_ARGUMENT = Argument(
+    name="--host",
+    type=str,
+    required=False,
+    help="The interface the server listens on, only the local host by default.",
+    default="127.0.0.1",
+)
+
+
+PORT_ARGUMENT = Argument(
+    name="--port",
+    type=int,
+    required=False,
+    help="The port the server listens on.",
+    default=8787,
+)
+
+
+FROM_ID_ARGUMENT = Argument(
+    name="--from-id",
+    type=int,
+    required=False,
+    help="First proposal to check when starting without a saved state. "
+    "By default, only proposals created from now on are checked.",
+)
+
+
+INTERVAL_ARGUMENT = Argument(
+    name="--interval",
+    type=arg_valid.validate_positive_int,
+    required=False,
+    help="Seconds between two polls of the governance.",
+    default=300,
+)
+
+
+ONCE_ARGUMENT = Argument(
+    name="--once",
+    type=None,
+    required=False,
+    help="Poll a single time and exit, e.g. when run from cron.",
+    action="store_true",
+)
@@ -5,7 +5,7 @@ import tempfile
 from pathlib import Path
 
 import quorum.utils.pretty_printer as pp
-from quorum.apis.block_explorers.source_code import SourceCode
+from quorum.apis.block_explorers.source_code import SourceCode, parse_source_codes
 from quorum.checks.proposal_check import run_customer_local_validation
 from quorum.utils.change_directory import change_directory
 
@@ -110,6 +110,7 @@ def get_source_codes(
                 )
                 continue
 
+    parse_source_codes(source_codes)
     return source_codes
 
 
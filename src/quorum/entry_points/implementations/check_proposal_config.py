@@ -19,7 +19,8 @@ def run_config(args: argparse.Namespace) -> None:
     Args:
         args (argparse.Namespace): Command line arguments containing the config data.
                                  Expected to have a 'config' attribute with proposal
-                                 configuration dictionary.
+                                 configuration dictionary, and the 'max_workers' and
+                                 'max_per_host' concurrency limits.
 
     Returns:
         None
@@ -44,4 +45,6 @@ def run_config(args: argparse.Namespace) -> None:
         )
 
     prop_config = ProposalConfig(customers_config=customers_config)
-    run_customer_proposal_validation(prop_config)
+    run_customer_proposal_validation(
+        prop_config, max_workers=args.max_workers, max_per_host=args.max_per_host
+    )
@@ -26,6 +26,8 @@ def run_proposal_id(args: argparse.Namespace) -> None:
         args (argparse.Namespace): Command line arguments containing:
             - customer (str): Name of the customer to validate proposal for
             - proposal_id (str/int): ID of the proposal to validate
+            - max_workers (int): Maximum number of payloads checked concurrently
+            - max_per_host (int): Maximum number of concurrent requests per block explorer host
 
     Raises:
         ValueError: If the provided customer is not supported in CUSTOMER_TO_API mapping
@@ -52,4 +54,6 @@ def run_proposal_id(args: argparse.Namespace) -> None:
         ]
     )
 
-    run_customer_proposal_validation(config)
+    run_customer_proposal_validation(
+        config, max_workers=args.max_workers, max_per_host=args.max_per_host
+    )
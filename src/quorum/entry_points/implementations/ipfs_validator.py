@@ -1,11 +1,9 @@
 import argparse
 from pathlib import Path
 
-import requests
-
 import quorum.utils.pretty_printer as pp
 from quorum.apis.block_explorers.chains_api import ChainAPI
-from quorum.llm.chains.ipfs_validation_chain import IPFSValidationChain
+from quorum.apis.governance.aave_governance import AaveGovernanceAPI
 from quorum.utils.quorum_configuration import QuorumConfiguration
 
 IPFS_CACHE = Path(__file__).parent / ".ipfs_cache"
@@ -18,13 +16,8 @@ def get_raw_ipfs(proposal_id: int) -> str:
         with open(cache) as f:
             return f.read()
 
-    resp = requests.get(
-        "https://raw.githubusercontent.com/bgd-labs/v3-governance-cache/refs/heads/main/cache/"
-        f"1/0x9AEE0B04504CeF83A65AC3f0e838D0593BCb2BC7/proposals/{proposal_id}.json"
-    )
-    resp.raise_for_status()
-
-    proposal_data = resp.json()
+    # Read from the governance cache or its local mirror, like the other proposal lookups
+    proposal_data = AaveGovernanceAPI().get_raw_proposal_data(proposal_id)
     ipfs_content = proposal_data["ipfs"]["description"]
 
     with open(cache, "w") as f:
@@ -80,7 +73,9 @@ def run_ipfs_validator(args: argparse.Namespace):
     # Fetch IPFS content
     ipfs = get_raw_ipfs(args.proposal_id)
 
-    # Initialize the IPFS Validation Chain
+    # Initialize the IPFS Validation Chain (imported here, the LLM stack is slow to load)
+    from quorum.llm.chains.ipfs_validation_chain import IPFSValidationChain
+
     ipfs_validation_chain = IPFSValidationChain()
 
     try:
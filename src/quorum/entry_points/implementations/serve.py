@@ -0,0 +1,225 @@
+import argparse
+import contextlib
+import io
+import json
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import quorum
+import quorum.utils.pretty_printer as pp
+from quorum.apis.block_explorers.ast_cache import ASTCache
+from quorum.apis.multisig.safe_api import SafeAPI
+from quorum.apis.price_feeds import PriceFeedProviderBase
+from quorum.utils.quorum_configuration import QuorumConfiguration
+
+# Commands that can be run as jobs, the others are interactive or write local files
+SERVED_COMMANDS = ("validate-address", "validate-by-id", "validate-batch")
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class JobRequestError(Exception):
+    """
+    Raised when a job request is malformed, e.g. an unknown command or invalid arguments.
+    """
+
+
+class QuorumServer(ThreadingHTTPServer):
+    """
+    A local HTTP server running Quorum commands as jobs in a long-lived process, so that the
+    loaded modules, repository indexes and disk caches stay warm between jobs.
+
+    In-memory caches that never expire (customer configurations, provider lookups and
+    catalogs, Safe lookups) are cleared before each job: they are reloaded from their disk
+    caches, whose TTLs apply as in separate runs.
+
+    Requests are handled concurrently, but jobs run one at a time: commands share
+    process-wide state (configuration flags, rate limits, output directories).
+
+    Attributes:
+        commands (dict): The commands that can be run, by name.
+        jobs_done (int): The number of jobs run since the server started.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], commands: list) -> None:
+        """
+        Args:
+            address (tuple[str, int]): The host and port to listen on.
+            commands (list[Command]): The commands that can be run as jobs.
+        """
+        super().__init__(address, QuorumRequestHandler)
+        self.commands = {command.name: command for command in commands}
+        self.jobs_done = 0
+        self.started_at = time.time()
+        self.job_lock = threading.Lock()
+
+    def parse_job(self, request: Any) -> tuple[Any, argparse.Namespace]:
+        """
+        Parse a job request with the same argument parser as the CLI.
+
+        Args:
+            request (Any): The decoded JSON request, e.g.
+                {"command": "validate-by-id", "args": {"protocol_name": "aave", "proposal_id": 1}}.
+
+        Returns:
+            tuple[Command, argparse.Namespace]: The command to run and its arguments.
+
+        Raises:
+            JobRequestError: If the command is unknown or its arguments are invalid.
+        """
+        if not isinstance(request, dict) or request.get("command") not in self.commands:
+            raise JobRequestError(
+                f"'command' must be one of {sorted(self.commands)}, got {request!r}."
+            )
+        command = self.commands[request["command"]]
+        job_args = request.get("args", {})
+        if not isinstance(job_args, dict):
+            raise JobRequestError("'args' must be an object.")
+
+        argv = []
+        for name, value in job_args.items():
+            argv.append(f"--{name.replace('_', '-')}")
+            argv.extend(str(v) for v in (value if isinstance(value, list) else [value]))
+
+        parser = argparse.ArgumentParser(prog=command.name, exit_on_error=False)
+        # Imported here, the CLI module registers this one
+        from quorum.entry_points.quorum_cli import add_arguments
+
+        add_arguments(parser, command.arguments)
+        errors = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(errors):
+                namespace = parser.parse_args(argv)
+        except (argparse.ArgumentError, SystemExit) as e:
+            message = errors.getvalue().strip() or str(e)
+            raise JobRequestError(message) from e
+        return command, namespace
+
+    def run_job(self, request: Any) -> dict[str, Any]:
+        """
+        Run a job and capture its report.
+
+        Args:
+            request (Any): The decoded JSON request.
+
+        Returns:
+            dict[str, Any]: The job result, with its status, duration and report.
+
+        Raises:
+            JobRequestError: If the request is malformed.
+        """
+        with self.job_lock:
+            command, namespace = self.parse_job(request)
+            buffer: list[str] = []
+            start = time.perf_counter()
+            result = {"command": command.name, "status": "succeeded"}
+            self.clear_caches()
+            with pp.capture_output(buffer):
+                try:
+                    command.func(namespace)
+                    ASTCache().report()
+                except Exception as e:
+                    result.update(status="failed", error=f"{type(e).__name__}: {e}")
+            self.jobs_done += 1
+
+        result["duration_seconds"] = round(time.perf_counter() - start, 3)
+        result["output"] = ANSI_ESCAPE_PATTERN.sub("", "\n".join(buffer))
+        return result
+
+    @staticmethod
+    def clear_caches() -> None:
+        """
+        Clear the in-memory caches left by the previous job, and reset the AST cache
+        counters so that each job reports its own hit rate.
+        """
+        QuorumConfiguration().clear_customer_configs()
+        PriceFeedProviderBase.clear_all_memory()
+        SafeAPI().clear_memory()
+        ASTCache().reset_stats()
+
+
+class QuorumRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the JSON API of a QuorumServer:
+        GET /health: The server status.
+        POST /jobs: Run a job, e.g. {"command": "validate-address", "args": {...}}.
+    """
+
+    server: QuorumServer
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self.__send_json(HTTPStatus.NOT_FOUND, {"error": f"No route {self.path}."})
+            return
+        self.__send_json(
+            HTTPStatus.OK,
+            {
+                "status": "ok",
+                "version": quorum.__version__,
+                "uptime_seconds": round(time.time() - self.server.started_at),
+                "jobs_done": self.server.jobs_done,
+                "commands": sorted(self.server.commands),
+            },
+        )
+
+    def do_POST(self) -> None:
+        if self.path != "/jobs":
+            self.__send_json(HTTPStatus.NOT_FOUND, {"error": f"No route {self.path}."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"null")
+            result = self.server.run_job(request)
+        except (ValueError, JobRequestError) as e:
+            self.__send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        status = (
+            HTTPStatus.OK
+            if result["status"] == "succeeded"
+            else HTTPStatus.INTERNAL_SERVER_ERROR
+        )
+        self.__send_json(status, result)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pp.pprint(f"{self.address_string()} - {format % args}", pp.Colors.INFO)
+
+    def __send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def run_serve(args: argparse.Namespace) -> None:
+    """
+    Run Quorum as a long-lived local server accepting validation jobs over a JSON API.
+
+    Args:
+        args (argparse.Namespace): Command line arguments containing:
+            - host (str): The interface to listen on.
+            - port (int): The port to listen on.
+    """
+    # Imported here, the CLI module registers this one
+    from quorum.entry_points.quorum_cli import COMMAND_REGISTRY
+
+    commands = [c for c in COMMAND_REGISTRY if c.name in SERVED_COMMANDS]
+    server = QuorumServer((args.host, args.port), commands)
+    host, port = server.server_address[:2]
+    pp.pprint(
+        f"Quorum serving on http://{host}:{port} (POST /jobs, GET /health). "
+        "Press Ctrl+C to stop.",
+        pp.Colors.INFO,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pp.pprint("Stopping Quorum server.", pp.Colors.INFO)
+    finally:
+        server.server_close()
@@ -0,0 +1,307 @@
+import argparse
+import time
+from pathlib import Path
+
+import requests
+from pydantic import BaseModel
+
+import quorum.utils.pretty_printer as pp
+from quorum.apis.governance.aave_governance import (
+    CHAIN_ID_TO_CHAIN,
+    FINAL_PROPOSAL_STATES,
+    AaveGovernanceAPI,
+    ChainNotFoundException,
+    ProposalNotFoundException,
+)
+from quorum.apis.governance.data_models import PayloadAddresses, PayloadData
+from quorum.checks.address_classifier import AddressTable
+from quorum.checks.proposal_check import check_payloads, load_customer_config
+from quorum.checks.results import PayloadStatus
+from quorum.entry_points.implementations.check_proposal_id import CUSTOMER_TO_API
+from quorum.utils.concurrency import HostLimiter
+from quorum.utils.json_cache import dump_json, load_json
+from quorum.utils.quorum_configuration import QuorumConfiguration
+
+
+class WatchState(BaseModel):
+    """
+    The progress of a watcher, persisted after every step so a restart does no re-work.
+
+    Attributes:
+        last_proposal_id (int): The highest proposal ID seen.
+        open_proposals (list[int]): Seen proposals not yet in a final state, which may still
+            register new payloads, or with payloads still to be checked.
+        checked_payloads (list[str]): The payloads already checked, as
+            "<chain id>/<payloads controller>/<payload id>".
+        final_attempts (dict[int, int]): The number of polls that found an open proposal in a
+            final state with payloads still to be checked.
+        abandoned_proposals (dict[int, str]): The proposals closed with payloads still to be
+            checked, and why.
+    """
+
+    last_proposal_id: int
+    open_proposals: list[int] = []
+    checked_payloads: list[str] = []
+    final_attempts: dict[int, int] = {}
+    abandoned_proposals: dict[int, str] = {}
+
+
+class ProposalWatcher:
+    """
+    ProposalWatcher polls a customer's governance for new proposals and new payloads, and only
+    checks the payloads it has not checked before.
+
+    Attributes:
+        customer (str): The customer name or identifier.
+        api (AaveGovernanceAPI): The customer's governance API.
+        state_path (Path): The file the watcher's progress is persisted to.
+        max_workers (int): Maximum number of payloads fetched and checked concurrently.
+        max_final_attempts (int): The number of polls a proposal in a final state is kept open
+            for while some of its payloads cannot be checked, defaults to MAX_FINAL_ATTEMPTS.
+    """
+
+    # Two hours at the default interval, e.g. for cancelled proposals never verified
+    MAX_FINAL_ATTEMPTS = 24
+
+    def __init__(
+        self,
+        customer: str,
+        api: AaveGovernanceAPI,
+        state_path: Path | None = None,
+        max_workers: int = 1,
+    ) -> None:
+        self.customer = customer
+        self.api = api
+        self.state_path = state_path or (
+            QuorumConfiguration().main_path / "watch" / f"{customer}.json"
+        )
+        self.max_workers = max_workers
+        self.max_final_attempts = self.MAX_FINAL_ATTEMPTS
+        self.state: WatchState | None = None
+
+    def load_state(self, from_id: int | None = None) -> WatchState:
+        """
+        Resume from the persisted state, or start watching if there is none.
+
+        Args:
+            from_id (int | None): The first proposal to check when there is no state.
+                None to only check the proposals created from now on.
+
+        Returns:
+            WatchState: The watcher's state.
+        """
+        if (raw_state := load_json(self.state_path)) is not None:
+            self.state = WatchState(**raw_state)
+            pp.pprint(
+                f"Resuming after proposal {self.state.last_proposal_id} "
+                f"({len(self.state.open_proposals)} open proposals).",
+                pp.Colors.INFO,
+            )
+            return self.state
+
+        if from_id is None:
+            from_id = self.api.get_latest_proposal_id() + 1
+        self.state = WatchState(last_proposal_id=from_id - 1)
+        self.__save()
+        pp.pprint(f"Watching proposals from {from_id}.", pp.Colors.INFO)
+        return self.state
+
+    def poll(self) -> int:
+        """
+        Detect new proposals and check the unseen payloads of the open ones.
+
+        Returns:
+            int: The number of payloads checked.
+        """
+        state = self.state or self.load_state()
+        latest_id = self.api.get_latest_proposal_id(state.last_proposal_id)
+        if latest_id > state.last_proposal_id:
+            new_ids = range(state.last_proposal_id + 1, latest_id + 1)
+            pp.pprint(
+                f"New proposals: {', '.join(map(str, new_ids))}", pp.Colors.SUCCESS
+            )
+            state.open_proposals.extend(new_ids)
+            state.last_proposal_id = latest_id
+            self.__save()
+
+        checked = 0
+        providers = None
+        address_table = AddressTable()
+        for proposal_id in list(state.open_proposals):
+            try:
+                proposal = self.api.get_proposal_data(proposal_id).proposal
+            except ProposalNotFoundException as e:
+                pp.pprint(e, pp.Colors.FAILURE)
+                continue
+            if proposal is None:
+                continue
+
+            pending: list[str] = []
+            for payload in proposal.payloads:
+                key = self.__payload_key(payload)
+                if key in state.checked_payloads:
+                    continue
+                # The repositories are only updated when there is something to check
+                providers = providers or load_customer_config(self.customer)
+                reason = self.__check_payload(
+                    proposal_id, payload, providers, address_table
+                )
+                if reason is None:
+                    checked += 1
+                    state.checked_payloads.append(key)
+                    self.__save()
+                else:
+                    pending.append(reason)
+
+            if proposal.state in FINAL_PROPOSAL_STATES:
+                self.__close(proposal_id, pending)
+
+        if checked:
+            address_table.report()
+        return checked
+
+    def __check_payload(
+        self,
+        proposal_id: int,
+        payload: PayloadData,
+        providers: tuple,
+        address_table: AddressTable,
+    ) -> str | None:
+        """
+        Check the addresses of a payload.
+
+        Returns:
+            str | None: Why the payload must be checked again on the next poll, e.g. if it is
+                not verified yet or could not be fetched, None when it is done with.
+        """
+        chain = CHAIN_ID_TO_CHAIN.get(payload.chain)
+        if chain is None:
+            pp.pprint(
+                f"Proposal {proposal_id}: skipping payload {payload.payload_id} on "
+                f"unsupported chain id {payload.chain}.",
+                pp.Colors.WARNING,
+            )
+            return None
+        try:
+            addresses = self.api.get_payload_addresses(
+                payload.chain, payload.payloads_controller, payload.payload_id
+            )
+        except ChainNotFoundException as e:
+            pp.pprint(e, pp.Colors.FAILURE)
+            return f"payload {payload.payload_id}: not in the governance cache"
+
+        pp.pprint(
+            f"Proposal {proposal_id}: checking payload {payload.payload_id} on {chain}",
+            pp.Colors.INFO,
+            pp.Heading.HEADING_1,
+        )
+        price_feed_providers, token_providers = providers
+        results = check_payloads(
+            customer=self.customer,
+            payload_addresses=[PayloadAddresses(chain=chain, addresses=addresses)],
+            price_feed_providers=price_feed_providers,
+            token_providers=token_providers,
+            max_workers=self.max_workers,
+            address_table=address_table,
+        )
+        statuses = sorted(
+            {
+                result.status
+                for result in results
+                if result.status != PayloadStatus.CHECKED
+            }
+        )
+        if statuses:
+            pp.pprint(
+                f"Proposal {proposal_id}: payload {payload.payload_id} will be checked "
+                "again on the next poll.",
+                pp.Colors.WARNING,
+            )
+            return f"payload {payload.payload_id}: {', '.join(statuses)}"
+        return None
+
+    def __close(self, proposal_id: int, pending: list[str]) -> None:
+        """
+        Stop watching a proposal in a final state once all of its payloads are checked, or
+        after max_final_attempts polls failed to check them.
+
+        Args:
+            proposal_id (int): The proposal in a final state.
+            pending (list[str]): Why each of its payloads left must be checked again.
+        """
+        state = self.state
+        if pending:
+            attempts = state.final_attempts.get(proposal_id, 0) + 1
+            if attempts < self.max_final_attempts:
+                state.final_attempts[proposal_id] = attempts
+                self.__save()
+                return
+            reason = f"not checked after {attempts} polls, {'; '.join(pending)}"
+            state.abandoned_proposals[proposal_id] = reason
+            pp.pprint(
+                f"Proposal {proposal_id}: no longer watched, {reason}.",
+                pp.Colors.FAILURE,
+            )
+        state.final_attempts.pop(proposal_id, None)
+        state.open_proposals.remove(proposal_id)
+        self.__save()
+
+    def __save(self) -> None:
+        dump_json(self.state_path, self.state.model_dump())
+
+    @staticmethod
+    def __payload_key(payload: PayloadData) -> str:
+        return f"{payload.chain}/{payload.payloads_controller}/{payload.payload_id}"
+
+
+def run_watch(args: argparse.Namespace) -> None:
+    """
+    Watch a customer's governance and check the payloads of new proposals as they appear.
+
+    Args:
+        args (argparse.Namespace): Command line arguments containing:
+            - protocol_name (str): Name of the customer to watch.
+            - from_id (int | None): First proposal to check when starting without a state.
+            - interval (int): Seconds between two polls.
+            - once (bool): Poll a single time and exit, raising if the poll fails.
+            - max_workers (int): Maximum number of payloads checked concurrently.
+            - max_per_host (int): Maximum number of concurrent requests per block
+              explorer host.
+
+    Raises:
+        ValueError: If the provided customer is not supported in CUSTOMER_TO_API mapping.
+    """
+    customer = args.protocol_name
+    if customer not in CUSTOMER_TO_API:
+        raise ValueError(
+            f"Customer '{customer}' is not supported. Supported customers: {list(CUSTOMER_TO_API.keys())}."
+        )
+
+    HostLimiter().set_max_per_host(args.max_per_host)
+    watcher = ProposalWatcher(
+        customer, CUSTOMER_TO_API[customer], max_workers=args.max_workers
+    )
+    watcher.load_state(args.from_id)
+    try:
+        while True:
+            try:
+                checked = watcher.poll()
+            except (requests.RequestException, ValueError) as e:
+                # A single poll failing must not stop a long-running watcher
+                if args.once:
+                    raise
+                pp.pprint(
+                    f"Poll failed, retrying in {args.interval}s: {type(e).__name__}: {e}",
+                    pp.Colors.FAILURE,
+                )
+            else:
+                pp.pprint(
+                    f"Poll done: {checked} new payloads checked, "
+                    f"{len(watcher.state.open_proposals)} open proposals.",
+                    pp.Colors.INFO,
+                )
+            if args.once:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pp.pprint("Stopping the watcher, it will resume from here.", pp.Colors.INFO)
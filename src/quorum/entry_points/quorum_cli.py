@@ -1,20 +1,30 @@
 # Quorum/entry_points/quorum_cli.py
 
 import argparse
+import sys
 from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
 
 import argcomplete
 from pydantic import BaseModel
 
 import quorum
 import quorum.entry_points.cli_arguments as cli_args
+import quorum.utils.pretty_printer as pp
+from quorum.apis.block_explorers.ast_cache import ASTCache
+from quorum.checks.results import ResultStream
 from quorum.entry_points.implementations.check_local_proposal import run_local_proposal
 from quorum.entry_points.implementations.check_proposal import run_single
 from quorum.entry_points.implementations.check_proposal_config import run_config
 from quorum.entry_points.implementations.check_proposal_id import run_proposal_id
 from quorum.entry_points.implementations.create_report import run_create_report
 from quorum.entry_points.implementations.ipfs_validator import run_ipfs_validator
+from quorum.entry_points.implementations.serve import run_serve
 from quorum.entry_points.implementations.setup_quorum import run_setup_quorum
+from quorum.entry_points.implementations.watch import run_watch
+from quorum.utils.quorum_configuration import QuorumConfiguration
+from quorum.utils.tracing import Tracer
 
 
 class Command(BaseModel):
@@ -44,13 +54,22 @@ COMMAND_REGISTRY = [
     Command(
         name="validate-batch",
         help="Run a batch check from a JSON config file.",
-        arguments=[cli_args.CONFIG_ARGUMENT],
+        arguments=[
+            cli_args.CONFIG_ARGUMENT,
+            cli_args.MAX_WORKERS_ARGUMENT,
+            cli_args.MAX_PER_HOST_ARGUMENT,
+        ],
         func=run_config,
     ),
     Command(
         name="validate-by-id",
         help="Validate a single on-chain proposal by passing the protocol name and id.",
-        arguments=[cli_args.PROTOCOL_NAME_ARGUMENT, cli_args.PROPOSAL_ID_ARGUMENT],
+        arguments=[
+            cli_args.PROTOCOL_NAME_ARGUMENT,
+            cli_args.PROPOSAL_ID_ARGUMENT,
+            cli_args.MAX_WORKERS_ARGUMENT,
+            cli_args.MAX_PER_HOST_ARGUMENT,
+        ],
         func=run_proposal_id,
     ),
     Command(
@@ -86,6 +105,25 @@ COMMAND_REGISTRY = [
         ],
         func=run_local_proposal,
     ),
+    Command(
+        name="serve",
+        help="Run a local server accepting validation jobs over a JSON API, with warm caches.",
+        arguments=[cli_args.HOST_ARGUMENT, cli_args.PORT_ARGUMENT],
+        func=run_serve,
+    ),
+    Command(
+        name="watch",
+        help="Watch a protocol's governance and validate the payloads of new proposals.",
+        arguments=[
+            cli_args.PROTOCOL_NAME_ARGUMENT,
+            cli_args.FROM_ID_ARGUMENT,
+            cli_args.INTERVAL_ARGUMENT,
+            cli_args.ONCE_ARGUMENT,
+            cli_args.MAX_WORKERS_ARGUMENT,
+            cli_args.MAX_PER_HOST_ARGUMENT,
+        ],
+        func=run_watch,
+    ),
 ]
 
 
@@ -100,11 +138,30 @@ def add_arguments(
         arguments (List[Argument]): A list of Argument instances to add.
     """
     for arg in arguments:
-        arg_dict = arg.model_dump()
+        arg_dict = arg.model_dump(exclude_none=True)
         name = arg_dict.pop("name")
         parser.add_argument(name, **arg_dict)
 
 
+def write_profile(trace_file: str) -> None:
+    """
+    Print the profile of the run and write its Chrome trace.
+
+    Args:
+        trace_file (str): The trace file path, empty for a timestamped file under
+            QUORUM_PATH/profiles.
+    """
+    if trace_file:
+        path = Path(trace_file)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = QuorumConfiguration().main_path / "profiles" / f"trace_{timestamp}.json"
+    tracer = Tracer()
+    tracer.report()
+    tracer.write_chrome_trace(path)
+    pp.pprint(f"Trace written to {path}", pp.Colors.INFO)
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="Quorum",
@@ -113,6 +170,33 @@ def main():
     parser.add_argument(
         "-v", "--version", action="version", version=f"%(prog)s {quorum.__version__}"
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never download solc compilers nor clone or update repositories, "
+        "only use what is available locally.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached explorer responses and recently updated repositories, "
+        "fetch them again.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson"],
+        default="text",
+        help="Output format. ndjson writes one JSON result per checked payload to the "
+        "standard output, as soon as it is checked, and the report to the standard error.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="TRACE_FILE",
+        help="Time the stages of the run, print a summary and write a Chrome trace "
+        "(open it in ui.perfetto.dev), by default under $QUORUM_PATH/profiles.",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Iterate over the registry to add subcommands
@@ -125,8 +209,25 @@ def main():
 
     args = parser.parse_args()
 
+    if args.offline:
+        QuorumConfiguration().offline = True
+    if args.refresh:
+        QuorumConfiguration().refresh = True
+    if args.format == "ndjson":
+        pp.set_output_stream(sys.stderr)
+        ResultStream().enable(sys.stdout)
+
+    if args.profile is not None:
+        Tracer().enable()
+
     # Dispatch to the appropriate function
-    args.func(args)
+    try:
+        args.func(args)
+    finally:
+        if args.profile is not None:
+            write_profile(args.profile)
+
+    ASTCache().report()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field
 
 from quorum.llm.chains.cached_llm import CachedLLM
 from quorum.llm.jinja_utils import render_prompt
+from quorum.utils.tracing import traced
 
 
 class ListingDetails(BaseModel):
@@ -69,6 +70,7 @@ class FirstDepositChain(CachedLLM):
 
         self.app = prompt | structured_llm
 
+    @traced("llm")
     def execute(
         self, source_code: str, prompt_template: str = "first_deposit_prompt.j2"
     ) -> ListingArray | None:
@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from quorum.llm.chains.cached_llm import CachedLLM
 from quorum.llm.jinja_utils import render_prompt
+from quorum.utils.tracing import traced
 
 
 class Incompatibility(BaseModel):
@@ -77,6 +78,7 @@ class IPFSValidationChain(CachedLLM):
         response = self.llm.invoke(messages)
         return {"messages": response}
 
+    @traced("llm")
     def execute(
         self, prompt_templates: list[str], ipfs: str, payload: str, thread_id: int = 1
     ) -> IncompatibilityArray:
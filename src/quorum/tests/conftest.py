@@ -5,6 +5,7 @@ from pathlib import Path
 import json5 as json
 import pytest
 
+from quorum.apis.block_explorers.ast_cache import ASTCache
 from quorum.apis.block_explorers.source_code import SourceCode
 from quorum.utils.quorum_configuration import QuorumConfiguration
 
@@ -13,6 +14,18 @@ EXPECTED_DIR = Path(__file__).parent / "expected"
 SOURCE_CODES_DIR = RESOURCES_DIR / "source_codes"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_ast_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Path, None, None]:
+    # Expected ASTs come from per-file parsing, never serve ASTs cached by real runs
+    cache = ASTCache()
+    og_cache_dir = cache.cache_dir
+    cache.cache_dir = tmp_path_factory.mktemp("ast_cache")
+    yield cache.cache_dir
+    cache.cache_dir = og_cache_dir
+
+
 @pytest.fixture
 def source_codes(request: pytest.FixtureRequest) -> list[SourceCode]:
     sources_dir: Path = SOURCE_CODES_DIR / request.param
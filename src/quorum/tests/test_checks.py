@@ -1,3 +1,5 @@
+import io
+import json as std_json
 from pathlib import Path
 
 import pytest
@@ -5,8 +7,11 @@ import pytest
 import quorum.checks as Checks
 import quorum.tests.conftest as conftest
 from quorum.apis.block_explorers.source_code import SourceCode
+from quorum.apis.git_api.repo_index import RepoIndex, content_hash
 from quorum.apis.price_feeds import ChainLinkAPI
+from quorum.checks.results import NewListingResult, PayloadResult, ResultStream
 from quorum.utils.chain_enum import Chain
+from quorum.utils.quorum_configuration import QuorumConfiguration
 
 
 @pytest.mark.parametrize(
@@ -16,7 +21,8 @@ def test_diff(source_codes: list[SourceCode], tmp_output_path: Path):
     diff_check = Checks.DiffCheck("Aave", Chain.ETH, "", source_codes)
     diff_check.target_repo = conftest.RESOURCES_DIR / "clones/Aave/modules"
 
-    missing_files = diff_check.find_diffs()
+    result = diff_check.find_diffs()
+    missing_files = result.missing_sources
 
     assert len(missing_files) == 1
     assert (
@@ -26,6 +32,36 @@ def test_diff(source_codes: list[SourceCode], tmp_output_path: Path):
 
     diffs = [p.stem for p in diff_check.check_folder.rglob("*.patch")]
     assert sorted(diffs) == sorted(["AggregatorInterface", "AaveV2Ethereum", "AaveV2"])
+    assert result.identical_files == len(source_codes) - 4
+    assert not result.passed
+
+
+@pytest.mark.parametrize(
+    "source_codes", ["ETH/0xAD6c03BF78A3Ee799b86De5aCE32Bb116eD24637"], indirect=True
+)
+def test_result_stream(source_codes: list[SourceCode], tmp_output_path: Path):
+    diff_check = Checks.DiffCheck("Aave", Chain.ETH, "0x1", source_codes)
+    diff_check.target_repo = conftest.RESOURCES_DIR / "clones/Aave/modules"
+    result = PayloadResult(customer="Aave", chain=Chain.ETH, payload="0x1")
+    result.diff = diff_check.find_diffs()
+
+    stream = io.StringIO()
+    result_stream = ResultStream()
+    result_stream.enable(stream)
+    try:
+        result_stream.emit(result)
+        result_stream.emit(result)
+    finally:
+        result_stream.stream = None
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    emitted = std_json.loads(lines[0])
+    assert (emitted["chain"], emitted["status"]) == (Chain.ETH, "checked")
+    assert emitted["diff"]["missing_files"] == result.diff.missing_files
+    assert len(emitted["diff"]["files_with_diffs"]) == 3
+    assert "missing_sources" not in emitted["diff"]
+    assert emitted["global_variables"] is None
 
 
 @pytest.mark.parametrize("source_codes", ["bad_global_variables"], indirect=True)
@@ -33,13 +69,14 @@ def test_global_variables(source_codes: list[SourceCode], tmp_output_path: Path)
     global_variables_check = Checks.GlobalVariableCheck(
         "Aave", Chain.ETH, "", source_codes
     )
-    global_variables_check.check_global_variables()
+    result = global_variables_check.check_global_variables()
 
     bad_files = [p.stem for p in global_variables_check.check_folder.iterdir()]
     assert len(bad_files) == 2
     assert sorted(bad_files) == sorted(
         ["AaveV2Ethereum", "AaveV2Ethereum_ReserveFactorUpdatesMidJuly_20240711"]
     )
+    assert len(result.violations) == 2
 
 
 @pytest.mark.parametrize(
@@ -64,3 +101,53 @@ def test_new_listing(source_codes: list[SourceCode], tmp_output_path: Path):
     new_listing_check.new_listing_check()
 
     assert next(new_listing_check.check_folder.iterdir(), None) is None
+
+
+def test_new_listing_unparsable_source(tmp_output_path: Path):
+    # No compiler can parse this source, so it has no AST to look for listings in
+    source_code = SourceCode("Unparsable.sol", ["pragma solidity 99.0.0;"])
+    config = QuorumConfiguration()
+    config.offline = True
+    try:
+        result = Checks.NewListingCheck(
+            "Aave", Chain.ETH, "", [source_code]
+        ).new_listing_check()
+    finally:
+        config.offline = False
+    assert source_code.get_functions() is None
+    assert not result.detected
+
+
+def test_new_listing_skipped_not_passed():
+    result = NewListingResult(detected=True, skipped_reason="LLM unavailable")
+    assert not result.passed
+    assert std_json.loads(result.model_dump_json())["passed"] is False
+    assert NewListingResult().passed
+
+
+def test_repo_index_resolution():
+    repo = conftest.RESOURCES_DIR / "clones/Aave/modules"
+    index = RepoIndex(repo)
+
+    # Every file resolves to itself from any of its path suffixes
+    for local_file in repo.rglob("*.sol"):
+        relative = local_file.relative_to(repo)
+        assert index.find_most_common_path(relative) == local_file
+        assert index.find_most_common_path(Path("proposal", *relative.parts)) == (
+            local_file
+        )
+    assert index.find_most_common_path(Path("src/DoesNotExist.sol")) is None
+
+
+def test_content_hash_normalization(tmp_path: Path):
+    lines = ["contract A {", "    uint256 x;", "}"]
+    reformatted = ["contract A {", "", "\tuint256  x;  ", "}"]
+    # A local file with CRLF line endings and a trailing newline matches the explorer's
+    # content without normalization
+    local_file = tmp_path / "A.sol"
+    local_file.write_bytes(b"contract A {\r\n    uint256 x;\r\n}\r\n")
+    assert RepoIndex(tmp_path).file_hash(local_file) == content_hash(lines)
+    assert content_hash(lines) != content_hash(reformatted)
+    assert content_hash(lines, normalize_whitespace=True) == content_hash(
+        reformatted, normalize_whitespace=True
+    )
@@ -0,0 +1,158 @@
+import threading
+import time
+
+import pytest
+
+import quorum.checks.proposal_check as proposal_check
+import quorum.utils.pretty_printer as pp
+from quorum.apis.governance.data_models import PayloadAddresses
+from quorum.checks.results import PayloadResult
+from quorum.utils.chain_enum import Chain
+from quorum.utils.concurrency import HostLimiter, HostSlots, map_concurrently
+from quorum.utils.http_transport import DEFAULT_POOL_SIZE, HTTPTransport
+from quorum.utils.rate_limiter import (
+    DEFAULT_RATE,
+    MIN_RATE,
+    RateLimiter,
+    TokenBucket,
+    is_rate_limit_response,
+)
+
+
+def test_map_concurrently_keeps_order():
+    def slow_square(x: int) -> int:
+        time.sleep(0.01 * (5 - x))
+        return x * x
+
+    assert map_concurrently(slow_square, range(5), max_workers=5) == [
+        0,
+        1,
+        4,
+        9,
+        16,
+    ]
+
+
+def _peak_concurrency(limiter: HostSlots, url: str) -> int:
+    in_flight, peak = 0, 0
+    lock = threading.Lock()
+
+    def request(_: int) -> None:
+        nonlocal in_flight, peak
+        with limiter.limit(url):
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+
+    map_concurrently(request, range(8), max_workers=8)
+    return peak
+
+
+def test_host_limiter_caps_concurrent_requests():
+    limiter = HostLimiter()
+    limiter.set_max_per_host(2)
+    assert _peak_concurrency(limiter, "https://api.etherscan.io/v2/api?chainid=1") == 2
+
+
+def test_transport_host_slots_sized_to_pool():
+    # The explorer cap does not apply to the other clients of the transport
+    HostLimiter().set_max_per_host(2)
+    host_slots = HTTPTransport().host_slots
+    assert host_slots.max_per_host == DEFAULT_POOL_SIZE
+    assert _peak_concurrency(host_slots, "https://api.coingecko.com/api/v3") == 8
+    assert _peak_concurrency(HostSlots(4), "https://example.org/api") == 4
+
+
+def test_capture_output(capsys):
+    buffer: list[str] = []
+    with pp.capture_output(buffer):
+        pp.pprint("captured", pp.Colors.INFO)
+    assert capsys.readouterr().out == ""
+
+    pp.flush_output(buffer)
+    assert "captured" in capsys.readouterr().out
+    assert buffer == []
+
+
+def test_check_payloads_reports_finished_payloads_on_error(
+    capsys, monkeypatch: pytest.MonkeyPatch
+):
+    second_done = threading.Event()
+
+    def check_payload(proposal_address: str, **_) -> PayloadResult:
+        pp.pprint(f"checking {proposal_address}", pp.Colors.INFO)
+        if proposal_address == "0x1":
+            second_done.wait()
+            raise ValueError("explorer error")
+        second_done.set()
+        return PayloadResult(customer="aave", chain=Chain.ETH, payload=proposal_address)
+
+    monkeypatch.setattr(proposal_check, "ChainAPI", lambda chain: None)
+    monkeypatch.setattr(proposal_check, "check_payload", check_payload)
+    with pytest.raises(ValueError, match="explorer error"):
+        proposal_check.check_payloads(
+            customer="aave",
+            payload_addresses=[
+                PayloadAddresses(chain=Chain.ETH, addresses=["0x1", "0x2"])
+            ],
+            price_feed_providers=[],
+            max_workers=2,
+        )
+    out = capsys.readouterr().out
+    assert "checking 0x1" in out
+    assert out.index("checking 0x1") < out.index("checking 0x2")
+
+
+def test_token_bucket_aimd():
+    bucket = TokenBucket(max_rate=20.0)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    # The first request is immediate, the next four are spaced by 1/20s
+    assert time.monotonic() - start >= 4 / 20 * 0.9
+
+    bucket.on_rate_limited()
+    assert bucket.rate == 10.0
+    for _ in range(200):
+        bucket.on_success()
+    assert bucket.rate == bucket.max_rate
+
+
+def test_rate_limiter_rate(monkeypatch):
+    for value, expected in (
+        ("2.5", 2.5),
+        ("0", MIN_RATE),
+        ("-3", MIN_RATE),
+        ("fast", DEFAULT_RATE),
+        ("nan", DEFAULT_RATE),
+    ):
+        monkeypatch.setenv("QUORUM_EXPLORER_RATE_LIMIT", value)
+        assert type(RateLimiter())().default_rate == expected
+
+    monkeypatch.delenv("QUORUM_EXPLORER_RATE_LIMIT")
+    assert type(RateLimiter())().default_rate == DEFAULT_RATE
+
+
+def test_rate_limit_response_detection():
+    assert is_rate_limit_response(
+        {"status": "0", "message": "NOTOK", "result": "Max rate limit reached"}
+    )
+    assert not is_rate_limit_response(
+        {
+            "status": "0",
+            "message": "NOTOK",
+            "result": "Contract source code not verified",
+        }
+    )
+    assert not is_rate_limit_response({"jsonrpc": "2.0", "id": 1, "result": "0x60"})
+
+
+def test_http_transport_is_shared():
+    transport = HTTPTransport()
+    assert transport is HTTPTransport()
+    assert transport.session.get_adapter("https://example.org")._pool_maxsize == (
+        DEFAULT_POOL_SIZE
+    )
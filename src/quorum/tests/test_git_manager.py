@@ -0,0 +1,150 @@
+from collections.abc import Generator
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from quorum.apis.git_api.git_manager import FRESHNESS_STAMP, GitManager, RepoConfig
+from quorum.utils.quorum_configuration import (
+    DEFAULT_REPO_TTL_MINUTES,
+    QuorumConfiguration,
+)
+
+
+@pytest.fixture
+def origin_repo(tmp_path: Path) -> Path:
+    origin = tmp_path / "origin"
+    repo = Repo.init(origin, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Quorum")
+        config.set_value("user", "email", "quorum@example.org")
+        config.set_value("uploadpack", "allowFilter", "true")
+    (origin / "src").mkdir()
+    (origin / "docs").mkdir()
+    for i in range(3):
+        (origin / "src" / "Payload.sol").write_text(f"contract Payload{i} {{}}\n")
+        (origin / "docs" / "README.md").write_text(f"v{i}\n")
+        repo.index.add(["src/Payload.sol", "docs/README.md"])
+        repo.index.commit(f"commit {i}")
+    return origin
+
+
+@pytest.fixture
+def _no_repo_ttl() -> Generator[None, None, None]:
+    config = QuorumConfiguration()
+    og_ttl = config.repo_ttl
+    config.repo_ttl = timedelta(0)
+    yield
+    config.repo_ttl = og_ttl
+
+
+def commit_payload(origin_repo: Path, content: str) -> None:
+    origin = Repo(origin_repo)
+    (origin_repo / "src" / "Payload.sol").write_text(content)
+    origin.index.add(["src/Payload.sol"])
+    origin.index.commit(content)
+
+
+def test_repo_config_entries():
+    assert RepoConfig.from_entry("https://github.com/org/repo#dev") == RepoConfig(
+        url="https://github.com/org/repo", branch="dev"
+    )
+    config = RepoConfig.from_entry(
+        {"url": "https://github.com/org/repo.git", "depth": 1, "filter": "blob:none"}
+    )
+    assert (config.name, config.depth, config.filter) == ("repo", 1, "blob:none")
+
+
+def test_repo_ttl(monkeypatch: pytest.MonkeyPatch):
+    default = timedelta(minutes=DEFAULT_REPO_TTL_MINUTES)
+    for value, expected in (
+        ("30", timedelta(minutes=30)),
+        ("0", timedelta(0)),
+        ("-5", default),
+        ("ten", default),
+        ("inf", default),
+    ):
+        monkeypatch.setenv("QUORUM_REPO_TTL_MINUTES", value)
+        assert type(QuorumConfiguration())().repo_ttl == expected
+
+
+@pytest.mark.usefixtures("_no_repo_ttl")
+def test_shallow_sparse_clone(origin_repo: Path, tmp_output_path: Path):
+    entry = {
+        "url": origin_repo.as_uri(),
+        "depth": 1,
+        "filter": "blob:none",
+        "sparse_checkout": ["src/**/*.sol"],
+    }
+    git_manager = GitManager("Test", {"dev_repos": [entry]})
+    git_manager.clone_or_update()
+
+    clone_path = git_manager.modules_path / "origin"
+    clone = Repo(clone_path)
+    assert (clone_path / "src" / "Payload.sol").exists()
+    assert not (clone_path / "docs").exists()
+    assert len(list(clone.iter_commits())) == 1
+
+    # Updates keep the clone shallow
+    commit_payload(origin_repo, "contract Payload3 {}\n")
+    git_manager.clone_or_update()
+    assert (clone_path / "src" / "Payload.sol").read_text() == "contract Payload3 {}\n"
+    assert len(list(clone.iter_commits())) == 1
+
+
+def test_freshness_stamps(origin_repo: Path, tmp_output_path: Path):
+    config = QuorumConfiguration()
+    git_manager = GitManager("Test", {"dev_repos": [origin_repo.as_uri()]})
+    git_manager.clone_or_update()
+    clone_path = git_manager.modules_path / "origin"
+    payload = clone_path / "src" / "Payload.sol"
+    assert (clone_path / ".git" / FRESHNESS_STAMP).exists()
+
+    # Within the TTL the clone is not updated
+    commit_payload(origin_repo, "contract Payload3 {}\n")
+    git_manager.clone_or_update()
+    assert payload.read_text() == "contract Payload2 {}\n"
+
+    config.refresh = True
+    try:
+        # Offline mode never touches the network
+        config.offline = True
+        git_manager.clone_or_update()
+        assert payload.read_text() == "contract Payload2 {}\n"
+
+        config.offline = False
+        git_manager.clone_or_update()
+        assert payload.read_text() == "contract Payload3 {}\n"
+    finally:
+        config.offline = config.refresh = False
+
+
+@pytest.mark.usefixtures("_no_repo_ttl")
+def test_shallow_update_keeps_local_changes(origin_repo: Path, tmp_output_path: Path):
+    git_manager = GitManager(
+        "Test", {"dev_repos": [{"url": origin_repo.as_uri(), "depth": 1}]}
+    )
+    git_manager.clone_or_update()
+    clone_path = git_manager.modules_path / "origin"
+    clone = Repo(clone_path)
+    with clone.config_writer() as config:
+        config.set_value("user", "name", "Quorum")
+        config.set_value("user", "email", "quorum@example.org")
+
+    # A local commit is not reset away
+    commit_payload(clone_path, "contract Local {}\n")
+    commit_payload(origin_repo, "contract Payload3 {}\n")
+    git_manager.clone_or_update()
+    assert clone.head.commit.message == "contract Local {}\n"
+
+    # Neither are uncommitted changes
+    clone.git.reset("--hard", "@{upstream}")
+    (clone_path / "src" / "Payload.sol").write_text("contract Edited {}\n")
+    git_manager.clone_or_update()
+    assert (clone_path / "src" / "Payload.sol").read_text() == "contract Edited {}\n"
+
+    # A clean clone is updated
+    clone.git.checkout("--", ".")
+    git_manager.clone_or_update()
+    assert (clone_path / "src" / "Payload.sol").read_text() == "contract Payload3 {}\n"
@@ -0,0 +1,134 @@
+import json
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from quorum.apis.governance.aave_governance import (
+    PROPOSALS_PATH,
+    AaveGovernanceAPI,
+    ProposalNotFoundException,
+)
+from quorum.apis.governance.governance_mirror import (
+    GOVERNANCE_CACHE_REPO,
+    GovernanceCacheMirror,
+)
+from quorum.utils.chain_enum import Chain
+from quorum.utils.json_cache import dump_json
+from quorum.utils.quorum_configuration import QuorumConfiguration
+
+CONTROLLER = "0xdAbad81aF85554E9ae636395611C58F7eC1aAEc5"
+
+
+def cache_proposal(cache_dir: Path, proposal_id: int, state: int, age: float) -> None:
+    proposal_file = cache_dir / "proposals" / f"{proposal_id}.json"
+    dump_json(
+        proposal_file,
+        {
+            "proposal": {
+                "state": state,
+                "payloads": [
+                    {"chain": "1", "payloadsController": CONTROLLER, "payloadId": i}
+                    for i in range(3)
+                ],
+                "votingPortal": None,
+                "ipfsHash": None,
+                "accessLevel": 1,
+            }
+        },
+    )
+    mtime = time.time() - age
+    os.utime(proposal_file, (mtime, mtime))
+    for i in range(3):
+        dump_json(
+            cache_dir / "payloads" / "1" / CONTROLLER / f"{i}.json",
+            {"payload": {"actions": [{"target": f"0x{i:040x}"}]}},
+        )
+
+
+def test_governance_cache(tmp_cache: Path):
+    api = AaveGovernanceAPI()
+    api.cache_dir = tmp_cache
+
+    # Executed proposals are served from the cache however old they are
+    cache_proposal(tmp_cache, 100, state=4, age=365 * 24 * 3600)
+    payloads = api.get_all_payloads_addresses(100)
+    assert [p.chain for p in payloads] == [Chain.ETH] * 3
+    assert [p.addresses for p in payloads] == [[f"0x{i:040x}"] for i in range(3)]
+    assert api.get_proposal_data(100).proposal.state == 4
+
+    # Active proposals are served from the cache while they are fresh
+    cache_proposal(tmp_cache, 101, state=2, age=60)
+    assert api.get_proposal_data(101).proposal.state == 2
+
+
+def test_governance_mirror(tmp_cache: Path):
+    config = QuorumConfiguration()
+    mirror = GovernanceCacheMirror()
+    og_path = mirror.path
+    mirror.path = tmp_cache
+    dump_json(
+        mirror.cache_path / PROPOSALS_PATH / "7.json",
+        {
+            "ipfs": {"title": "Mirrored"},
+            "proposal": {"votingPortal": None, "ipfsHash": None, "accessLevel": 1},
+        },
+    )
+    # Offline, the mirror is read as it is without being updated
+    config.governance_mirror, config.offline = True, True
+    try:
+        api = AaveGovernanceAPI()
+        assert api.get_proposal_data(7).ipfs.title == "Mirrored"
+        with pytest.raises(ProposalNotFoundException, match="local mirror"):
+            api.get_proposal_data(8)
+    finally:
+        config.governance_mirror, config.offline = False, False
+        mirror.path = og_path
+
+
+def commit_proposal(origin: Path, proposal_id: int) -> None:
+    proposal_file = origin / "cache" / PROPOSALS_PATH / f"{proposal_id}.json"
+    proposal_file.parent.mkdir(parents=True, exist_ok=True)
+    proposal_file.write_text(json.dumps({"proposal": {"id": proposal_id}}))
+    repo = Repo(origin)
+    repo.index.add([str(proposal_file.relative_to(origin))])
+    repo.index.commit(f"proposal {proposal_id}")
+
+
+def test_governance_mirror_updates(tmp_path: Path):
+    origin = tmp_path / GOVERNANCE_CACHE_REPO.name
+    repo = Repo.init(origin, initial_branch="main")
+    with repo.config_writer() as git_config:
+        git_config.set_value("user", "name", "Quorum")
+        git_config.set_value("user", "email", "quorum@example.org")
+        git_config.set_value("uploadpack", "allowFilter", "true")
+    commit_proposal(origin, 1)
+
+    config = QuorumConfiguration()
+    mirror = GovernanceCacheMirror()
+    og_path, og_repo_config, og_ttl = mirror.path, mirror.repo_config, config.repo_ttl
+    mirror.path = tmp_path / "mirror"
+    mirror.repo_config = GOVERNANCE_CACHE_REPO.model_copy(
+        update={"url": origin.as_uri()}
+    )
+    proposal_path = f"{PROPOSALS_PATH}/{{}}.json"
+    try:
+        config.repo_ttl = timedelta(0)
+        assert mirror.read_json(proposal_path.format(1)) == {"proposal": {"id": 1}}
+        assert mirror.read_json(proposal_path.format(2)) is None
+
+        # Proposals created since the last read are seen once the mirror is stale
+        commit_proposal(origin, 2)
+        assert mirror.read_json(proposal_path.format(2)) == {"proposal": {"id": 2}}
+
+        # While it is fresh, the mirror is read as it is
+        config.repo_ttl = timedelta(hours=1)
+        mirror.read_json(proposal_path.format(2))
+        commit_proposal(origin, 3)
+        assert mirror.read_json(proposal_path.format(3)) is None
+    finally:
+        mirror.path, mirror.repo_config = og_path, og_repo_config
+        config.repo_ttl = og_ttl
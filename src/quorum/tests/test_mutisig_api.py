@@ -1,4 +1,6 @@
-from quorum.apis.multisig.safe_api import SafeAPI
+from quorum.apis.multisig.safe_api import MultisigData, SafeAPI
+from quorum.utils.chain_enum import Chain
+from quorum.utils.json_cache import dump_json
 
 # Disable until mulisig API is available
 # def test_safe_api():
@@ -19,3 +21,28 @@ def test_non_multisig():
     api = SafeAPI()
     non_multisig = api.get_multisig_info("0x0000000000000000000000000000000000000000")
     assert non_multisig is None
+
+
+def test_multisig_cache(tmp_cache):
+    api = SafeAPI()
+    og_cache_dir = api.cache_dir
+    api.cache_dir = tmp_cache
+    multisig = MultisigData(
+        address="0x00000000000000000000000000000000000000aA",
+        owners=["0x00000000000000000000000000000000000000bB"],
+        threshold=1,
+    )
+    not_a_safe = "0x00000000000000000000000000000000000000cC"
+    # Fresh cache entries must be used as is, without any network access.
+    dump_json(
+        tmp_cache / Chain.ARB.value / f"{multisig.address.lower()}.json",
+        multisig.model_dump(),
+    )
+    dump_json(tmp_cache / Chain.ARB.value / "not_found" / not_a_safe.lower(), {})
+    try:
+        assert api.get_multisig_info(multisig.address, Chain.ARB) == multisig
+        assert api.get_multisig_info(not_a_safe, Chain.ARB) is None
+        # Chains without a Safe transaction service are never queried
+        assert api.get_multisig_info(multisig.address, Chain.MET) is None
+    finally:
+        api.cache_dir = og_cache_dir
@@ -1,11 +1,19 @@
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
 from quorum.apis.block_explorers.source_code import SourceCode
-from quorum.apis.price_feeds import ChainLinkAPI
+from quorum.apis.price_feeds import ChainLinkAPI, PriceFeedData, PriceFeedProvider
+from quorum.checks.address_classifier import (
+    AddressClassifier,
+    AddressKind,
+    AddressTable,
+)
 from quorum.checks.price_feed import PriceFeedCheck
 from quorum.utils.chain_enum import Chain
+from quorum.utils.solidity_lexer import iter_address_literals
 
 
 @pytest.mark.parametrize(
@@ -22,67 +30,84 @@ def test_price_feed(source_codes: list[SourceCode], tmp_output_path: Path):
     ]
 
 
-def test_source_code_clean():
-    code = """
-// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
-
-import {IProposalGenericExecutor} from 'aave-helpers/interfaces/IProposalGenericExecutor.sol';
-import {AaveV2Ethereum, AaveV2EthereumAssets, ILendingPoolConfigurator} from 'aave-address-book/AaveV2Ethereum.sol';
-
-/**
- * @title Reserve Factor Updates Mid July
- * @author karpatkey_TokenLogic
- * - Snapshot: https://snapshot.org/#/aave.eth/proposal/0x9cc7906f04f45cebeaa48a05ed281f49da00d89c4dd988a968272fa179f14d06
- * - Discussion: https://governance.aave.com/t/arfc-increase-bridged-usdc-reserve-factor-across-all-deployments/17787
- */
-contract AaveV2Ethereum_ReserveFactorUpdatesMidJuly_20240711 is IProposalGenericExecutor {
-  ILendingPoolConfigurator public constant POOL_CONFIGURATOR =
-    ILendingPoolConfigurator(AaveV2Ethereum.POOL_CONFIGURATOR);
-
-  uint256 public constant DAI_RF = 65_00;
-  uint256 public constant LINK_RF = 70_00;
-  uint256 public constant USDC_RF = 65_00;
-  uint256 public constant USDT_RF = 65_00;
-  uint256 public constant WBTC_RF = 70_00;
-  uint256 public constant WETH_RF = 65_00;
-
-  function execute() external {
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.DAI_UNDERLYING, DAI_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.LINK_UNDERLYING, LINK_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.USDC_UNDERLYING, USDC_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.USDT_UNDERLYING, USDT_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.WBTC_UNDERLYING, WBTC_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.WETH_UNDERLYING, WETH_RF);
-  }
-}
-    """
-    cleaned = PriceFeedCheck.remove_solidity_comments(code)
-    expected = """pragma solidity ^0.8.0;
-
-import {IProposalGenericExecutor} from 'aave-helpers/interfaces/IProposalGenericExecutor.sol';
-import {AaveV2Ethereum, AaveV2EthereumAssets, ILendingPoolConfigurator} from 'aave-address-book/AaveV2Ethereum.sol';
-
-
-contract AaveV2Ethereum_ReserveFactorUpdatesMidJuly_20240711 is IProposalGenericExecutor {
-  ILendingPoolConfigurator public constant POOL_CONFIGURATOR =
-    ILendingPoolConfigurator(AaveV2Ethereum.POOL_CONFIGURATOR);
-
-  uint256 public constant DAI_RF = 65_00;
-  uint256 public constant LINK_RF = 70_00;
-  uint256 public constant USDC_RF = 65_00;
-  uint256 public constant USDT_RF = 65_00;
-  uint256 public constant WBTC_RF = 70_00;
-  uint256 public constant WETH_RF = 65_00;
-
-  function execute() external {
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.DAI_UNDERLYING, DAI_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.LINK_UNDERLYING, LINK_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.USDC_UNDERLYING, USDC_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.USDT_UNDERLYING, USDT_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.WBTC_UNDERLYING, WBTC_RF);
-    POOL_CONFIGURATOR.setReserveFactor(AaveV2EthereumAssets.WETH_UNDERLYING, WETH_RF);
-  }
-}"""
-    # Strip leading/trailing whitespace for accurate comparison
-    assert cleaned.strip() == expected.strip()
+class FakeProvider:
+    def __init__(self, name: PriceFeedProvider, known: set[str], delay: float):
+        self.name = name
+        self.known = known
+        self.delay = delay
+        self.looked_up: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    def get_name(self) -> PriceFeedProvider:
+        return self.name
+
+    def get_price_feed(self, chain: Chain, address: str) -> PriceFeedData | None:
+        with self.lock:
+            self.looked_up.append(address)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if address in self.known:
+            return PriceFeedData(name=self.name.value, contractAddress=address)
+        return None
+
+
+def test_address_classifier_priority():
+    both, token_only = "0x" + "1" * 40, "0x" + "2" * 40
+    addresses = [both, token_only] + [f"0x{i:040x}" for i in range(3, 9)]
+    # The slow price feed provider must still win over the fast token provider
+    price_feeds = FakeProvider(PriceFeedProvider.CHAINLINK, {both}, delay=0.05)
+    tokens = FakeProvider(PriceFeedProvider.COINGECKO, {both, token_only}, delay=0.0)
+    second_tokens = FakeProvider(PriceFeedProvider.COINMARKETCAP, {both}, delay=0.0)
+
+    # Safe has no transaction service on Metis, so nothing is sent over the network
+    classifier = AddressClassifier(
+        Chain.MET, [price_feeds], [tokens, second_tokens], max_workers=2
+    )
+    results = classifier.classify(addresses)
+    # Price feed lookups run two at a time instead of one after another
+    assert price_feeds.peak_in_flight == 2
+
+    assert results[both].kind == AddressKind.PRICE_FEED
+    assert results[both].found_on == PriceFeedProvider.CHAINLINK
+    assert results[token_only].kind == AddressKind.TOKEN
+    assert results[token_only].found_on == PriceFeedProvider.COINGECKO
+    assert all(results[a] is None for a in addresses[2:])
+    # The token hit was known before the last provider was reached, its lookup was cancelled
+    assert token_only not in second_tokens.looked_up
+
+
+def test_address_table_shared_across_payloads():
+    feed, other = "0x" + "a" * 40, "0x" + "b" * 40
+    provider = FakeProvider(PriceFeedProvider.CHAINLINK, {feed}, delay=0.0)
+    table = AddressTable()
+
+    first = AddressClassifier(Chain.MET, [provider], [], table=table)
+    assert first.classify([feed, other])[feed].found_on == PriceFeedProvider.CHAINLINK
+
+    # Another payload of the run only looks up the addresses it is the first to see
+    second = AddressClassifier(Chain.MET, [provider], [], table=table)
+    new, checksummed_feed = "0x" + "c" * 40, "0x" + "A" * 40
+    results = second.classify([checksummed_feed, other, new])
+    assert results[checksummed_feed].kind == AddressKind.PRICE_FEED
+    assert results[checksummed_feed].address == checksummed_feed
+    assert results[other] is None
+    assert sorted(provider.looked_up) == sorted([feed, other, new])
+    assert (table.resolved, table.saved) == (3, 2)
+
+
+def test_iter_address_literals():
+    feed, token = "0x" + "a" * 40, "0x" + "B" * 40
+    lines = [
+        f"address constant FEED = {feed}; // see https://etherscan.io/address/{token}",
+        f'string constant URL = "https://x.org//{token}"; address T = {token};',
+        f"/* {feed}",
+        f"   {feed} */ address x = {feed}; /* {token} */",
+        f"bytes32 constant HASH = {feed}{'0' * 24};",
+        f"// {token}",
+    ]
+    assert list(iter_address_literals(lines)) == [(feed, 1), (token, 2), (feed, 4)]
@@ -1,15 +1,25 @@
+import os
+import time
+from datetime import timedelta
+
 import json5 as json
+import pytest
 
 import quorum.tests.conftest as conftest
 from quorum.apis.price_feeds import (
     ChainLinkAPI,
+    ChronicleAPI,
     CoinGeckoAPI,
     CoinMarketCapAPI,
     PriceFeedData,
+    PriceFeedProvider,
+    PriceFeedProviderBase,
 )
 from quorum.utils.chain_enum import Chain
+from quorum.utils.json_cache import dump_json
 
 EXPECTED_DIR = conftest.EXPECTED_DIR / "test_price_feed_providers"
+CHRONICLE_DIR = conftest.RESOURCES_DIR / "chronicle"
 
 
 def test_chainlink(tmp_cache):
@@ -21,6 +31,168 @@ def test_chainlink(tmp_cache):
         assert api.get_price_feed(Chain.ETH, file.stem) == expected
 
 
+def test_chainlink_directory_index(tmp_cache):
+    api = ChainLinkAPI()
+    og_cache_dir = api.cache_dir
+    api.cache_dir = tmp_cache
+    feed = PriceFeedData(
+        name="Test / USD",
+        address="0x00000000000000000000000000000000000000aA",
+        proxy_address="0x00000000000000000000000000000000000000bB",
+        decimals=8,
+    )
+    # A fresh directory on disk must be used as is, without any network access.
+    dump_json(
+        tmp_cache / "directories" / f"{Chain.LINEA.value}.json",
+        [feed.model_dump(mode="json")],
+    )
+    try:
+        assert (
+            api.get_price_feed(
+                Chain.LINEA, "0x00000000000000000000000000000000000000AA"
+            )
+            == feed
+        )
+        assert (
+            api.get_price_feed(
+                Chain.LINEA, "0x00000000000000000000000000000000000000bb"
+            )
+            == feed
+        )
+    finally:
+        api.cache_dir = og_cache_dir
+
+
+def test_negative_cache(tmp_cache):
+    api = ChainLinkAPI()
+    og_cache_dir = api.cache_dir
+    api.cache_dir = tmp_cache
+    unknown = "0x00000000000000000000000000000000000000dD"
+    dump_json(tmp_cache / "directories" / f"{Chain.LINEA.value}.json", [])
+    try:
+        assert api.get_price_feed(Chain.LINEA, unknown) is None
+        assert (tmp_cache / Chain.LINEA.value / "not_found" / unknown.lower()).exists()
+        # Known misses are answered from memory, whatever the address case
+        assert api.get_price_feed(Chain.LINEA, unknown.lower()) is None
+        assert (Chain.LINEA, unknown.lower()) in api.memory
+    finally:
+        api.cache_dir = og_cache_dir
+
+
+class CountingProvider(PriceFeedProviderBase):
+    def __init__(self, price_feed: PriceFeedData | None):
+        super().__init__()
+        self.price_feed = price_feed
+        self.lookups = 0
+
+    def _get_price_feed_info(self, chain: Chain, address: str) -> PriceFeedData | None:
+        self.lookups += 1
+        return self.price_feed
+
+    def get_name(self) -> PriceFeedProvider:
+        return PriceFeedProvider.CHAINLINK
+
+
+def test_price_feed_cache_case_insensitive(tmp_cache):
+    address = "0x0606Be69451B1C9861Ac6b3626b99093b713E801"
+    provider = CountingProvider(PriceFeedData(name="ETH / USD", address=address))
+    provider.cache_dir = tmp_cache
+
+    assert provider.get_price_feed(Chain.ETH, address).name == "ETH / USD"
+    provider.clear_memory()
+    assert provider.get_price_feed(Chain.ETH, address.lower()).name == "ETH / USD"
+    assert provider.lookups == 1
+    assert [p.name for p in (tmp_cache / Chain.ETH.value).iterdir()] == [
+        f"{address.lower()}.json"
+    ]
+
+
+def test_negative_cache_expires_in_memory(tmp_cache):
+    unknown = "0x00000000000000000000000000000000000000dD"
+    provider = CountingProvider(None)
+    provider.cache_dir = tmp_cache
+
+    assert provider.get_price_feed(Chain.ETH, unknown) is None
+    assert provider.get_price_feed(Chain.ETH, unknown.lower()) is None
+    assert provider.lookups == 1
+
+    # Expired misses are looked up again, even when still in memory
+    provider.negative_cache_ttl = timedelta(0)
+    time.sleep(0.01)
+    assert provider.get_price_feed(Chain.ETH, unknown) is None
+    assert provider.lookups == 2
+
+
+class FakeResponse:
+    def __init__(self, data: object) -> None:
+        self.data = data
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> object:
+        return self.data
+
+
+class ChronicleTransport:
+    """
+    Serves the recorded Chronicle catalog, and records the requested URLs.
+    """
+
+    def __init__(self, api: PriceFeedProviderBase) -> None:
+        with open(CHRONICLE_DIR / "pairs.json") as f:
+            self.responses = {api.PAIRS_URL: json.load(f)}
+        with open(CHRONICLE_DIR / "median_info.json") as f:
+            for chain, infos in json.load(f).items():
+                for pair, info in infos.items():
+                    url = api.PAIR_INFO_URL.format(pair=pair, chain=chain)
+                    self.responses[url] = info
+        self.requested: list[str] = []
+
+    def get(self, url: str, **_) -> FakeResponse:
+        self.requested.append(url)
+        return FakeResponse(self.responses[url])
+
+
+def test_chronicle_catalog(tmp_cache, monkeypatch: pytest.MonkeyPatch):
+    api = ChronicleAPI()
+    transport = ChronicleTransport(api)
+    monkeypatch.setattr(api, "cache_dir", tmp_cache)
+    monkeypatch.setattr(api, "transport", transport)
+    eth_usd = "0x46ef0071b1E2fF6B42d36e5A177EA43Ae5917f4E"
+    arb_eth_usd = "0x5E16CA75000fb2B9d7B1184Fa24fF5D938a345Ef"
+    api.clear_memory()
+    try:
+        # The pairs are listed once, and the info of every pair of a chain is fetched on
+        # its first lookup
+        assert api.get_price_feed(Chain.ETH, eth_usd.lower()).name == (
+            "Chronicle_ETH_USD_3"
+        )
+        assert api.get_price_feed(Chain.ETH, "0x" + "0" * 40) is None
+        assert api.get_price_feed(Chain.ARB, arb_eth_usd).pair == "ETH/USD"
+        assert sorted(transport.requested) == sorted(transport.responses)
+
+        # A fresh catalog on disk is used as is, without listing the pairs again
+        catalog_file = tmp_cache / "catalogs" / f"{Chain.ETH.value}.json"
+        assert catalog_file.exists()
+        api.clear_memory()
+        transport.requested.clear()
+        btc_usd = "0x24C392CDbF32Cf911B258981a66d5541d85269ce"
+        assert api.get_price_feed(Chain.ETH, btc_usd).pair == "BTC/USD"
+        assert transport.requested == []
+
+        # A catalog older than CATALOG_TTL is fetched again
+        stale = time.time() - api.CATALOG_TTL.total_seconds() - 60
+        os.utime(catalog_file, (stale, stale))
+        (tmp_cache / Chain.ETH.value / f"{btc_usd.lower()}.json").unlink()
+        api.clear_memory()
+        assert api.get_price_feed(Chain.ETH, btc_usd).pair == "BTC/USD"
+        assert transport.requested[0] == api.PAIRS_URL
+        assert len(transport.requested) == 3
+    finally:
+        api.clear_memory()
+
+
 # TODO: Find chronicle price feeds...
 # def test_chronicle(tmp_cache):
 #     api = ChronicleAPI()
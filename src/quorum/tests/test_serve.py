@@ -0,0 +1,100 @@
+import argparse
+import json
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Generator
+
+import pytest
+
+import quorum.utils.pretty_printer as pp
+from quorum.apis.block_explorers.ast_cache import ASTCache
+from quorum.apis.multisig.safe_api import SafeAPI
+from quorum.apis.price_feeds import ChainLinkAPI
+from quorum.entry_points.cli_arguments import Argument
+from quorum.entry_points.implementations.serve import QuorumServer
+from quorum.entry_points.quorum_cli import Command
+from quorum.utils.chain_enum import Chain
+
+
+def echo(args: argparse.Namespace) -> None:
+    if args.count < 0:
+        raise ValueError("negative count")
+    for i in range(args.count):
+        pp.pprint(f"{args.name} {i}", pp.Colors.SUCCESS)
+
+
+ECHO_COMMAND = Command(
+    name="echo",
+    help="Print a name several times.",
+    arguments=[
+        Argument(name="--name", type=str, required=True, help="The name."),
+        Argument(name="--count", type=int, required=False, help="Times.", default=1),
+    ],
+    func=echo,
+)
+
+
+@pytest.fixture
+def server_url() -> Generator[str, None, None]:
+    server = QuorumServer(("127.0.0.1", 0), [ECHO_COMMAND])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def request(url: str, body: dict | None = None) -> tuple[int, dict]:
+    data = json.dumps(body).encode() if body is not None else None
+    try:
+        with urllib.request.urlopen(url, data=data, timeout=10) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_serve_jobs(server_url: str):
+    status, health = request(f"{server_url}/health")
+    assert (status, health["commands"], health["jobs_done"]) == (200, ["echo"], 0)
+
+    status, result = request(
+        f"{server_url}/jobs", {"command": "echo", "args": {"name": "aave", "count": 2}}
+    )
+    assert status == 200
+    assert result["status"] == "succeeded"
+    assert result["output"].splitlines() == ["aave 0", "aave 1"]
+
+    status, result = request(
+        f"{server_url}/jobs", {"command": "echo", "args": {"name": "aave", "count": -1}}
+    )
+    assert (status, result["status"]) == (500, "failed")
+    assert "negative count" in result["error"]
+
+    # Malformed jobs are rejected before running
+    for body in ({"command": "unknown"}, {"command": "echo", "args": {"count": "x"}}):
+        status, result = request(f"{server_url}/jobs", body)
+        assert status == 400
+        assert result["error"]
+
+    assert request(f"{server_url}/health")[1]["jobs_done"] == 2
+
+
+def test_serve_clears_caches(server_url: str):
+    # Left by a previous job: an address remembered as unknown, and AST cache lookups
+    key = (Chain.ETH, "0x" + "0" * 40)
+    ChainLinkAPI().memory[key] = None
+    SafeAPI().memory[key] = None
+    ast_cache = ASTCache()
+    og_hits = ast_cache.hits
+    ast_cache.hits = 3
+    try:
+        status, result = request(
+            f"{server_url}/jobs", {"command": "echo", "args": {"name": "aave"}}
+        )
+        assert (status, result["output"]) == (200, "aave 0")
+        assert key not in ChainLinkAPI().memory
+        assert key not in SafeAPI().memory
+        assert ast_cache.hits == 0
+    finally:
+        ast_cache.hits = og_hits
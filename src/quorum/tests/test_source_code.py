@@ -1,8 +1,16 @@
 import json5 as json
 import pytest
+from packaging.version import Version
 
 import quorum.tests.conftest as conftest
-from quorum.apis.block_explorers.source_code import SourceCode
+from quorum.apis.block_explorers.ast_cache import DEFAULT_MAX_SIZE_MB, ASTCache
+from quorum.apis.block_explorers.solc_manager import select_version
+from quorum.apis.block_explorers.source_cache import SourceCache
+from quorum.apis.block_explorers.source_code import (
+    SourceCode,
+    _normalize_batch_ast,
+    parse_source_codes,
+)
 
 EXPECTED_DIR = conftest.EXPECTED_DIR / "test_source_code"
 
@@ -29,3 +37,112 @@ def test_get_functions(source_codes: list[SourceCode]):
         assert (
             s.get_functions() == expected
         ), f"{s.file_name} functions do not match expected."
+
+
+@pytest.mark.parametrize(
+    "source_codes", ["ETH/0xAD6c03BF78A3Ee799b86De5aCE32Bb116eD24637"], indirect=True
+)
+def test_parse_source_codes_batch(source_codes: list[SourceCode]):
+    parse_source_codes(source_codes)
+    for s in source_codes:
+        assert s._is_parsed, f"{s.file_name} was not parsed in the batch."
+        # Batch ASTs are renumbered, ids and source indexes match a single-file parse
+        with open(EXPECTED_DIR / "functions" / f"{s.file_name}.json") as f:
+            assert s.get_functions() == json.load(f)
+        with open(EXPECTED_DIR / "state_variables" / f"{s.file_name}.json") as f:
+            assert s.get_state_variables() == json.load(f)
+
+
+def test_normalize_batch_ast():
+    # The second source of a batch: its ids follow the first source's, its source index is 1
+    batch_ast = {
+        "id": 9,
+        "src": "0:120:1",
+        "nodeType": "SourceUnit",
+        "nodes": [
+            {"id": 6, "src": "0:23:1", "nodeType": "PragmaDirective"},
+            {
+                "id": 8,
+                "src": "25:95:1",
+                "nodeType": "ContractDefinition",
+                "nameLocation": "34:1:1",
+                "baseContracts": [
+                    {"id": 7, "nameLocations": ["46:4:1"], "nodeType": "IdentifierPath"}
+                ],
+                "nodes": [],
+            },
+        ],
+    }
+    ast = _normalize_batch_ast(batch_ast)
+    pragma, contract = ast["nodes"]
+    assert (ast["id"], pragma["id"], contract["id"]) == (4, 1, 3)
+    assert (ast["src"], pragma["src"], contract["src"]) == (
+        "0:120:0",
+        "0:23:0",
+        "25:95:0",
+    )
+    assert contract["nameLocation"] == "34:1:0"
+    assert contract["baseContracts"] == [
+        {"id": 2, "nameLocations": ["46:4:0"], "nodeType": "IdentifierPath"}
+    ]
+    # The batch AST itself is left untouched
+    assert batch_ast["nodes"][0]["src"] == "0:23:1"
+
+
+def test_select_solc_version():
+    versions = [Version("0.8.27"), Version("0.8.19"), Version("0.7.6")]
+    assert select_version(["^0.8.0"], versions) == Version("0.8.27")
+    assert select_version([">=0.7.0 <0.8.20", "^0.8.0"], versions) == Version("0.8.19")
+    assert select_version(["0.7.6"], versions) == Version("0.7.6")
+    assert select_version([], versions) == Version("0.8.27")
+    assert select_version(["^0.6.0"], versions) is None
+
+
+def test_ast_cache(tmp_cache):
+    cache = ASTCache()
+    og_cache_dir, og_max_size = cache.cache_dir, cache.max_size_bytes
+    cache.cache_dir = tmp_cache
+    version = Version("0.8.27")
+    try:
+        assert cache.get("contract A {}", version) is None
+        cache.put("contract A {}", version, {"nodeType": "SourceUnit"}, 1.5)
+        assert cache.get("contract A {}", version) == {"nodeType": "SourceUnit"}
+        assert cache.get("contract A {}", Version("0.8.26")) is None
+
+        # Only the most recently used entry fits in a cache of a single entry's size
+        cache.max_size_bytes = next(tmp_cache.glob("*.json.gz")).stat().st_size
+        cache.put("contract B {}", version, {"nodeType": "SourceUnit"}, 1.5)
+        assert cache.get("contract A {}", version) is None
+        assert cache.get("contract B {}", version) == {"nodeType": "SourceUnit"}
+    finally:
+        cache.cache_dir, cache.max_size_bytes = og_cache_dir, og_max_size
+
+
+def test_ast_cache_max_size(monkeypatch: pytest.MonkeyPatch, capsys):
+    # A fresh instance reads the environment again
+    cache_class = type(ASTCache())
+    monkeypatch.setenv("QUORUM_AST_CACHE_MAX_MB", "1")
+    assert cache_class().max_size_bytes == 1024 * 1024
+
+    monkeypatch.setenv("QUORUM_AST_CACHE_MAX_MB", "1.5GB")
+    assert cache_class().max_size_bytes == DEFAULT_MAX_SIZE_MB * 1024 * 1024
+    assert "QUORUM_AST_CACHE_MAX_MB" in capsys.readouterr().out
+
+
+def test_source_cache(tmp_cache):
+    cache = SourceCache()
+    og_cache_dir = cache.cache_dir
+    cache.cache_dir = tmp_cache
+    try:
+        assert cache.get(1, "0xAbC") is None
+        cache.put(1, "0xAbC", {"Payload.sol": "contract P {}\r\n", "Lib.sol": "lib"})
+        cache.put(10, "0xAbC", {"Other.sol": "lib"})
+        assert cache.get(1, "0xabc") == {
+            "Payload.sol": "contract P {}\r\n",
+            "Lib.sol": "lib",
+        }
+        assert cache.get(10, "0xABC") == {"Other.sol": "lib"}
+        # Identical files are stored once
+        assert len([p for p in (tmp_cache / "blobs").rglob("*") if p.is_file()]) == 2
+    finally:
+        cache.cache_dir = og_cache_dir
@@ -0,0 +1,84 @@
+import json
+import threading
+from pathlib import Path
+
+from quorum.apis.multisig.safe_api import SafeAPI
+from quorum.apis.price_feeds import ChainLinkAPI
+from quorum.utils.chain_enum import Chain
+from quorum.utils.json_cache import dump_json
+from quorum.utils.tracing import Tracer, traced
+
+
+@traced("test")
+def parse(value: int) -> int:
+    return value * 2
+
+
+def load_trace(path: Path) -> list[dict]:
+    return json.loads(path.read_text())["traceEvents"]
+
+
+def test_tracer(tmp_path: Path, capsys):
+    tracer = Tracer()
+    # Disabled by default, nothing is recorded
+    assert parse(1) == 2
+    tracer.write_chrome_trace(tmp_path / "disabled.json")
+    assert not [e for e in load_trace(tmp_path / "disabled.json") if e["cat"] == "test"]
+
+    tracer.enable()
+    try:
+        threads = [threading.Thread(target=parse, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with tracer.span("test", "block", payload="0x1"):
+            parse(4)
+        tracer.count_cache("test", hit=True)
+        tracer.count_cache("test", hit=False)
+    finally:
+        tracer.enabled = False
+
+    trace_file = tmp_path / "trace.json"
+    tracer.write_chrome_trace(trace_file)
+    events = load_trace(trace_file)
+    spans = [e for e in events if e.get("cat") == "test"]
+    assert sorted(e["name"] for e in spans) == ["block"] + ["parse"] * 4
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in spans)
+    block = next(e for e in spans if e["name"] == "block")
+    assert block["args"] == {"payload": "0x1"}
+
+    # Each thread is named in the trace metadata
+    thread_names = {e["tid"] for e in events if e["ph"] == "M"}
+    assert {e["tid"] for e in spans} <= thread_names
+
+    tracer.report()
+    report = capsys.readouterr().out
+    assert "parse" in report
+    assert "test cache: 1/2 hits (50%)" in report
+
+
+def test_provider_cache_stats(tmp_cache: Path, capsys):
+    tracer = Tracer()
+    address = "0x" + "1" * 40
+    apis = [SafeAPI(), ChainLinkAPI()]
+    og_cache_dirs = [api.cache_dir for api in apis]
+    for api in apis:
+        api.cache_dir = tmp_cache / type(api).__name__
+        # Remembered as neither a Safe nor a price feed
+        dump_json(api.cache_dir / Chain.ETH.value / "not_found" / address, {})
+
+    tracer.enable()
+    try:
+        for _ in range(2):
+            # From the disk cache, then from memory
+            assert SafeAPI().get_multisig_info(address, Chain.ETH) is None
+            assert ChainLinkAPI().get_price_feed(Chain.ETH, address) is None
+    finally:
+        tracer.enabled = False
+        for api, og_cache_dir in zip(apis, og_cache_dirs, strict=True):
+            api.cache_dir = og_cache_dir
+            api.memory.pop((Chain.ETH, address), None)
+
+    tracer.report()
+    assert "provider cache: 4/4 hits (100%)" in capsys.readouterr().out
@@ -0,0 +1,233 @@
+import argparse
+from pathlib import Path
+
+import pytest
+import requests
+
+import quorum.entry_points.implementations.watch as watch
+from quorum.apis.governance.aave_governance import (
+    AaveGovernanceAPI,
+    ChainNotFoundException,
+    ProposalNotFoundException,
+)
+from quorum.apis.governance.data_models import PayloadAddresses
+from quorum.checks.results import PayloadResult, PayloadStatus
+from quorum.entry_points.implementations.watch import ProposalWatcher
+from quorum.utils.chain_enum import Chain
+from quorum.utils.concurrency import DEFAULT_MAX_PER_HOST
+
+CONTROLLER = "0xdAbad81aF85554E9ae636395611C58F7eC1aAEc5"
+EXECUTED = 4
+
+
+class FakeGovernance(AaveGovernanceAPI):
+    def __init__(self, proposals_count: int) -> None:
+        super().__init__()
+        self.proposals = {
+            i: self.proposal([i], EXECUTED) for i in range(proposals_count)
+        }
+        self.requested: list[int] = []
+        # Payloads not in the governance cache yet
+        self.missing_payloads: set[int] = set()
+
+    @staticmethod
+    def proposal(payload_ids: list[int], state: int = 1) -> dict:
+        return {
+            "proposal": {
+                "state": state,
+                "payloads": [
+                    {"chain": "1", "payloadsController": CONTROLLER, "payloadId": i}
+                    for i in payload_ids
+                ],
+                "votingPortal": None,
+                "ipfsHash": None,
+                "accessLevel": 1,
+            }
+        }
+
+    def get_raw_proposal_data(self, proposal_id: int) -> dict:
+        self.requested.append(proposal_id)
+        if proposal_id not in self.proposals:
+            raise ProposalNotFoundException(proposal_id, "Aave")
+        return self.proposals[proposal_id]
+
+    def get_payload_addresses(
+        self, chain_id: str, controller: str, payload_id: int
+    ) -> list[str]:
+        if payload_id in self.missing_payloads:
+            raise ChainNotFoundException(int(chain_id), "Aave")
+        return [f"0x{payload_id:040x}"]
+
+
+def result(
+    address: str, status: PayloadStatus = PayloadStatus.CHECKED
+) -> PayloadResult:
+    return PayloadResult(
+        customer="aave", chain=Chain.ETH, payload=address, status=status
+    )
+
+
+def test_latest_proposal_id():
+    api = FakeGovernance(300)
+    assert api.get_latest_proposal_id() == 299
+    assert len(api.requested) < 25
+
+    api.requested.clear()
+    assert api.get_latest_proposal_id(299) == 299
+    assert api.requested == [300]
+    assert FakeGovernance(0).get_latest_proposal_id() == -1
+
+
+def test_watch_checks_unseen_payloads(tmp_cache: Path, monkeypatch: pytest.MonkeyPatch):
+    checked: list[str] = []
+
+    def fake_check_payloads(
+        payload_addresses: list[PayloadAddresses], **_
+    ) -> list[PayloadResult]:
+        assert payload_addresses[0].chain == Chain.ETH
+        checked.extend(payload_addresses[0].addresses)
+        return [result(address) for address in payload_addresses[0].addresses]
+
+    monkeypatch.setattr(watch, "check_payloads", fake_check_payloads)
+    monkeypatch.setattr(watch, "load_customer_config", lambda _: ([], []))
+
+    api = FakeGovernance(10)
+    state_path = tmp_cache / "aave.json"
+    watcher = ProposalWatcher("aave", api, state_path)
+    # Only proposals created from now on are checked
+    watcher.load_state()
+    assert watcher.poll() == 0
+
+    api.proposals[10] = api.proposal([10])
+    api.proposals[11] = api.proposal([11, 12])
+    assert watcher.poll() == 3
+    assert watcher.state.open_proposals == [10, 11]
+
+    # A restart resumes from the saved state: only the new payload of proposal 10 is checked
+    api.proposals[10] = api.proposal([10, 13], EXECUTED)
+    watcher = ProposalWatcher("aave", api, state_path)
+    watcher.load_state()
+    assert watcher.poll() == 1
+    assert watcher.state.open_proposals == [11]
+    assert checked == [f"0x{i:040x}" for i in (10, 11, 12, 13)]
+
+
+def test_watch_retries_unchecked_payloads(
+    tmp_cache: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # The first attempt finds the payload not verified yet, the second one checks it
+    statuses = [PayloadStatus.NOT_VERIFIED, PayloadStatus.CHECKED]
+
+    def fake_check_payloads(
+        payload_addresses: list[PayloadAddresses], **_
+    ) -> list[PayloadResult]:
+        return [result(payload_addresses[0].addresses[0], statuses.pop(0))]
+
+    monkeypatch.setattr(watch, "check_payloads", fake_check_payloads)
+    monkeypatch.setattr(watch, "load_customer_config", lambda _: ([], []))
+
+    api = FakeGovernance(1)
+    watcher = ProposalWatcher("aave", api, tmp_cache / "aave.json")
+    watcher.load_state(from_id=1)
+    api.proposals[1] = api.proposal([1], EXECUTED)
+    assert watcher.poll() == 0
+    # Executed, but kept open until its payload is checked
+    assert watcher.state.open_proposals == [1]
+    assert watcher.state.checked_payloads == []
+
+    assert watcher.poll() == 1
+    assert watcher.state.open_proposals == []
+    assert not statuses
+
+
+def test_watch_keeps_proposals_with_missing_payloads(
+    tmp_cache: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        watch,
+        "check_payloads",
+        lambda payload_addresses, **_: [result(payload_addresses[0].addresses[0])],
+    )
+    monkeypatch.setattr(watch, "load_customer_config", lambda _: ([], []))
+
+    api = FakeGovernance(1)
+    watcher = ProposalWatcher("aave", api, tmp_cache / "aave.json")
+    watcher.load_state(from_id=1)
+    api.proposals[1] = api.proposal([1, 2], EXECUTED)
+    api.missing_payloads.add(2)
+    assert watcher.poll() == 1
+    assert watcher.state.open_proposals == [1]
+
+    api.missing_payloads.clear()
+    assert watcher.poll() == 1
+    assert watcher.state.open_proposals == []
+
+
+def test_watch_abandons_final_proposals(
+    tmp_cache: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        watch,
+        "check_payloads",
+        lambda payload_addresses, **_: [
+            result(payload_addresses[0].addresses[0], PayloadStatus.NOT_VERIFIED)
+        ],
+    )
+    monkeypatch.setattr(watch, "load_customer_config", lambda _: ([], []))
+
+    api = FakeGovernance(1)
+    state_path = tmp_cache / "aave.json"
+    watcher = ProposalWatcher("aave", api, state_path)
+    watcher.max_final_attempts = 2
+    watcher.load_state(from_id=1)
+    api.proposals[1] = api.proposal([1], EXECUTED)
+    assert watcher.poll() == 0
+    assert watcher.state.open_proposals == [1]
+    assert watcher.state.final_attempts == {1: 1}
+
+    # The attempts survive a restart
+    watcher = ProposalWatcher("aave", api, state_path)
+    watcher.max_final_attempts = 2
+    watcher.load_state()
+    assert watcher.poll() == 0
+    assert watcher.state.open_proposals == []
+    assert watcher.state.final_attempts == {}
+    assert watcher.state.abandoned_proposals == {
+        1: "not checked after 2 polls, payload 1: not_verified"
+    }
+
+
+@pytest.mark.usefixtures("tmp_output_path")
+def test_run_watch_survives_failed_polls(monkeypatch: pytest.MonkeyPatch):
+    polls: list[str] = []
+
+    def poll(self: ProposalWatcher) -> int:
+        if not polls:
+            polls.append("failed")
+            raise requests.ConnectionError("connection reset")
+        polls.append("done")
+        return 0
+
+    def sleep(_: float) -> None:
+        if len(polls) == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch, "CUSTOMER_TO_API", {"aave": FakeGovernance(1)})
+    monkeypatch.setattr(ProposalWatcher, "poll", poll)
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+    args = argparse.Namespace(
+        protocol_name="aave",
+        from_id=1,
+        interval=0,
+        once=False,
+        max_workers=1,
+        max_per_host=DEFAULT_MAX_PER_HOST,
+    )
+    watch.run_watch(args)
+    assert polls == ["failed", "done"]
+
+    # A single poll reports its failure
+    polls.clear()
+    args.once = True
+    with pytest.raises(requests.ConnectionError):
+        watch.run_watch(args)
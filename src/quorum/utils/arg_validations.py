@@ -31,6 +31,28 @@ def validate_address(address: str) -> str:
     return address
 
 
+def validate_positive_int(value: str) -> int:
+    """
+    Validate that the value is a positive integer.
+
+    Args:
+        value (str): The raw command line value.
+
+    Returns:
+        int: The parsed integer.
+
+    Raises:
+        ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise ArgumentTypeError(f"{value} is not a valid integer.") from e
+    if number < 1:
+        raise ArgumentTypeError(f"{value} must be a positive integer.")
+    return number
+
+
 def validate_path(path: Path) -> Path:
     if not path.exists():
         raise ArgumentTypeError(f"Could not find path at {path}.")
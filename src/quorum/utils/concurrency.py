@@ -0,0 +1,94 @@
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+from urllib.parse import urlparse
+
+from quorum.utils.singleton import singleton
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_PER_HOST = 2
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class HostSlots:
+    """
+    HostSlots caps the number of concurrent requests sent to a single host.
+
+    Attributes:
+        max_per_host (int): The maximum number of in-flight requests per host.
+    """
+
+    def __init__(self, max_per_host: int):
+        self.max_per_host = max_per_host
+        self.__lock = threading.Lock()
+        self.__semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    def set_max_per_host(self, max_per_host: int) -> None:
+        """
+        Change the per-host cap. Requests already in flight keep their current slot.
+
+        Args:
+            max_per_host (int): The maximum number of in-flight requests per host.
+
+        Raises:
+            ValueError: If max_per_host is not a positive number.
+        """
+        if max_per_host < 1:
+            raise ValueError(f"max_per_host must be positive, got {max_per_host}.")
+        with self.__lock:
+            self.max_per_host = max_per_host
+            self.__semaphores.clear()
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """
+        Hold one of the host's slots for the duration of the context.
+
+        Args:
+            url (str): The URL about to be requested.
+        """
+        host = urlparse(url).netloc
+        with self.__lock:
+            if host not in self.__semaphores:
+                self.__semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            semaphore = self.__semaphores[host]
+        with semaphore:
+            yield
+
+
+@singleton
+class HostLimiter(HostSlots):
+    """
+    HostLimiter caps the number of concurrent requests sent to a single block explorer host
+    (--max-per-host). It is shared process-wide so that the payloads fetched concurrently
+    respect the same cap.
+    """
+
+    def __init__(self):
+        super().__init__(DEFAULT_MAX_PER_HOST)
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS
+) -> list[R]:
+    """
+    Apply func to every item using a bounded thread pool.
+
+    Args:
+        func (Callable[[T], R]): The function to apply.
+        items (Iterable[T]): The items to process.
+        max_workers (int): The maximum number of items processed at the same time.
+
+    Returns:
+        list[R]: The results, in the same order as the given items.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,58 @@
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from quorum.utils.concurrency import HostSlots
+from quorum.utils.singleton import singleton
+
+# Number of keep-alive connections kept per host, large enough for every worker thread.
+DEFAULT_POOL_SIZE = 32
+DEFAULT_TIMEOUT = 30
+
+
+@singleton
+class HTTPTransport:
+    """
+    HTTPTransport is the HTTP layer shared by all API clients.
+
+    It owns a single pooled session, so connections to a host are kept alive and reused by
+    every client and thread. The requests in flight to a host are capped by the size of the
+    connection pool.
+
+    Attributes:
+        host_slots (HostSlots): The per-host cap of the requests sent through the transport.
+    """
+
+    def __init__(self):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.host_slots = HostSlots(DEFAULT_POOL_SIZE)
+
+    def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> requests.Response:
+        """
+        Send a GET request, waiting for a free slot of the URL's host.
+
+        Args:
+            url (str): The URL to request.
+            params (dict[str, Any] | None): Query parameters.
+            headers (dict[str, str] | None): Additional request headers.
+            timeout (float): Seconds to wait for the server before giving up.
+
+        Returns:
+            requests.Response: The response.
+        """
+        with self.host_slots.limit(url):
+            return self.session.get(
+                url, params=params, headers=headers, timeout=timeout
+            )
@@ -0,0 +1,48 @@
+import json
+import os
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+
+def load_json(path: Path, ttl: timedelta | None = None) -> Any | None:
+    """
+    Load a JSON cache file if it exists and is still fresh.
+
+    Args:
+        path (Path): The cache file.
+        ttl (timedelta | None): How long the file stays valid after it was written.
+            None means the file never expires.
+
+    Returns:
+        Any | None: The decoded content, or None if the file is missing, expired or corrupt.
+    """
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl.total_seconds():
+            return None
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def dump_json(path: Path, data: Any) -> None:
+    """
+    Atomically write data to a JSON cache file, creating its parent directories.
+    Concurrent readers see either the previous content or the new one, never a partial file.
+
+    Args:
+        path (Path): The cache file.
+        data (Any): JSON serializable data.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(data, file, indent=4)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
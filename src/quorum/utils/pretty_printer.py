@@ -1,7 +1,16 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import StrEnum
+from typing import TextIO
 
 SEPARATOR_LINE = "\n" + "-" * 110 + "\n"
 
+# Per-thread output buffer, set while a thread's output is being captured.
+_thread_state = threading.local()
+# Where messages are printed, None for the standard output.
+_output_stream: TextIO | None = None
+
 
 class Heading(StrEnum):
     HEADING_1 = "="
@@ -21,4 +30,52 @@ def pprint(message: object, status: Colors, heading: Heading | None = None):
     s = status + str(message) + Colors.RESET
     if heading:
         s += "\n" + heading * len(message) + "\n"
-    print(s)
+    _emit(s)
+
+
+def _emit(s: str) -> None:
+    buffer = getattr(_thread_state, "buffer", None)
+    if buffer is None:
+        print(s, file=_output_stream)
+    else:
+        buffer.append(s)
+
+
+def set_output_stream(stream: TextIO | None) -> None:
+    """
+    Print messages to the given stream, e.g. the standard error when the standard output
+    carries machine readable results.
+
+    Args:
+        stream (TextIO | None): The stream to print to, None for the standard output.
+    """
+    global _output_stream
+    _output_stream = stream
+
+
+@contextmanager
+def capture_output(buffer: list[str]) -> Iterator[list[str]]:
+    """
+    Redirect the messages printed by the current thread into the given buffer.
+
+    Args:
+        buffer (list[str]): The list collecting the formatted messages.
+    """
+    previous = getattr(_thread_state, "buffer", None)
+    _thread_state.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _thread_state.buffer = previous
+
+
+def flush_output(buffer: list[str]) -> None:
+    """
+    Print the messages collected by capture_output and empty the buffer.
+
+    Args:
+        buffer (list[str]): The list of formatted messages to print.
+    """
+    for s in buffer:
+        _emit(s)
+    buffer.clear()
@@ -1,4 +1,6 @@
+import math
 import os
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +12,8 @@ from quorum.utils.arg_validations import make_dict_lowercase
 from quorum.utils.load_env import load_env_variables
 from quorum.utils.singleton import singleton
 
+DEFAULT_REPO_TTL_MINUTES = 10
+
 
 @singleton
 class QuorumConfiguration:
@@ -25,6 +29,11 @@ class QuorumConfiguration:
         self.__ground_truth_path: Path | None = None
         self.__anthropic_api_key: str | None = None
         self.__anthropic_model: str | None = None
+        self.__solc_path: Path | None = None
+        self.__offline = False
+        self.__refresh = False
+        self.__repo_ttl = timedelta(minutes=DEFAULT_REPO_TTL_MINUTES)
+        self.__governance_mirror = False
 
         # This dictionary will cache customer configs after loading them from ground_truth.json
         self.__customer_configs: dict[str, Any] = {}
@@ -70,8 +79,39 @@ class QuorumConfiguration:
                 "ANTROPIC_MODEL", "claude-sonnet-4-20250514"
             )
 
+            # 5. Solidity compilers cache and offline mode
+            solc_path = os.getenv("QUORUM_SOLC_PATH")
+            self.__solc_path = Path(solc_path).absolute() if solc_path else None
+            self.__offline = os.getenv("QUORUM_OFFLINE", "").lower() in ("1", "true")
+
+            # 6. How long updated repositories are considered fresh
+            self.__repo_ttl = timedelta(minutes=self.__read_repo_ttl_minutes())
+
+            # 7. Read the governance cache from a local clone
+            self.__governance_mirror = os.getenv(
+                "QUORUM_GOVERNANCE_MIRROR", ""
+            ).lower() in ("1", "true")
+
             self.__env_loaded = True
 
+    @staticmethod
+    def __read_repo_ttl_minutes() -> float:
+        value = os.getenv("QUORUM_REPO_TTL_MINUTES")
+        if value is None:
+            return DEFAULT_REPO_TTL_MINUTES
+        try:
+            minutes = float(value)
+        except ValueError:
+            minutes = math.nan
+        if not math.isfinite(minutes) or minutes < 0:
+            pp.pprint(
+                f"Warning: QUORUM_REPO_TTL_MINUTES={value!r} is not a non-negative number of "
+                f"minutes, using the default of {DEFAULT_REPO_TTL_MINUTES} minutes.",
+                pp.Colors.WARNING,
+            )
+            return DEFAULT_REPO_TTL_MINUTES
+        return minutes
+
     @property
     def main_path(self) -> Path:
         """
@@ -104,6 +144,61 @@ class QuorumConfiguration:
         """
         return self.__anthropic_model
 
+    @property
+    def solc_path(self) -> Path | None:
+        """
+        Returns the directory holding the installed solc compilers (QUORUM_SOLC_PATH),
+        or None to use the default solcx directory.
+        """
+        return self.__solc_path
+
+    @property
+    def offline(self) -> bool:
+        """
+        Returns whether Quorum must avoid downloads, i.e. solc compilers and repository
+        updates (QUORUM_OFFLINE or --offline).
+        """
+        return self.__offline
+
+    @offline.setter
+    def offline(self, value: bool) -> None:
+        self.__offline = value
+
+    @property
+    def repo_ttl(self) -> timedelta:
+        """
+        Returns how long a repository is not updated again after it was fetched
+        (QUORUM_REPO_TTL_MINUTES).
+        """
+        return self.__repo_ttl
+
+    @repo_ttl.setter
+    def repo_ttl(self, value: timedelta) -> None:
+        self.__repo_ttl = value
+
+    @property
+    def governance_mirror(self) -> bool:
+        """
+        Returns whether the governance cache is read from a local clone of its repository
+        (QUORUM_GOVERNANCE_MIRROR).
+        """
+        return self.__governance_mirror
+
+    @governance_mirror.setter
+    def governance_mirror(self, value: bool) -> None:
+        self.__governance_mirror = value
+
+    @property
+    def refresh(self) -> bool:
+        """
+        Returns whether persistent caches must be bypassed and refilled (--refresh).
+        """
+        return self.__refresh
+
+    @refresh.setter
+    def refresh(self, value: bool) -> None:
+        self.__refresh = value
+
     def load_customer_config(self, customer: str) -> dict[str, Any]:
         """
         Load and validate the configuration data for a given customer.
@@ -159,6 +254,12 @@ class QuorumConfiguration:
         self.__customer_configs[customer] = customer_config
         return customer_config
 
+    def clear_customer_configs(self) -> None:
+        """
+        Forget the loaded customer configurations, so that ground_truth.json is read again.
+        """
+        self.__customer_configs.clear()
+
     def _replace_providers_with_objects(
         self, price_feed_providers: list, token_providers: list
     ) -> None:
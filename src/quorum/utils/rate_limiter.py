@@ -0,0 +1,146 @@
+import math
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import quorum.utils.pretty_printer as pp
+from quorum.utils.singleton import singleton
+
+# Etherscan's free tier allows 5 calls per second, stay slightly below it by default.
+DEFAULT_RATE = 4.0
+MIN_RATE = 0.5
+ADDITIVE_INCREASE = 0.1
+MULTIPLICATIVE_DECREASE = 0.5
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised when an API keeps answering with rate limit errors after all retries.
+    """
+
+
+class TokenBucket:
+    """
+    A blocking token bucket whose rate adapts to the server (AIMD).
+
+    The rate is increased additively after each successful request, up to the configured
+    rate, and halved every time the server reports that the rate limit was hit.
+
+    Attributes:
+        max_rate (float): The configured rate, in requests per second.
+        rate (float): The current rate, in requests per second.
+    """
+
+    def __init__(self, max_rate: float):
+        self.max_rate = max_rate
+        self.rate = max_rate
+        # A capacity of one token spaces requests evenly instead of allowing bursts
+        self.__tokens = 1.0
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be sent.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(1.0, self.__tokens + (now - self.__updated) * self.rate)
+            self.__updated = now
+            # Reserve the token even if it is not available yet, callers are served in order
+            self.__tokens -= 1.0
+            wait = -self.__tokens / self.rate if self.__tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """
+        Additively increase the rate after a successful request.
+        """
+        with self.__lock:
+            self.rate = min(self.max_rate, self.rate + ADDITIVE_INCREASE)
+
+    def on_rate_limited(self) -> None:
+        """
+        Multiplicatively decrease the rate after the server reported a rate limit error,
+        and wait a full period before the next request.
+        """
+        with self.__lock:
+            self.rate = max(MIN_RATE, self.rate * MULTIPLICATIVE_DECREASE)
+            self.__tokens = min(self.__tokens, 0.0)
+
+
+@singleton
+class RateLimiter:
+    """
+    RateLimiter shares token buckets process-wide, keyed by API key and host, so that every
+    client sending requests with the same key to the same host respects a single budget.
+
+    The rate of new buckets is read from QUORUM_EXPLORER_RATE_LIMIT (requests per second),
+    at least MIN_RATE, and defaults to DEFAULT_RATE.
+    """
+
+    def __init__(self):
+        self.default_rate = self.__read_rate()
+        self.__buckets: dict[tuple[str, str], TokenBucket] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __read_rate() -> float:
+        value = os.getenv("QUORUM_EXPLORER_RATE_LIMIT")
+        if value is None:
+            return DEFAULT_RATE
+        try:
+            rate = float(value)
+        except ValueError:
+            rate = math.nan
+        if math.isnan(rate):
+            pp.pprint(
+                f"Warning: QUORUM_EXPLORER_RATE_LIMIT={value!r} is not a number of requests "
+                f"per second, using the default of {DEFAULT_RATE}.",
+                pp.Colors.WARNING,
+            )
+            return DEFAULT_RATE
+        if rate < MIN_RATE:
+            pp.pprint(
+                f"Warning: QUORUM_EXPLORER_RATE_LIMIT={value!r} is below the minimum of "
+                f"{MIN_RATE} requests per second, using the minimum.",
+                pp.Colors.WARNING,
+            )
+            return MIN_RATE
+        return rate
+
+    def bucket(self, api_key: str, url: str) -> TokenBucket:
+        """
+        Get the token bucket shared by all requests sent with an API key to a URL's host.
+
+        Args:
+            api_key (str): The API key used by the request (empty if none).
+            url (str): The URL about to be requested.
+
+        Returns:
+            TokenBucket: The shared bucket.
+        """
+        key = (api_key, urlparse(url).netloc)
+        with self.__lock:
+            if key not in self.__buckets:
+                self.__buckets[key] = TokenBucket(self.default_rate)
+            return self.__buckets[key]
+
+
+def is_rate_limit_response(data: dict) -> bool:
+    """
+    Check whether an Etherscan-like API response reports a rate limit error, which these APIs
+    send with a successful HTTP status (e.g. "Max calls per sec rate limit reached (5/sec)").
+
+    Args:
+        data (dict): The decoded JSON response.
+
+    Returns:
+        bool: True if the response is a rate limit error.
+    """
+    if not isinstance(data, dict):
+        return False
+    result = data.get("result")
+    return isinstance(result, str) and "rate limit" in result.lower()
@@ -1,9 +1,15 @@
+import threading
+
+
 def singleton(cls):
     instances = {}
+    lock = threading.Lock()
 
     def wrapper(*args, **kwargs):
         if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
+            with lock:
+                if cls not in instances:
+                    instances[cls] = cls(*args, **kwargs)
         return instances[cls]
 
     return wrapper
@@ -0,0 +1,81 @@
+import re
+from collections.abc import Iterable, Iterator
+
+# Tokens that start a comment or a string literal
+_DELIMITER_PATTERN = re.compile(r"""//|/\*|["']""")
+_STRING_PATTERNS = {
+    '"': re.compile(r'"(?:[^"\\]|\\.)*"?'),
+    "'": re.compile(r"'(?:[^'\\]|\\.)*'?"),
+}
+# 20-byte hex literals not followed by more hex digits. The preceding character is checked
+# separately, a lookbehind would disable the fast search for the literal "0x" prefix.
+_ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}(?![\w$])")
+_ADDRESS_LENGTH = 42
+
+
+def _iter_code_addresses(line: str, start: int, end: int) -> Iterator[str]:
+    """
+    Find the address literals of a span of code, i.e. without comments or strings.
+    """
+    if end - start < _ADDRESS_LENGTH:
+        return
+    for match in _ADDRESS_PATTERN.finditer(line, start, end):
+        begin = match.start()
+        if begin == start or not (line[begin - 1].isalnum() or line[begin - 1] in "_$"):
+            yield match.group()
+
+
+def iter_address_literals(lines: Iterable[str]) -> Iterator[tuple[str, int]]:
+    """
+    Find the address literals of Solidity source code in a single pass over its lines.
+
+    Comments and string literals are skipped, including comment markers inside strings
+    (e.g. URLs) and string quotes inside comments. Hex literals are only reported when they
+    are exactly 20 bytes long, so longer constants such as bytes32 values are not mistaken
+    for addresses.
+
+    Args:
+        lines (Iterable[str]): The lines of the source code.
+
+    Yields:
+        tuple[str, int]: Each address literal, with its line number (starting at 1).
+    """
+    in_block_comment = False
+    for line_number, line in enumerate(lines, 1):
+        pos = 0
+        if in_block_comment:
+            end = line.find("*/")
+            if end == -1:
+                continue
+            in_block_comment = False
+            pos = end + 2
+        elif "0x" not in line and "/*" not in line:
+            # Strings end on their line, so only a block comment opening matters here
+            continue
+
+        if "/" not in line and '"' not in line and "'" not in line:
+            # Plain code, the most common case
+            for address in _iter_code_addresses(line, pos, len(line)):
+                yield address, line_number
+            continue
+
+        # Alternate between code, searched for addresses, and comments or strings, skipped
+        while True:
+            delimiter = _DELIMITER_PATTERN.search(line, pos)
+            code_end = delimiter.start() if delimiter else len(line)
+            for address in _iter_code_addresses(line, pos, code_end):
+                yield address, line_number
+            if delimiter is None:
+                break
+
+            token = delimiter.group()
+            if token == "//":
+                break
+            if token == "/*":
+                end = line.find("*/", delimiter.end())
+                if end == -1:
+                    in_block_comment = True
+                    break
+                pos = end + 2
+            else:
+                pos = _STRING_PATTERNS[token].match(line, code_end).end()
@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+import quorum.utils.pretty_printer as pp
+from quorum.utils.singleton import singleton
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@singleton
+class Tracer:
+    """
+    Tracer records timed spans around the stages of a run (explorer requests, solc parsing,
+    checks, provider lookups, LLM calls...) and the hit ratio of their caches.
+
+    Tracing is disabled by default and costs a single attribute check per span until enabled,
+    e.g. by the --profile command line flag. Spans are exported in the Chrome trace event
+    format, which can be opened in Perfetto (ui.perfetto.dev) or chrome://tracing.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.__origin = time.perf_counter()
+        self.__events: list[dict[str, Any]] = []
+        self.__thread_names: dict[int, str] = {}
+        # Hits and misses of each stage's cache
+        self.__cache_stats: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        self.__lock = threading.Lock()
+
+    def enable(self) -> None:
+        """
+        Start recording spans, timestamps are relative to this call.
+        """
+        self.__origin = time.perf_counter()
+        self.enabled = True
+
+    def span(
+        self, category: str, name: str, **args: Any
+    ) -> AbstractContextManager[None]:
+        """
+        Time the enclosed block.
+
+        Args:
+            category (str): The stage of the span, e.g. "explorer" or "solc".
+            name (str): The name of the span, e.g. "ChainAPI.get_source_code".
+            **args: Details shown with the span in the trace viewer.
+
+        Returns:
+            AbstractContextManager[None]: The context manager timing the block.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self.__span(category, name, args)
+
+    def count_cache(self, category: str, hit: bool) -> None:
+        """
+        Count a cache lookup of a stage.
+
+        Args:
+            category (str): The stage owning the cache.
+            hit (bool): Whether the lookup was a hit.
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            self.__cache_stats[category][0 if hit else 1] += 1
+
+    @contextmanager
+    def __span(self, category: str, name: str, args: dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            thread = threading.current_thread()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.__origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": thread.ident,
+                "args": {key: str(value) for key, value in args.items()},
+            }
+            with self.__lock:
+                self.__events.append(event)
+                self.__thread_names.setdefault(thread.ident, thread.name)
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """
+        Write the recorded spans as a Chrome trace file.
+
+        Args:
+            path (Path): The trace file.
+        """
+        with self.__lock:
+            thread_names = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self.__thread_names.items()
+            ]
+            trace = {"traceEvents": thread_names + self.__events}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(trace, file)
+
+    def report(self) -> None:
+        """
+        Print the wall time and call count of each span, and the hit ratio of each cache.
+        Nested spans are included in the time of their parents.
+        """
+        stats: dict[tuple[str, str], list[float]] = defaultdict(list)
+        with self.__lock:
+            for event in self.__events:
+                stats[(event["cat"], event["name"])].append(event["dur"] / 1e6)
+            cache_stats = dict(self.__cache_stats)
+        if not stats and not cache_stats:
+            return
+
+        lines = []
+        if stats:
+            lines.append(
+                f"{'Stage':<12} {'Span':<48} {'Calls':>6} {'Total (s)':>10} "
+                f"{'Mean (ms)':>10} {'Max (ms)':>10}"
+            )
+        rows = sorted(stats.items(), key=lambda item: sum(item[1]), reverse=True)
+        for (category, name), durations in rows:
+            total = sum(durations)
+            lines.append(
+                f"{category:<12} {name[:48]:<48} {len(durations):>6} {total:>10.2f} "
+                f"{total / len(durations) * 1000:>10.1f} {max(durations) * 1000:>10.1f}"
+            )
+        for category, (hits, misses) in sorted(cache_stats.items()):
+            lines.append(
+                f"{category} cache: {hits}/{hits + misses} hits "
+                f"({hits / (hits + misses):.0%})"
+            )
+        pp.pprint("Profile", pp.Colors.INFO, pp.Heading.HEADING_2)
+        pp.pprint("\n".join(lines), pp.Colors.INFO)
+
+
+def traced(
+    category: str, name: str | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorate a function to record a span around each of its calls.
+
+    Args:
+        category (str): The stage of the span.
+        name (str | None): The name of the span, the qualified name of the function by default.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with Tracer().span(category, span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator